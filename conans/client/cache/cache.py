@@ -7,6 +7,8 @@ from jinja2 import Environment, select_autoescape, FileSystemLoader, ChoiceLoade
 
 from conans.assets.templates import dict_loader
 from conans.client.cache.editable import EditablePackages
+from conans.client.cache.object_store import ObjectStore
+from conans.client.cache.remote_not_found import RemoteNotFoundCache
 from conans.client.cache.remote_registry import RemoteRegistry
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, \
     get_default_settings_yml
@@ -27,6 +29,10 @@ from conans.util.locks import Lock
 
 CONAN_CONF = 'conan.conf'
 CONAN_SETTINGS = "settings.yml"
+SETTINGS_CACHE = ".settings.json"  # The parsed settings.yml, see Settings.loads()
+BYTECODE_FOLDER = ".bytecode"  # The compiled recipes, see loader._compile_conanfile()
+OBJECTS_FOLDER = ".objects"  # The package files store of storage.package_dedup, in the store
+REMOTE_NOT_FOUND = ".remote_not_found.json"  # See RemoteNotFoundCache
 LOCALDB = ".conan.db"
 REMOTES = "remotes.json"
 PROFILES_FOLDER = "profiles"
@@ -78,6 +84,7 @@ class ClientCache(object):
         self._no_lock = None
         self._config = None
         self._new_config = None
+        self._remote_not_found = None
         self.editable_packages = EditablePackages(self.cache_folder)
         # paths
         self._store_folder = self.config.storage_path or os.path.join(self.cache_folder, "data")
@@ -92,6 +99,23 @@ class ClientCache(object):
     def store(self):
         return self._store_folder
 
+    @property
+    def object_store(self):
+        """ The store of the package files if storage.package_dedup is enabled, else None
+        """
+        if self.config.package_dedup:
+            return ObjectStore(os.path.join(self._store_folder, OBJECTS_FOLDER))
+
+    @property
+    def remote_not_found(self):
+        """ The recipes and binaries recently not found in the remotes, shared by all the lookups
+        of the command, see general.remote_not_found_ttl
+        """
+        if self._remote_not_found is None:
+            self._remote_not_found = RemoteNotFoundCache(
+                os.path.join(self.cache_folder, REMOTE_NOT_FOUND), self.config.remote_not_found_ttl)
+        return self._remote_not_found
+
     def installed_as_editable(self, ref):
         return isinstance(self.package_layout(ref), PackageEditableLayout)
 
@@ -201,6 +225,10 @@ class ClientCache(object):
         else:
             return os.path.join(self.cache_folder, PROFILES_FOLDER, self.config.default_profile)
 
+    @property
+    def bytecode_folder(self):
+        return os.path.join(self.cache_folder, BYTECODE_FOLDER)
+
     @property
     def hooks_path(self):
         """
@@ -224,7 +252,7 @@ class ClientCache(object):
            settings without values"""
         self.initialize_settings()
         content = load(self.settings_path)
-        return Settings.loads(content)
+        return Settings.loads(content, os.path.join(self.cache_folder, SETTINGS_CACHE))
 
     @property
     def hooks(self):
@@ -0,0 +1,102 @@
+import errno
+import os
+import stat
+
+from conans.errors import ConanException
+from conans.paths import CONANINFO, CONAN_MANIFEST
+from conans.util.files import md5sum, mkdir, walk
+from conans.util.log import logger
+
+
+class ObjectStore(object):
+    """ Content addressed storage of the files of the packages in the cache, every different
+    file content is stored once, named by its md5 (the checksum of the conanmanifest.txt), and
+    the package folders contain hardlinks to the objects.
+
+    As the package files are shared, they must not be modified in the cache. The objects that are
+    no longer linked from any package are removed by prune()
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+
+    def _object_path(self, key):
+        return os.path.join(self._folder, key[:2], key)
+
+    def add_folder(self, folder, manifest=None):
+        """ Replaces the files of the folder with hardlinks to the objects with the same contents,
+        adding the missing ones to the store. The file checksums are verified against the given
+        manifest. Returns the number of files that were already in the store
+        """
+        if not hasattr(os, "link"):
+            return 0
+        linked = 0
+        for root, _, files in walk(folder):
+            for f in files:
+                abs_path = os.path.join(root, f)
+                rel_path = abs_path[len(folder) + 1:].replace("\\", "/")
+                # Conan (re)writes the conaninfo.txt and conanmanifest.txt of the packages
+                if rel_path in (CONANINFO, CONAN_MANIFEST) or os.path.islink(abs_path):
+                    continue
+                file_md5 = md5sum(abs_path)
+                if manifest is not None:
+                    expected_md5 = manifest.file_sums.get(rel_path)
+                    if expected_md5 is not None and expected_md5 != file_md5:
+                        raise ConanException("Corrupted package file '%s', its md5 %s doesn't "
+                                             "match the manifest one %s"
+                                             % (rel_path, file_md5, expected_md5))
+                # The hardlinks share the permissions, executables and not executables are
+                # different objects
+                executable = os.stat(abs_path).st_mode & stat.S_IXUSR
+                object_path = self._object_path(file_md5 + ("x" if executable else ""))
+                try:
+                    if self._link(abs_path, object_path):
+                        linked += 1
+                except OSError as e:
+                    if e.errno == errno.EMLINK:  # Max number of links of the object, keep file
+                        continue
+                    # i.e. the package folder is not in the filesystem of the store (short_paths)
+                    logger.warning("Package files of %s not deduplicated: %s" % (folder, str(e)))
+                    return linked
+        return linked
+
+    @staticmethod
+    def _link(abs_path, object_path):
+        """ returns True if abs_path was replaced with the existing object, False if abs_path
+        is the new object
+        """
+        if not os.path.exists(object_path):
+            mkdir(os.path.dirname(object_path))
+            try:
+                os.link(abs_path, object_path)
+                return False
+            except OSError as e:
+                if e.errno != errno.EEXIST:  # Concurrently added by other process
+                    raise
+        tmp_path = abs_path + ".conan_link"
+        try:
+            os.link(object_path, tmp_path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            # Concurrently pruned by other process
+            os.link(abs_path, object_path)
+            return False
+        os.remove(abs_path)
+        os.rename(tmp_path, abs_path)
+        return True
+
+    def prune(self):
+        """ Removes the objects not linked from any package, returns the number of removed ones
+        """
+        removed = 0
+        for root, _, files in walk(self._folder):
+            for f in files:
+                object_path = os.path.join(root, f)
+                try:
+                    if os.stat(object_path).st_nlink == 1:
+                        os.remove(object_path)
+                        removed += 1
+                except OSError:  # Concurrently removed
+                    pass
+        return removed
@@ -0,0 +1,166 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+import fasteners
+
+from conans.errors import NotFoundException
+from conans.model.ref import PackageReference
+from conans.util.files import load, save
+from conans.util.log import logger
+
+
+class RemoteNotFoundCache(object):
+    """ The recipes and binaries recently not found in the remotes, so they are not requested
+    again to the same remote (url) during "general.remote_not_found_ttl" seconds. Disabled if
+    there is no ttl.
+
+    The entries are kept by the remote url and the reference without revision, so all the
+    entries of a reference are invalidated at once, i.e. when it is uploaded to that remote. The
+    changes are written at the end of the command by save(), merged with the ones done
+    concurrently by other processes
+    """
+
+    def __init__(self, path, ttl):
+        self._path = path
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._local = threading.local()  # The not found entries deferred by the thread
+        self._entries = None  # {remote url: {ref without revision: {ref or pref: time}}}
+        self._added = []  # [(remote url, ref without revision, ref or pref, time)]
+        self._invalidated = []  # [(remote url, ref without revision, time)], None for all
+        self.skipped = 0
+        self.added = 0
+        self.invalidated = 0
+
+    @property
+    def enabled(self):
+        return bool(self._ttl)
+
+    @staticmethod
+    def _keys(ref_or_pref):
+        ref = ref_or_pref.ref if isinstance(ref_or_pref, PackageReference) else ref_or_pref
+        return str(ref.copy_clear_rev()), ref_or_pref.full_str()
+
+    def _load(self):
+        try:
+            entries = json.loads(load(self._path))
+        except (IOError, OSError, ValueError):
+            return {}
+        now = time.time()
+        for ref_entries in entries.values():
+            for key_entries in ref_entries.values():
+                for key, timestamp in list(key_entries.items()):
+                    if now - timestamp > self._ttl:
+                        del key_entries[key]
+        return entries
+
+    def lookup(self, remote, ref_or_pref, func, *args, **kwargs):
+        """ Returns func(*args, **kwargs), the request of ref_or_pref to the remote, unless
+        it was recently not found in the remote, then raises NotFoundException without the
+        request
+        """
+        if not self.enabled:
+            return func(*args, **kwargs)
+        ref_key, key = self._keys(ref_or_pref)
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            timestamp = self._entries.get(remote.url, {}).get(ref_key, {}).get(key)
+            if timestamp is not None and time.time() - timestamp <= self._ttl:
+                self.skipped += 1
+                raise NotFoundException("'%s' was not found in remote '%s' recently"
+                                        % (key, remote.name), remote=remote.name)
+        try:
+            return func(*args, **kwargs)
+        except NotFoundException:
+            deferred = getattr(self._local, "deferred", None)
+            if deferred is not None:
+                deferred.append((remote, ref_or_pref))
+            else:
+                self._add(remote, ref_or_pref)
+            raise
+
+    def _add(self, remote, ref_or_pref):
+        ref_key, key = self._keys(ref_or_pref)
+        timestamp = time.time()
+        with self._lock:
+            self._entries.setdefault(remote.url, {}).setdefault(ref_key, {})[key] = timestamp
+            self._added.append((remote.url, ref_key, key, timestamp))
+            self.added += 1
+
+    @contextmanager
+    def deferred(self):
+        """ The not found entries of the lookups of the current thread are not added, but kept
+        in the yielded list, to add them with add_deferred() only if their result is used
+        """
+        self._local.deferred = []
+        try:
+            yield self._local.deferred
+        finally:
+            self._local.deferred = None
+
+    def add_deferred(self, deferred):
+        for remote, ref_or_pref in deferred:
+            self._add(remote, ref_or_pref)
+
+    def invalidate(self, remote, ref):
+        """ The reference and its packages could be in the remote now, i.e. after uploading them
+        """
+        if not self.enabled:
+            return
+        ref_key = str(ref.copy_clear_rev())
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            self._invalidated.append((remote.url, ref_key, time.time()))
+            self.invalidated += 1
+            self._entries.get(remote.url, {}).pop(ref_key, None)
+
+    def clear(self):
+        """ Everything could be in the remotes now, i.e. when checking for updates
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._invalidated.append((None, None, time.time()))
+            self.invalidated += 1
+            self._entries = {}
+
+    def save(self):
+        """ Writes the entries added and invalidated by this process, over the current file
+        """
+        if not self._added and not self._invalidated:
+            return
+        with self._lock:
+            try:
+                with fasteners.InterProcessLock(self._path + ".lock", logger=logger):
+                    entries = self._load()
+                    now = time.time()
+                    for url, ref_key, key, timestamp in self._added:
+                        if now - timestamp <= self._ttl:
+                            entries.setdefault(url, {}).setdefault(ref_key, {})[key] = timestamp
+                    # The entries added before an invalidation, here or in other process, go away
+                    for url, ref_key, timestamp in self._invalidated:
+                        for entry_url, ref_entries in entries.items():
+                            if url is not None and url != entry_url:
+                                continue
+                            for entry_ref_key, key_entries in ref_entries.items():
+                                if ref_key is not None and ref_key != entry_ref_key:
+                                    continue
+                                for key, entry_timestamp in list(key_entries.items()):
+                                    if entry_timestamp <= timestamp:
+                                        del key_entries[key]
+                    entries = {url: {ref_key: key_entries
+                                     for ref_key, key_entries in ref_entries.items()
+                                     if key_entries}
+                               for url, ref_entries in entries.items()}
+                    save(self._path, json.dumps({url: ref_entries
+                                                 for url, ref_entries in entries.items()
+                                                 if ref_entries}))
+            except Exception as e:  # It is just a cache
+                logger.warning("Couldn't save the remote not found cache %s: %s"
+                               % (self._path, str(e)))
+            self._added = []
+            self._invalidated = []
@@ -1,9 +1,11 @@
 import os
 import stat
 import tarfile
+import threading
 import time
 import traceback
 from collections import defaultdict
+from contextlib import contextmanager
 from multiprocessing.pool import ThreadPool
 
 from conans.util import progress_bar
@@ -14,14 +16,16 @@ from conans.client.source import retrieve_exports_sources
 from conans.errors import ConanException, NotFoundException
 from conans.model.manifest import gather_files, FileTreeManifest
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
+from conans import ZSTD_PACKAGES
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
-                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
+                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME, CONANINFO)
 from conans.search.search import search_packages, search_recipes
-from conans.util.files import (load, clean_dirty, is_dirty,
-                               gzopen_without_timestamps, set_dirty_context_manager)
+from conans.util.files import (load, clean_dirty, is_dirty, gzopen_without_timestamps,
+                               set_dirty_context_manager, zstd_available,
+                               zstdopen_without_timestamps)
 from conans.util.log import logger
 from conans.util.tracer import log_recipe_upload, log_compressed_files, log_package_upload
-from conans.tools import cpu_count
+from conans.tools import cpu_count, human_size
 
 
 UPLOAD_POLICY_FORCE = "force-upload"
@@ -304,16 +308,33 @@ class _PackagePreparator(object):
 
         return result
 
-    def prepare_package(self, pref, integrity_check, policy, p_remote):
+    def prepare_package(self, pref, integrity_check, policy, p_remote, paranoid_check=False):
         pkg_layout = self._cache.package_layout(pref.ref)
-        cache_files = self._compress_package_files(pkg_layout, pref, integrity_check)
+        tgz_name = self._package_tgz_name(p_remote, policy)
+        cache_files = self._compress_package_files(pkg_layout, pref, integrity_check, tgz_name,
+                                                   paranoid_check)
 
         if policy == UPLOAD_POLICY_SKIP:
             return None
         files_to_upload, deleted = self._package_files_to_upload(pref, policy, cache_files, p_remote)
         return files_to_upload, deleted, cache_files
 
-    def _compress_package_files(self, layout, pref, integrity_check):
+    def _package_tgz_name(self, remote, policy):
+        """ zstd packages are opt-in, as older clients cannot install them, and only used if the
+        remote can store them
+        """
+        if self._cache.config.package_compression_format != "zstd":
+            return PACKAGE_TGZ_NAME
+        if not zstd_available():
+            raise ConanException("The 'zstandard' python package is necessary to compress "
+                                 "packages with zstd, install it or set "
+                                 "'general.package_compression_format=gzip'")
+        if policy != UPLOAD_POLICY_SKIP and \
+                not self._remote_manager.server_capable(remote, ZSTD_PACKAGES):
+            return PACKAGE_TGZ_NAME
+        return PACKAGE_TZST_NAME
+
+    def _compress_package_files(self, layout, pref, integrity_check, tgz_name, paranoid_check):
         t1 = time.time()
         if layout.package_is_dirty(pref):
             raise ConanException("Package %s is corrupted, aborting upload.\n"
@@ -321,9 +342,9 @@ class _PackagePreparator(object):
                                  % (pref, pref.ref, pref.id))
 
         download_pkg_folder = layout.download_package(pref)
-        package_tgz = os.path.join(download_pkg_folder, PACKAGE_TGZ_NAME)
+        package_tgz = os.path.join(download_pkg_folder, tgz_name)
         if is_dirty(package_tgz):
-            self._output.warn("%s: Removing %s, marked as dirty" % (str(pref), PACKAGE_TGZ_NAME))
+            self._output.warn("%s: Removing %s, marked as dirty" % (str(pref), tgz_name))
             os.remove(package_tgz)
             clean_dirty(package_tgz)
 
@@ -338,7 +359,7 @@ class _PackagePreparator(object):
 
         logger.debug("UPLOAD: Time remote_manager build_files_set : %f" % (time.time() - t1))
         if integrity_check:
-            self._package_integrity_check(pref, files, package_folder)
+            self._package_integrity_check(pref, files, package_folder, paranoid_check)
             logger.debug("UPLOAD: Time remote_manager check package integrity : %f"
                          % (time.time() - t1))
 
@@ -347,22 +368,22 @@ class _PackagePreparator(object):
                 self._output.writeln("Compressing package...")
             tgz_files = {f: path for f, path in files.items() if
                          f not in [CONANINFO, CONAN_MANIFEST]}
-            tgz_path = compress_files(tgz_files, symlinks, PACKAGE_TGZ_NAME, download_pkg_folder,
+            tgz_path = compress_files(tgz_files, symlinks, tgz_name, download_pkg_folder,
                                       self._output)
             assert tgz_path == package_tgz
             assert os.path.exists(package_tgz)
 
-        return {PACKAGE_TGZ_NAME: package_tgz,
+        return {tgz_name: package_tgz,
                 CONANINFO: files[CONANINFO],
                 CONAN_MANIFEST: files[CONAN_MANIFEST]}
 
-    def _package_integrity_check(self, pref, files, package_folder):
+    def _package_integrity_check(self, pref, files, package_folder, paranoid_check):
         # If package has been modified remove tgz to regenerate it
         self._output.rewrite_line("Checking package integrity...")
 
         # short_paths = None is enough if there exist short_paths
         layout = self._cache.package_layout(pref.ref, short_paths=None)
-        read_manifest, expected_manifest = layout.package_manifests(pref)
+        read_manifest, expected_manifest = layout.package_manifests(pref, paranoid_check)
 
         if read_manifest != expected_manifest:
             self._output.writeln("")
@@ -399,6 +420,7 @@ class _PackagePreparator(object):
             if policy == UPLOAD_POLICY_NO_OVERWRITE:
                 raise ConanException("Local package is different from the remote package. Forbidden"
                                      " overwrite.")
+        # i.e. the archive of the other compression format, with the previous contents
         deleted = set(remote_snapshot).difference(the_files)
         return the_files, deleted
 
@@ -419,11 +441,14 @@ class CmdUpload(object):
               based on the different with the remote snapshot "_recipe_files_to_upload"
               This can raise if upload policy is not overwrite
             - Execute the real transfer "remote_manager.upload_recipe()"
-        - For every package_id of every ref: "_upload_package"
+        - For every package_id of every ref, in a different pool of threads, so the
+          compression of the next packages is done while uploading the current one:
+          "_prepare_package"
             - Gather files and create package.tgz. "_compress_package_files"
             - (Optional) Do the integrity check of the package
             - Decide which files to upload and delete from server:
               "_package_files_to_upload". Can raise if policy is NOT overwrite
+        - For every package_id of every ref, when it is prepared: "_upload_package"
             - Do the actual upload
 
     All the REVISIONS are local defined, not retrieved from servers
@@ -443,12 +468,19 @@ class CmdUpload(object):
         self._loader = loader
         self._hook_manager = hook_manager
         self._upload_thread_pool = None
+        self._compress_thread_pool = None
         self._exceptions_list = []
+        self._uploaded_lock = threading.Lock()
+        self._uploaded_files = 0
+        self._uploaded_bytes = 0
+        self._transfers = 0  # Number of transfers running now
+        self._transfers_start = None
+        self._transfers_duration = 0
         self._preparator = _PackagePreparator(cache, remote_manager, hook_manager, self._output)
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
                all_packages=None, confirm=False, retry=None, retry_wait=None, integrity_check=False,
-               policy=None, query=None, parallel_upload=False):
+               policy=None, query=None, parallel_upload=False, paranoid_check=False):
         t1 = time.time()
 
         collecter = _UploadCollecter(self._cache, self._user_io, self._output, self._loader)
@@ -459,6 +491,8 @@ class CmdUpload(object):
             self._user_io.disable_input()
         self._upload_thread_pool = ThreadPool(
             cpu_count() if parallel_upload else 1)
+        self._compress_thread_pool = ThreadPool(
+            cpu_count() if parallel_upload else 1)
 
         for remote, refs in refs_by_remote.items():
             self._output.info("Uploading to remote '{}':".format(remote.name))
@@ -467,7 +501,8 @@ class CmdUpload(object):
                 _ref, _conanfile, _prefs = ref_conanfile_prefs
                 try:
                     self._upload_ref(_conanfile, _ref, _prefs, retry, retry_wait,
-                                     integrity_check, policy, remote, upload_recorder, remotes)
+                                     integrity_check, policy, remote, upload_recorder, remotes,
+                                     paranoid_check)
                 except BaseException as base_exception:
                     base_trace = traceback.format_exc()
                     self._exceptions_list.append((base_exception, _ref, base_trace, remote))
@@ -478,6 +513,14 @@ class CmdUpload(object):
 
         self._upload_thread_pool.close()
         self._upload_thread_pool.join()
+        self._compress_thread_pool.close()
+        self._compress_thread_pool.join()
+
+        if self._uploaded_files:
+            duration = self._transfers_duration
+            self._output.info("Uploaded %d files, %s in %.1fs (%s/s)"
+                              % (self._uploaded_files, human_size(self._uploaded_bytes), duration,
+                                 human_size(self._uploaded_bytes / max(duration, 0.001))))
 
         if len(self._exceptions_list) > 0:
             for exc, ref, trace, remote in self._exceptions_list:
@@ -491,7 +534,7 @@ class CmdUpload(object):
         logger.debug("UPLOAD: Time manager upload: %f" % (time.time() - t1))
 
     def _upload_ref(self, conanfile, ref, prefs, retry, retry_wait, integrity_check, policy,
-                    recipe_remote, upload_recorder, remotes):
+                    recipe_remote, upload_recorder, remotes, paranoid_check=False):
         """ Uploads the recipes and binaries identified by ref
         """
         assert (ref.revision is not None), "Cannot upload a recipe without RREV"
@@ -509,6 +552,10 @@ class CmdUpload(object):
         if prefs:
             total = len(prefs)
             p_remote = recipe_remote
+            prepared = [self._compress_thread_pool.apply_async(self._prepare_package,
+                                                               (pref, integrity_check, policy,
+                                                                p_remote, paranoid_check))
+                        for pref in prefs]
 
             def upload_package_index(index_pref):
                 index, pref = index_pref
@@ -517,7 +564,8 @@ class CmdUpload(object):
                                                                         str(pref.id),
                                                                         p_remote.name)
                     self._output.info(left_justify_message(up_msg))
-                    self._upload_package(pref, retry, retry_wait, integrity_check, policy, p_remote)
+                    self._upload_package(pref, prepared[index].get(), retry, retry_wait, policy,
+                                         p_remote)
                     upload_recorder.add_package(pref, p_remote.name, p_remote.url)
                 except BaseException as pkg_exc:
                     trace = traceback.format_exc()
@@ -552,12 +600,14 @@ class CmdUpload(object):
 
         files_to_upload, deleted, cache_files, conanfile_path, t1, current_remote_name, layout = prep
         if files_to_upload or deleted:
-            self._remote_manager.upload_recipe(ref, files_to_upload, deleted, remote, retry,
-                                               retry_wait)
+            with self._transferring(files_to_upload):
+                self._remote_manager.upload_recipe(ref, files_to_upload, deleted, remote, retry,
+                                                   retry_wait)
             msg = "\rUploaded conan recipe '%s' to '%s': %s" % (str(ref), remote.name, remote.url)
             self._output.info(left_justify_message(msg))
         else:
             self._output.info("Recipe is up to date, upload skipped")
+        self._cache.remote_not_found.invalidate(remote, ref)
         duration = time.time() - t1
         log_recipe_upload(ref, duration, cache_files, remote.name)
         self._hook_manager.execute("post_upload_recipe", conanfile_path=conanfile_path,
@@ -570,9 +620,29 @@ class CmdUpload(object):
 
         return ref
 
-    def _upload_package(self, pref, retry=None, retry_wait=None, integrity_check=False,
-                        policy=None, p_remote=None):
-
+    @contextmanager
+    def _transferring(self, files):
+        """ Accounts the files uploaded and the time spent while there is any transfer running,
+        without the time collecting, compressing or checking the packages
+        """
+        with self._uploaded_lock:
+            if not self._transfers:
+                self._transfers_start = time.time()
+            self._transfers += 1
+        try:
+            yield
+        finally:
+            with self._uploaded_lock:
+                self._transfers -= 1
+                if not self._transfers:
+                    self._transfers_duration += time.time() - self._transfers_start
+        if files:
+            size = sum(os.path.getsize(path) for path in files.values())
+            with self._uploaded_lock:
+                self._uploaded_files += len(files)
+                self._uploaded_bytes += size
+
+    def _prepare_package(self, pref, integrity_check, policy, p_remote, paranoid_check=False):
         assert (pref.revision is not None), "Cannot upload a package without PREV"
         assert (pref.ref.revision is not None), "Cannot upload a package without RREV"
 
@@ -584,17 +654,27 @@ class CmdUpload(object):
                                    remote=p_remote)
 
         t1 = time.time()
-        prep = self._preparator.prepare_package(pref, integrity_check, policy, p_remote)
+        prep = self._preparator.prepare_package(pref, integrity_check, policy, p_remote,
+                                                paranoid_check)
+        return prep, t1
+
+    def _upload_package(self, pref, prepared, retry=None, retry_wait=None, policy=None,
+                        p_remote=None):
+        prep, t1 = prepared
         if policy == UPLOAD_POLICY_SKIP:
             return None
         files_to_upload, deleted, cache_files = prep
+        pkg_layout = self._cache.package_layout(pref.ref)
+        conanfile_path = pkg_layout.conanfile()
 
         if files_to_upload or deleted:
-            self._remote_manager.upload_package(pref, files_to_upload, deleted, p_remote, retry,
-                                                retry_wait)
+            with self._transferring(files_to_upload):
+                self._remote_manager.upload_package(pref, files_to_upload, deleted, p_remote,
+                                                    retry, retry_wait)
             logger.debug("UPLOAD: Time upload package: %f" % (time.time() - t1))
         else:
             self._output.info("Package is up to date, upload skipped")
+        self._cache.remote_not_found.invalidate(p_remote, pref.ref)
 
         duration = time.time() - t1
         log_package_upload(pref, duration, cache_files, p_remote)
@@ -631,7 +711,10 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
     # FIXME, better write to disk sequentially and not keep tgz contents in memory
     tgz_path = os.path.join(dest_dir, name)
     with set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle)
+        if name.endswith(".tzst"):
+            tgz = zstdopen_without_timestamps(name, fileobj=tgz_handle)
+        else:
+            tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle)
 
         for filename, dest in sorted(symlinks.items()):
             info = tarfile.TarInfo(name=filename)
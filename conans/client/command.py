@@ -1475,6 +1475,9 @@ class Command(object):
                                  ' with local regardless of recipe date')
         parser.add_argument("--check", action='store_true', default=False,
                             help='Perform an integrity check, using the manifests, before upload')
+        parser.add_argument("--paranoid", action='store_true', default=False,
+                            help='Read all the package files in the integrity check, instead of '
+                                 'reusing the cached checksums of the unmodified ones')
         parser.add_argument('-c', '--confirm', default=False, action='store_true',
                             help='Upload all matching recipes without confirmation')
         parser.add_argument('--retry', default=None, type=int, action=OnceArgument,
@@ -1522,6 +1525,8 @@ class Command(object):
             raise ConanException("'--no-overwrite' argument cannot be used together with '--force'")
         if args.force and args.skip_upload:
             raise ConanException("'--skip-upload' argument cannot be used together with '--force'")
+        if args.paranoid and not args.check:
+            raise ConanException("'--paranoid' argument can only be used together with '--check'")
         if args.no_overwrite and args.skip_upload:
             raise ConanException("'--skip-upload' argument cannot be used together "
                                  "with '--no-overwrite'")
@@ -1546,7 +1551,8 @@ class Command(object):
                                       all_packages=args.all, policy=policy,
                                       confirm=args.confirm, retry=args.retry,
                                       retry_wait=args.retry_wait, integrity_check=args.check,
-                                      parallel_upload=args.parallel)
+                                      parallel_upload=args.parallel,
+                                      paranoid_check=args.paranoid)
 
         except ConanException as exc:
             info = exc.info
@@ -30,6 +30,7 @@ from conans.client.graph.printer import print_graph
 from conans.client.graph.proxy import ConanProxy
 from conans.client.graph.python_requires import ConanPythonRequire, PyRequireLoader
 from conans.client.graph.range_resolver import RangeResolver
+from conans.client.graph.remote_lookup import RemoteLookup
 from conans.client.hook_manager import HookManager
 from conans.client.importer import run_imports, undo_imports
 from conans.client.installer import BinaryInstaller
@@ -90,7 +91,10 @@ def api_method(f):
             api.create_app(quiet_output=quiet_output)
             log_command(f.__name__, kwargs)
             with environment_append(api.app.cache.config.env_vars):
-                return f(api, *args, **kwargs)
+                try:
+                    return f(api, *args, **kwargs)
+                finally:
+                    _save_remote_not_found(api.app)
         except Exception as exc:
             if quiet_output:
                 old_output.write(quiet_output._stream.getvalue())
@@ -107,6 +111,17 @@ def api_method(f):
     return wrapper
 
 
+def _save_remote_not_found(app):
+    remote_not_found = app.cache.remote_not_found
+    if remote_not_found.skipped or remote_not_found.added or remote_not_found.invalidated:
+        remote_not_found.save()
+        # Not in the output, that can be the --raw or json output of the command
+        conans.util.log.logger.debug("Remote not found cache: %d requests skipped, %d not found "
+                                     "added, %d invalidated"
+                                     % (remote_not_found.skipped, remote_not_found.added,
+                                        remote_not_found.invalidated))
+
+
 def _make_abs_path(path, cwd=None, default=None):
     """convert 'path' to absolute if necessary (could be already absolute)
     if not defined (empty, or None), will return 'default' one or 'cwd'
@@ -195,23 +210,30 @@ class ConanApp(object):
                                             self.config.log_run_to_output,
                                             self.out)
 
-        self.proxy = ConanProxy(self.cache, self.out, self.remote_manager)
+        self.remote_lookup = RemoteLookup(self.cache)
+        self.proxy = ConanProxy(self.cache, self.out, self.remote_manager, self.remote_lookup)
         self.range_resolver = RangeResolver(self.cache, self.remote_manager)
         self.generator_manager = GeneratorManager()
         self.python_requires = ConanPythonRequire(self.proxy, self.range_resolver,
-                                                  self.generator_manager)
+                                                  self.generator_manager,
+                                                  self.cache.bytecode_folder)
         self.pyreq_loader = PyRequireLoader(self.proxy, self.range_resolver)
         self.loader = ConanFileLoader(self.runner, self.out, self.python_requires,
-                                      self.generator_manager, self.pyreq_loader, self.requester)
+                                      self.generator_manager, self.pyreq_loader, self.requester,
+                                      self.cache.bytecode_folder)
 
-        self.binaries_analyzer = GraphBinariesAnalyzer(self.cache, self.out, self.remote_manager)
+        self.binaries_analyzer = GraphBinariesAnalyzer(self.cache, self.out, self.remote_manager,
+                                                       self.remote_lookup)
         self.graph_manager = GraphManager(self.out, self.cache, self.remote_manager, self.loader,
-                                          self.proxy, self.range_resolver, self.binaries_analyzer)
+                                          self.proxy, self.range_resolver, self.binaries_analyzer,
+                                          self.remote_lookup)
 
     def load_remotes(self, remote_name=None, update=False, check_updates=False):
         remotes = self.cache.registry.load_remotes()
         if remote_name:
             remotes.select(remote_name)
+        if update or check_updates:
+            self.cache.remote_not_found.clear()
         self.python_requires.enable_remotes(update=update, check_updates=check_updates,
                                             remotes=remotes)
         self.pyreq_loader.enable_remotes(update=update, check_updates=check_updates, remotes=remotes)
@@ -1004,7 +1026,7 @@ class ConanAPIV1(object):
     @api_method
     def upload(self, pattern, package=None, remote_name=None, all_packages=False, confirm=False,
                retry=None, retry_wait=None, integrity_check=False, policy=None, query=None,
-               parallel_upload=False):
+               parallel_upload=False, paranoid_check=False):
         """ Uploads a package recipe and the generated binary packages to a specified remote
         """
         upload_recorder = UploadRecorder()
@@ -1014,7 +1036,7 @@ class ConanAPIV1(object):
         try:
             uploader.upload(pattern, remotes, upload_recorder, package, all_packages, confirm,
                             retry, retry_wait, integrity_check, policy, query=query,
-                            parallel_upload=parallel_upload)
+                            parallel_upload=parallel_upload, paranoid_check=paranoid_check)
             return upload_recorder.get_info()
         except ConanException as exc:
             upload_recorder.error = True
@@ -118,6 +118,7 @@ class CommandOutputer(object):
 
         build_time_nodes = deps_graph.build_time_nodes()
         remotes = self._cache.registry.load_remotes()
+        node_times = self._read_dates(deps_graph)
         ret = []
 
         for (ref, package_id), list_nodes in compact_nodes.items():
@@ -193,7 +194,6 @@ class CommandOutputer(object):
                 if node.binary_remote:
                     item_data["binary_remote"] = node.binary_remote.name
 
-            node_times = self._read_dates(deps_graph)
             if node_times and node_times.get(ref, None):
                 item_data["creation_date"] = node_times.get(ref, None)
 
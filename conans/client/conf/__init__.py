@@ -207,12 +207,20 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # required_conan_version = >=1.26
 
     # keep_python_files = False           # environment CONAN_KEEP_PYTHON_FILES
+    # compact_lockfiles = False           # environment CONAN_COMPACT_LOCKFILES
+    # Look for the recipes and binaries in all the remotes at once, the first remote in order wins
+    # parallel_remote_lookup = False      # environment CONAN_PARALLEL_REMOTE_LOOKUP
+    # Don't ask again the remotes for the recipes and binaries not found in them in the last seconds
+    # remote_not_found_ttl = 3600         # environment CONAN_REMOTE_NOT_FOUND_TTL (seconds)
 
     [storage]
     # This is the default path, but you can write your own. It must be an absolute path or a
     # path beginning with "~" (if the environment var CONAN_USER_HOME is specified, this directory, even
     # with "~/", will be relative to the conan user home, not to the system user home)
     path = ./data
+    # Store the files of the downloaded packages once, hardlinked from all the packages with the
+    # same file, the package files must not be modified in the cache
+    # package_dedup = False               # environment CONAN_PACKAGE_DEDUP
 
     [proxies]
     # Empty (or missing) section will try to use system proxies.
@@ -288,6 +296,9 @@ class ConanClientConfigParser(ConfigParser, object):
             ("CONAN_CACERT_PATH", "cacert_path", None),
             ("CONAN_DEFAULT_PACKAGE_ID_MODE", "default_package_id_mode", None),
             ("CONAN_KEEP_PYTHON_FILES", "keep_python_files", False),
+            ("CONAN_COMPACT_LOCKFILES", "compact_lockfiles", False),
+            ("CONAN_PARALLEL_REMOTE_LOOKUP", "parallel_remote_lookup", False),
+            ("CONAN_REMOTE_NOT_FOUND_TTL", "remote_not_found_ttl", None),
             # ("CONAN_DEFAULT_PROFILE_PATH", "default_profile", DEFAULT_PROFILE_NAME),
         ],
         "hooks": [
@@ -438,6 +449,20 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'request_timeout'")
 
+    @property
+    def remote_not_found_ttl(self):
+        ttl = os.getenv("CONAN_REMOTE_NOT_FOUND_TTL")
+        if not ttl:
+            try:
+                ttl = self.get_item("general.remote_not_found_ttl")
+            except ConanException:
+                return None
+
+        try:
+            return float(ttl) if ttl is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'remote_not_found_ttl'")
+
     @property
     def revisions_enabled(self):
         try:
@@ -460,6 +485,62 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'parallel_download'")
 
+    @property
+    def parallel_remote_lookup(self):
+        try:
+            parallel = get_env("CONAN_PARALLEL_REMOTE_LOOKUP")
+            if parallel is None:
+                parallel = self.get_item("general.parallel_remote_lookup")
+            return str(parallel).lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def parallel_build_jobs(self):
+        try:
+            parallel = self.get_item("general.parallel_build_jobs")
+        except ConanException:
+            return None
+
+        try:
+            return int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_build_jobs'")
+
+    @property
+    def parallel_upload_files(self):
+        try:
+            parallel = self.get_item("general.parallel_upload_files")
+        except ConanException:
+            return None
+
+        try:
+            return int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_upload_files'")
+
+    @property
+    def package_compression_format(self):
+        try:
+            compression = self.get_item("general.package_compression_format")
+        except ConanException:
+            return "gzip"
+        if compression not in ("gzip", "zstd"):
+            raise ConanException("Invalid 'general.package_compression_format' value '%s', "
+                                 "use 'gzip' or 'zstd'" % compression)
+        return compression
+
+    @property
+    def http_transport(self):
+        try:
+            transport = self.get_item("general.http_transport")
+        except ConanException:
+            return "http1"
+        if transport not in ("http1", "http2"):
+            raise ConanException("Invalid 'general.http_transport' value '%s', "
+                                 "use 'http1' or 'http2'" % transport)
+        return transport
+
     @property
     def download_cache(self):
         try:
@@ -468,6 +549,16 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return None
 
+    @property
+    def package_dedup(self):
+        try:
+            package_dedup = get_env("CONAN_PACKAGE_DEDUP")
+            if package_dedup is None:
+                package_dedup = self.get_item("storage.package_dedup")
+            return str(package_dedup).lower() in ("1", "true")
+        except ConanException:
+            return False
+
     @property
     def scm_to_conandata(self):
         try:
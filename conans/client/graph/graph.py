@@ -50,6 +50,15 @@ class _NodeOrderedDict(object):
         sorted_nodes = sorted(self._nodes.items(), key=lambda n: key_fn(n[1]))
         self._nodes = OrderedDict(sorted_nodes)
 
+    def update(self, nodes):
+        """ add() of all the nodes of an iterable or of another _NodeOrderedDict, keeping the
+        same order. Adding the nodes of another _NodeOrderedDict is done in bulk
+        """
+        if isinstance(nodes, _NodeOrderedDict):
+            self._nodes.update(nodes._nodes)
+        else:
+            self._nodes.update((self._key(node), node) for node in nodes)
+
     def assign(self, other):
         assert isinstance(other, _NodeOrderedDict), "Unexpected type: {}".format(type(other))
         self._nodes = other._nodes.copy()
@@ -75,6 +84,8 @@ class Node(object):
         self.binary_remote = None
         self.revision_pinned = False  # The revision has been specified by the user
         self.context = context
+        # Nodes are hashed a lot in the closures sets, their ref, conanfile and context are fixed
+        self._hash = hash((ref, conanfile, context))
 
         # A subset of the graph that will conflict by package name
         self._public_deps = _NodeOrderedDict()  # {ref.name: Node}
@@ -163,6 +174,30 @@ class Node(object):
         self.public_deps.add(other_node)
         other_node.inverse_closure.add(self)
 
+    @staticmethod
+    def connect_closures(nodes, other_nodes):
+        """ The same as connect_closure() of every one of nodes with all the other_nodes, in
+        order, but with bulk updates instead of len(nodes) * len(other_nodes) calls, as the
+        closures of very large graphs contain hundreds of nodes
+        """
+        other_nodes = list(other_nodes)
+        others = _NodeOrderedDict()
+        others.update(other_nodes)
+        nodes = set(nodes)  # Merging sets reuses their hashes
+        for node in nodes:
+            node.public_closure.update(others)
+            node.public_deps.update(others)
+        for other in other_nodes:
+            other.inverse_closure.update(nodes)
+
+    @staticmethod
+    def add_ancestors(nodes, ancestors):
+        """ adds, in order, all the ancestors to the ancestors of every one of nodes """
+        new_ancestors = _NodeOrderedDict()
+        new_ancestors.update(ancestors)
+        for node in nodes:
+            node.ancestors.update(new_ancestors)
+
     def inverse_neighbors(self):
         return [edge.src for edge in self.dependants]
 
@@ -175,7 +210,7 @@ class Node(object):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash((self.ref, self.conanfile, self.context))
+        return self._hash
 
     def __repr__(self):
         return repr(self.conanfile)
@@ -1,3 +1,5 @@
+from multiprocessing.pool import ThreadPool
+
 from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_UPDATE, RECIPE_EDITABLE, BINARY_EDITABLE,
@@ -13,13 +15,16 @@ from conans.util.conan_v2_mode import conan_v2_property
 
 class GraphBinariesAnalyzer(object):
 
-    def __init__(self, cache, output, remote_manager):
+    def __init__(self, cache, output, remote_manager, remote_lookup):
         self._cache = cache
         self._out = output
         self._remote_manager = remote_manager
+        self._remote_lookup = remote_lookup
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
         self._fixed_package_id = cache.config.full_transitive_package_id
+        # Binaries of a graph level checked concurrently in the remotes
+        self._prefetched_infos = {}  # {(pref, remote name): AsyncResult of get_package_info()}
 
     @staticmethod
     def _check_update(upstream_manifest, package_folder, output):
@@ -98,7 +103,61 @@ class GraphBinariesAnalyzer(object):
             assert node.prev, "PREV for %s is None: %s" % (str(pref), metadata.dumps())
 
     def _get_package_info(self, node, pref, remote):
-        return self._remote_manager.get_package_info(pref, remote, info=node.conanfile.info)
+        prefetched = self._prefetched_infos.pop((pref, remote.name), None)
+        if prefetched is not None:
+            return prefetched.get()  # Raises the same exceptions of get_package_info()
+        return self._remote_package_info(pref, remote, node.conanfile.info)
+
+    def _remote_package_info(self, pref, remote, info):
+        return self._cache.remote_not_found.lookup(remote, pref,
+                                                   self._remote_manager.get_package_info,
+                                                   pref, remote, info=info)
+
+    def _prefetch_packages_info(self, thread_pool, nodes, build_mode, remotes):
+        """ Launches in the thread pool the get_package_info() of the binaries of these nodes
+        that are not in the local cache and that will be checked in their remote first, so the
+        latency of the remote requests of all the nodes of a graph level is paid just once
+        """
+        if build_mode.all or not remotes:
+            return
+        for node in nodes:
+            if node.recipe == RECIPE_EDITABLE:
+                continue
+            locked = node.graph_lock_node
+            if locked and locked.package_id and locked.package_id != PACKAGE_ID_UNKNOWN:
+                pref = PackageReference(locked.ref, locked.package_id, locked.prev)
+            else:
+                pref = PackageReference(node.ref, node.package_id)
+            if pref.id == PACKAGE_ID_INVALID or pref in self._evaluated:
+                continue
+
+            package_layout = self._cache.package_layout(pref.ref,
+                                                        short_paths=node.conanfile.short_paths)
+            metadata = package_layout.load_metadata()
+            if package_layout.package_id_exists(pref.id) and pref.id in metadata.packages:
+                continue
+            # Without a remote for the binary, the remotes are checked in order
+            remote = self._binary_remote(pref, metadata, remotes) or next(iter(remotes.values()),
+                                                                            None)
+            if remote is None:
+                continue
+            key = pref, remote.name
+            if key not in self._prefetched_infos:
+                self._prefetched_infos[key] = thread_pool.apply_async(
+                    self._remote_package_info, (pref, remote, node.conanfile.info))
+
+    @staticmethod
+    def _binary_remote(pref, metadata, remotes):
+        remote = remotes.selected
+        if not remote:
+            # If the remote_name is not given, follow the binary remote, or the recipe remote
+            # If it is defined it won't iterate (might change in conan2.0)
+            if pref.id in metadata.packages:
+                remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
+            else:
+                remote_name = metadata.recipe.remote
+            remote = remotes.get(remote_name)
+        return remote
 
     def _evaluate_remote_pkg(self, node, pref, remote, remotes, remote_selected):
         remote_info = None
@@ -120,17 +179,25 @@ class GraphBinariesAnalyzer(object):
         # We iterate the other remotes to find a binary
         if not remote_selected and (not remote or
                                     (not remote_info and self._cache.config.revisions_enabled)):
-            for r in remotes.values():
-                if r == remote:
-                    continue
-                try:
-                    remote_info, pref = self._get_package_info(node, pref, r)
-                except NotFoundException:
-                    pass
-                else:
-                    if remote_info:
-                        remote = r
-                        break
+            other_remotes = [r for r in remotes.values() if r != remote]
+            if self._cache.config.parallel_remote_lookup:
+                lookup_pref = pref  # The pending lookups don't see the pref assigned below
+                found, result = self._remote_lookup.first_found(
+                    lambda r: self._get_package_info(node, lookup_pref, r), other_remotes,
+                    accept=lambda info_pref: bool(info_pref[0]))
+                if found is not None:
+                    remote_info, pref = result
+                    remote = found
+            else:
+                for r in other_remotes:
+                    try:
+                        remote_info, pref = self._get_package_info(node, pref, r)
+                    except NotFoundException:
+                        pass
+                    else:
+                        if remote_info:
+                            remote = r
+                            break
 
         if remote_info:
             node.binary = BINARY_DOWNLOAD
@@ -250,18 +317,9 @@ class GraphBinariesAnalyzer(object):
         package_layout = self._cache.package_layout(pref.ref, short_paths=conanfile.short_paths)
         metadata = self._evaluate_clean_pkg_folder_dirty(node, package_layout, pref)
 
-        remote = remotes.selected
-        remote_selected = remote is not None
-
+        remote_selected = remotes.selected is not None
         metadata = metadata or package_layout.load_metadata()
-        if not remote:
-            # If the remote_name is not given, follow the binary remote, or the recipe remote
-            # If it is defined it won't iterate (might change in conan2.0)
-            if pref.id in metadata.packages:
-                remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
-            else:
-                remote_name = metadata.recipe.remote
-            remote = remotes.get(remote_name)
+        remote = self._binary_remote(pref, metadata, remotes)
 
         if package_layout.package_id_exists(pref.id) and pref.id in metadata.packages:
             # Binary already in cache, check for updates
@@ -388,32 +446,60 @@ class GraphBinariesAnalyzer(object):
         info = conanfile.info
         node.package_id = info.package_id()
 
+    def _evaluate_package_id(self, node, build_mode, default_package_id_mode,
+                             default_python_requires_id_mode):
+        """ computes the package_id of the node, returns True if its binary has to be evaluated
+        """
+        self._propagate_options(node)
+
+        # Make sure that locked options match
+        if (node.graph_lock_node is not None and
+                node.graph_lock_node.options is not None and
+                node.conanfile.options.values != node.graph_lock_node.options):
+            raise ConanException("{}: Locked options do not match computed options\n"
+                                 "Locked options:\n{}\n"
+                                 "Computed options:\n{}".format(node.ref,
+                                                                node.graph_lock_node.options,
+                                                                node.conanfile.options.values))
+
+        self._compute_package_id(node, default_package_id_mode, default_python_requires_id_mode)
+        if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+            return False
+        if node.package_id == PACKAGE_ID_UNKNOWN:
+            assert node.binary is None, "Node.binary should be None"
+            node.binary = BINARY_UNKNOWN
+            # annotate pattern, so unused patterns in --build are not displayed as errors
+            build_mode.forced(node.conanfile, node.ref)
+            return False
+        return True
+
     def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None):
         default_package_id_mode = self._cache.config.default_package_id_mode
         default_python_requires_id_mode = self._cache.config.default_python_requires_id_mode
-        for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
-            self._propagate_options(node)
-
-            # Make sure that locked options match
-            if (node.graph_lock_node is not None and
-                    node.graph_lock_node.options is not None and
-                    node.conanfile.options.values != node.graph_lock_node.options):
-                raise ConanException("{}: Locked options do not match computed options\n"
-                                     "Locked options:\n{}\n"
-                                     "Computed options:\n{}".format(node.ref,
-                                                                    node.graph_lock_node.options,
-                                                                    node.conanfile.options.values))
-
-            self._compute_package_id(node, default_package_id_mode, default_python_requires_id_mode)
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                continue
-            if node.package_id == PACKAGE_ID_UNKNOWN:
-                assert node.binary is None, "Node.binary should be None"
-                node.binary = BINARY_UNKNOWN
-                # annotate pattern, so unused patterns in --build are not displayed as errors
-                build_mode.forced(node.conanfile, node.ref)
-                continue
-            self._evaluate_node(node, build_mode, update, remotes)
+
+        def _evaluate_package_id(n):
+            return self._evaluate_package_id(n, build_mode, default_package_id_mode,
+                                             default_python_requires_id_mode)
+
+        parallel = self._cache.config.parallel_download
+        if parallel is None or parallel <= 1:
+            for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
+                if _evaluate_package_id(node):
+                    self._evaluate_node(node, build_mode, update, remotes)
+        else:
+            # The nodes of the same level don't depend on each other, all their package_ids can
+            # be computed before checking their binaries, in the same order
+            thread_pool = ThreadPool(parallel)
+            try:
+                for level in deps_graph.by_levels(nodes_subset):
+                    level = [node for node in level if _evaluate_package_id(node)]
+                    self._prefetch_packages_info(thread_pool, level, build_mode, remotes)
+                    for node in level:
+                        self._evaluate_node(node, build_mode, update, remotes)
+            finally:
+                thread_pool.close()
+                thread_pool.join()
+                self._prefetched_infos = {}
         deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
     def reevaluate_node(self, node, remotes, build_mode, update):
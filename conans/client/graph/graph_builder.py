@@ -63,8 +63,9 @@ class DepsGraphBuilder(object):
 
         # enter recursive computation
         t1 = time.time()
-        self._expand_node(root_node, dep_graph, Requirements(), None, None, check_updates,
-                          update, remotes, profile_host, profile_build, graph_lock)
+        with self._proxy.recipes_prefetch():
+            self._expand_node(root_node, dep_graph, Requirements(), None, None, check_updates,
+                              update, remotes, profile_host, profile_build, graph_lock)
         logger.debug("GRAPH: Time to load deps %s" % (time.time() - t1))
         return dep_graph
 
@@ -98,13 +99,15 @@ class DepsGraphBuilder(object):
             self._resolve_alias(node, require, graph, update, update, remotes)
         self._resolve_ranges(graph, build_requires, scope, update, remotes)
 
-        for br in build_requires:
-            context_switch = bool(br.build_require_context == CONTEXT_BUILD)
-            populate_settings_target = context_switch  # Avoid 'settings_target' for BR-host
-            self._expand_require(br, node, graph, check_updates, update,
-                                 remotes, profile_host, profile_build, new_reqs, new_options,
-                                 graph_lock, context_switch=context_switch,
-                                 populate_settings_target=populate_settings_target)
+        with self._proxy.recipes_prefetch():
+            self._prefetch_recipes(node, build_requires, remotes)
+            for br in build_requires:
+                context_switch = bool(br.build_require_context == CONTEXT_BUILD)
+                populate_settings_target = context_switch  # Avoid 'settings_target' for BR-host
+                self._expand_require(br, node, graph, check_updates, update,
+                                     remotes, profile_host, profile_build, new_reqs, new_options,
+                                     graph_lock, context_switch=context_switch,
+                                     populate_settings_target=populate_settings_target)
 
         new_nodes = set(n for n in graph.nodes if n.package_id is None)
         # This is to make sure that build_requires have precedence over the normal requires
@@ -123,6 +126,8 @@ class DepsGraphBuilder(object):
         # basic node configuration: calling configure() and requirements() and version-ranges
         new_options, new_reqs = self._get_node_requirements(node, graph, down_ref, down_options,
                                                             down_reqs, graph_lock, update, remotes)
+        # The missing recipes are downloaded in background while the previous ones are expanded
+        self._prefetch_recipes(node, node.conanfile.requires.values(), remotes)
 
         # Expand each one of the current requirements
         for require in node.conanfile.requires.values():
@@ -132,6 +137,12 @@ class DepsGraphBuilder(object):
                                  profile_build, new_reqs, new_options, graph_lock,
                                  context_switch=False)
 
+    def _prefetch_recipes(self, node, requires, remotes):
+        # Requirements closing a diamond reuse the existing node, they don't need the recipe
+        refs = [r.ref for r in requires
+                if not r.override and not node.public_deps.get(r.ref.name, context=node.context)]
+        self._proxy.prefetch_recipes(refs, remotes)
+
     def _resolve_ranges(self, graph, requires, consumer, update, remotes):
         for require in requires:
             if require.locked_id:  # if it is locked, nothing to resolved
@@ -268,15 +279,13 @@ class DepsGraphBuilder(object):
                 new_node.public_deps.add(new_node)
 
                 # All the dependents of "node" are also connected now to "new_node"
-                for dep_node in node.inverse_closure:
-                    dep_node.connect_closure(new_node)
+                Node.connect_closures(node.inverse_closure, [new_node])
 
             # RECURSION, keep expanding (depth-first) the new node
             self._expand_node(new_node, graph, new_reqs, node.ref, new_options, check_updates,
                               update, remotes, profile_host, profile_build, graph_lock)
             if not require.private and not require.build_require:
-                for name, n in new_node.transitive_closure.items():
-                    node.transitive_closure[name] = n
+                node.transitive_closure.update(new_node.transitive_closure)
 
         else:  # a public node already exist with this name
             self._resolve_cached_alias([require], graph)
@@ -291,23 +300,20 @@ class DepsGraphBuilder(object):
                     raise ConanException(conflict)
 
             # Add current ancestors to the previous node and upstream deps
-            for n in previous.public_closure:
-                n.ancestors.add(node)
-                for item in node.ancestors:
-                    n.ancestors.add(item)
+            ancestors = [node]
+            ancestors.extend(node.ancestors)
+            Node.add_ancestors(previous.public_closure, ancestors)
 
             node.connect_closure(previous)
             graph.add_edge(node, previous, require)
             if not require.private and not require.build_require:
-                for name, n in previous.transitive_closure.items():
-                    node.transitive_closure[name] = n
+                node.transitive_closure.update(previous.transitive_closure)
 
                 # All the upstream dependencies (public_closure) of the previously existing node
                 # now will be also connected to the node and to all its dependants
-                for n in previous.transitive_closure.values():
-                    node.connect_closure(n)
-                    for dep_node in node.inverse_closure:
-                        dep_node.connect_closure(n)
+                dependants = [node]
+                dependants.extend(node.inverse_closure)
+                Node.connect_closures(dependants, previous.transitive_closure.values())
 
             # Recursion is only necessary if the inputs conflict with the current "previous"
             # configuration of upstream versions and options
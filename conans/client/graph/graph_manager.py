@@ -44,7 +44,8 @@ class _RecipeBuildRequires(OrderedDict):
 
 
 class GraphManager(object):
-    def __init__(self, output, cache, remote_manager, loader, proxy, resolver, binary_analyzer):
+    def __init__(self, output, cache, remote_manager, loader, proxy, resolver, binary_analyzer,
+                 remote_lookup):
         self._proxy = proxy
         self._output = output
         self._resolver = resolver
@@ -52,6 +53,7 @@ class GraphManager(object):
         self._remote_manager = remote_manager
         self._loader = loader
         self._binary_analyzer = binary_analyzer
+        self._remote_lookup = remote_lookup
 
     def load_consumer_conanfile(self, conanfile_path, info_folder,
                                 deps_info_required=False, test=False):
@@ -116,12 +118,14 @@ class GraphManager(object):
         profile_host, profile_build = graph_info.profile_host, graph_info.profile_build
         graph_lock, root_ref = graph_info.graph_lock, graph_info.root
 
-        root_node = self._load_root_node(reference, create_reference, profile_host, graph_lock,
-                                         root_ref, lockfile_node_id, is_build_require,
-                                         require_overrides)
-        deps_graph = self._resolve_graph(root_node, profile_host, profile_build, graph_lock,
-                                         build_mode, check_updates, update, remotes, recorder,
-                                         apply_build_requires=apply_build_requires)
+        # The recipes and binaries looked up in the remotes share the same pool of threads
+        with self._remote_lookup.session():
+            root_node = self._load_root_node(reference, create_reference, profile_host,
+                                             graph_lock, root_ref, lockfile_node_id,
+                                             is_build_require, require_overrides)
+            deps_graph = self._resolve_graph(root_node, profile_host, profile_build, graph_lock,
+                                             build_mode, check_updates, update, remotes,
+                                             recorder, apply_build_requires=apply_build_requires)
         # Run some validations once the graph is built
         self._validate_graph_provides(deps_graph)
 
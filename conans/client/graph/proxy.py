@@ -1,11 +1,14 @@
 import os
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 
 from requests.exceptions import RequestException
+from six import StringIO
 
 from conans.client.graph.graph import (RECIPE_DOWNLOADED, RECIPE_INCACHE, RECIPE_NEWER,
                                        RECIPE_NOT_IN_REMOTE, RECIPE_NO_REMOTE, RECIPE_UPDATEABLE,
                                        RECIPE_UPDATED, RECIPE_EDITABLE)
-from conans.client.output import ScopedOutput
+from conans.client.output import ConanOutput, ScopedOutput
 from conans.client.recorder.action_recorder import INSTALL_ERROR_MISSING, INSTALL_ERROR_NETWORK
 from conans.client.remover import DiskRemover
 from conans.errors import ConanException, NotFoundException, RecipeNotFoundException
@@ -18,13 +21,84 @@ DEPRECATED_CONAN_CENTER_BINTRAY_URL = "https://conan.bintray.com"
 
 
 class ConanProxy(object):
-    def __init__(self, cache, output, remote_manager):
+    def __init__(self, cache, output, remote_manager, remote_lookup):
         # collaborators
         self._cache = cache
         self._out = output
         self._remote_manager = remote_manager
+        self._remote_lookup = remote_lookup
+        self._prefetch_pool = None
+        self._prefetched = {}  # {ref without revision: (ref, AsyncResult)}
+
+    @contextmanager
+    def recipes_prefetch(self):
+        """ Enables prefetch_recipes() while the graph is expanded, downloading the recipes in
+        as many threads as the "general.parallel_download" configuration
+        """
+        parallel = self._cache.config.parallel_download
+        if parallel is None or parallel <= 1 or self._prefetch_pool is not None:
+            yield
+            return
+        self._prefetch_pool = ThreadPool(parallel)
+        try:
+            yield
+        finally:
+            # Downloads not consumed by the graph (conflicts, overrides) are finished anyway
+            self._prefetch_pool.close()
+            self._prefetch_pool.join()
+            self._prefetch_pool = None
+            self._prefetched = {}
+
+    def prefetch_recipes(self, refs, remotes):
+        """ Starts downloading in background the recipes of these references that are not in
+        the local cache. The download is the same get_recipe() would do, but its output and
+        recorder actions are kept and replayed when get_recipe() is called for that reference,
+        so the result is the same as downloading them in order
+        """
+        if self._prefetch_pool is None or not remotes:
+            return
+        for ref in refs:
+            key = ref.copy_clear_rev()
+            if key in self._prefetched:
+                continue
+            layout = self._cache.package_layout(ref)
+            if isinstance(layout, PackageEditableLayout) or os.path.exists(layout.conanfile()):
+                continue
+            result = self._prefetch_pool.apply_async(self._prefetch_recipe, (layout, ref, remotes))
+            self._prefetched[key] = ref, result
+
+    def _prefetch_recipe(self, layout, ref, remotes):
+        buffer = StringIO()
+        output = ScopedOutput(str(ref), ConanOutput(buffer, color=self._out._color))
+        recorder = _RecorderBuffer()
+        try:
+            with layout.conanfile_write_lock(output):
+                remote, new_ref = self._download_recipe(layout, ref, output, remotes,
+                                                        remotes.selected, recorder)
+            return buffer.getvalue(), recorder, (remote, new_ref), None
+        except Exception as e:
+            return buffer.getvalue(), recorder, None, e
+
+    def _get_prefetched_recipe(self, ref, recorder):
+        prefetched = self._prefetched.pop(ref.copy_clear_rev(), None)
+        if prefetched is None:
+            return None
+        prefetched_ref, result = prefetched
+        output, recorder_buffer, downloaded, error = result.get()
+        if prefetched_ref != ref:  # Other revision was requested, normal get_recipe() flow
+            return None
+        self._out.write(output)
+        recorder_buffer.replay(recorder)
+        if error is not None:
+            raise error
+        remote, new_ref = downloaded
+        return self._cache.package_layout(ref).conanfile(), RECIPE_DOWNLOADED, remote, new_ref
 
     def get_recipe(self, ref, check_updates, update, remotes, recorder):
+        prefetched = self._get_prefetched_recipe(ref, recorder)
+        if prefetched is not None:
+            return prefetched
+
         layout = self._cache.package_layout(ref)
         if isinstance(layout, PackageEditableLayout):
             conanfile_path = layout.conanfile()
@@ -123,7 +197,9 @@ class ConanProxy(object):
                 output.warn("Please use the new 'conancenter' default remote.")
                 output.warn("Add it to your remotes with: conan remote add -i 0 conancenter "
                             "https://center.conan.io")
-            _ref = self._remote_manager.get_recipe(ref, the_remote)
+            _ref = self._cache.remote_not_found.lookup(the_remote, ref,
+                                                       self._remote_manager.get_recipe,
+                                                       ref, the_remote)
             output.info("Downloaded recipe revision %s" % _ref.revision)
             recorder.recipe_downloaded(ref, the_remote.url)
             return _ref
@@ -159,15 +235,44 @@ class ConanProxy(object):
         remotes = remotes.values()
         if not remotes:
             raise ConanException("No remote defined")
-        for remote in remotes:
-            try:
+        if self._cache.config.parallel_remote_lookup:
+            # The recipe manifests are checked in all the remotes at once, the recipe is only
+            # downloaded from the first remote that has it
+            remote_not_found = self._cache.remote_not_found
+            remote, _ = self._remote_lookup.first_found(lambda r: remote_not_found.lookup(
+                r, ref, self._remote_manager.get_recipe_manifest, ref, r), remotes)
+            if remote is not None:
                 new_ref = _retrieve_from_remote(remote)
                 return remote, new_ref
-            # If not found continue with the next, else raise
-            except NotFoundException:
-                pass
         else:
-            msg = "Unable to find '%s' in remotes" % ref.full_str()
-            recorder.recipe_install_error(ref, INSTALL_ERROR_MISSING,
-                                          msg, None)
-            raise NotFoundException(msg)
+            for remote in remotes:
+                try:
+                    new_ref = _retrieve_from_remote(remote)
+                    return remote, new_ref
+                # If not found continue with the next, else raise
+                except NotFoundException:
+                    pass
+
+        msg = "Unable to find '%s' in remotes" % ref.full_str()
+        recorder.recipe_install_error(ref, INSTALL_ERROR_MISSING,
+                                      msg, None)
+        raise NotFoundException(msg)
+
+
+class _RecorderBuffer(object):
+    """ Keeps the actions recorded while prefetching a recipe, to record them later in the
+    ActionRecorder, in the same order as the graph is expanded
+    """
+
+    def __init__(self):
+        self._actions = []
+
+    def recipe_downloaded(self, *args):
+        self._actions.append(("recipe_downloaded", args))
+
+    def recipe_install_error(self, *args):
+        self._actions.append(("recipe_install_error", args))
+
+    def replay(self, recorder):
+        for method, args in self._actions:
+            getattr(recorder, method)(*args)
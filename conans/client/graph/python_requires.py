@@ -159,8 +159,9 @@ class PyRequireLoader(object):
 
 
 class ConanPythonRequire(object):
-    def __init__(self, proxy, range_resolver, generator_manager=None):
+    def __init__(self, proxy, range_resolver, generator_manager=None, bytecode_folder=None):
         self._generator_manager = generator_manager
+        self._bytecode_folder = bytecode_folder
         self._cached_requires = {}  # {reference: PythonRequire}
         self._proxy = proxy
         self._range_resolver = range_resolver
@@ -198,7 +199,8 @@ class ConanPythonRequire(object):
                                             recorder=ActionRecorder())
             path, _, _, new_ref = result
             module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self,
-                                                generator_manager=self._generator_manager)
+                                                generator_manager=self._generator_manager,
+                                                bytecode_folder=self._bytecode_folder)
 
             # Check for alias
             if getattr(conanfile, "alias", None):
@@ -1,8 +1,8 @@
+import os
 import re
 
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
-from conans.search.search import search_recipes
 
 re_param = re.compile(r"^(?P<function>include_prerelease|loose)\s*=\s*(?P<value>True|False)$")
 re_version = re.compile(r"^((?!(include_prerelease|loose))[a-zA-Z0-9_+.\-~<>=|*^\s])*$")
@@ -51,27 +51,58 @@ def _parse_versionexpr(versionexpr, result):
     return version_range, loose, include_prerelease
 
 
+# Parsing the versions and the ranges is expensive, and the same ones are parsed again for
+# every version range of every graph. {(version, loose): SemVer or None if invalid}
+_parsed_versions = {}
+_parsed_ranges = {}  # {(version_range, loose): Range}
+
+
+def _parse_version(version, loose):
+    from semver import SemVer
+    key = (version, loose)
+    try:
+        return _parsed_versions[key]
+    except KeyError:
+        try:
+            ver = SemVer(version, loose=loose)
+        except (ValueError, AttributeError):
+            ver = None
+        _parsed_versions[key] = ver
+        return ver
+
+
+def _parse_range(version_range, loose):
+    from semver import Range
+    key = (version_range, loose)
+    try:
+        return _parsed_ranges[key]
+    except KeyError:
+        try:
+            act_range = Range(version_range, loose)
+        except ValueError:
+            raise ConanException("version range expression '%s' is not valid" % version_range)
+        _parsed_ranges[key] = act_range
+        return act_range
+
+
 def satisfying(list_versions, versionexpr, result):
     """ returns the maximum version that satisfies the expression
     if some version cannot be converted to loose SemVer, it is discarded with a msg
     This provides some workaround for failing comparisons like "2.1" not matching "<=2.1"
     """
-    from semver import SemVer, Range, max_satisfying
+    from semver import max_satisfying
     version_range, loose, include_prerelease = _parse_versionexpr(versionexpr, result)
 
     # Check version range expression
-    try:
-        act_range = Range(version_range, loose)
-    except ValueError:
-        raise ConanException("version range expression '%s' is not valid" % version_range)
+    act_range = _parse_range(version_range, loose)
 
     # Validate all versions
     candidates = {}
     for v in list_versions:
-        try:
-            ver = SemVer(v, loose=loose)
+        ver = _parse_version(v, loose)
+        if ver is not None:
             candidates[ver] = v
-        except (ValueError, AttributeError):
+        else:
             result.append("WARN: Version '%s' is not semver, cannot be compared with a range"
                           % str(v))
 
@@ -87,6 +118,7 @@ class RangeResolver(object):
         self._cache = cache
         self._remote_manager = remote_manager
         self._cached_remote_found = {}
+        self._local_names = None  # {name.lower(): [name folders in the cache]}
         self._result = []
 
     @property
@@ -139,11 +171,42 @@ class RangeResolver(object):
                                  "could not be resolved in %s"
                                  % (version_range, require, base_conanref, origin))
 
+    def _name_folders(self, name):
+        """ The folders of the cache for the given name (case insensitive), from an index of
+        the cache folder that is built once. A missing name might have been added to the cache
+        by this command, the index is listed again
+        """
+        name = name.lower()
+        if self._local_names is None or name not in self._local_names:
+            self._local_names = {}
+            store = self._cache.store
+            for folder in os.listdir(store) if os.path.isdir(store) else []:
+                self._local_names.setdefault(folder.lower(), []).append(folder)
+        return self._local_names.get(name, [])
+
+    def _search_local(self, search_ref):
+        """ Equivalent to search_recipes(cache, search_ref) filtered by the user and channel,
+        but instead of walking the whole cache, it only checks the versions of the given name
+        """
+        user_folder = search_ref.user or "_"
+        channel_folder = search_ref.channel or "_"
+        local_found = []
+        for name_folder in self._name_folders(search_ref.name):
+            name_path = os.path.join(self._cache.store, name_folder)
+            if not os.path.isdir(name_path):
+                continue
+            for version in os.listdir(name_path):
+                if os.path.isdir(os.path.join(name_path, version, user_folder, channel_folder)):
+                    local_found.append(ConanFileReference(name_folder, version, search_ref.user,
+                                                          search_ref.channel, validate=False))
+        for ref in self._cache.editable_packages.edited_refs:
+            if ref.name.lower() == search_ref.name.lower() and ref.user == search_ref.user and \
+                    ref.channel == search_ref.channel:
+                local_found.append(ref)
+        return sorted(local_found)
+
     def _resolve_local(self, search_ref, version_range):
-        local_found = search_recipes(self._cache, search_ref)
-        local_found = [ref for ref in local_found
-                       if ref.user == search_ref.user and
-                       ref.channel == search_ref.channel]
+        local_found = self._search_local(search_ref)
         if local_found:
             return self._resolve_version(version_range, local_found)
 
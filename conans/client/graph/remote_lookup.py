@@ -0,0 +1,122 @@
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+
+from conans.client.rest.auth_manager import non_interactive_calls
+from conans.errors import AuthenticationException, NotFoundException
+from conans.util.log import logger
+
+
+def _timed_lookup(lookup, remote):
+    t1 = time.time()
+    try:
+        result = lookup(remote)
+    except NotFoundException:
+        logger.debug("REMOTE LOOKUP: Not found in '%s' (%.3fs)" % (remote.name, time.time() - t1))
+        raise
+    except Exception as e:
+        logger.debug("REMOTE LOOKUP: Error in '%s' (%.3fs): %s"
+                     % (remote.name, time.time() - t1, str(e)))
+        raise
+    logger.debug("REMOTE LOOKUP: Found in '%s' (%.3fs)" % (remote.name, time.time() - t1))
+    return result
+
+
+class RemoteLookup(object):
+    """ Looks up a recipe or binary in all the remotes at once, if "general.parallel_remote_lookup"
+    is enabled, sharing a pool of threads during a graph analysis (see session()). Otherwise, or
+    outside a session, the remotes are checked one by one.
+
+    The lookups running in background don't ask for credentials or store tokens, a remote that
+    requires them is looked up again in the calling thread if its result is needed. Their not
+    found entries are only added to the remote not found cache if their result is used, and the
+    ones of the remotes after the found one are ignored
+    """
+
+    def __init__(self, cache):
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._sessions = 0
+        self._pool = None
+
+    @contextmanager
+    def session(self):
+        """ The concurrent lookups done meanwhile share the same pool of threads, that finishes
+        the lookups still running at the end
+        """
+        with self._lock:
+            self._sessions += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._sessions -= 1
+                pool = self._pool if not self._sessions else None
+                if pool is not None:
+                    self._pool = None
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def _get_pool(self, remotes):
+        if len(remotes) <= 1 or not self._cache.config.parallel_remote_lookup:
+            return None
+        with self._lock:
+            if not self._sessions:
+                return None
+            if self._pool is None:
+                # Every thread downloading recipes or checking binaries can look up in all the
+                # remotes at once
+                self._pool = ThreadPool(len(remotes) * (self._cache.config.parallel_download or 1))
+            return self._pool
+
+    def first_found(self, lookup, remotes, accept=None):
+        """ Calls lookup(remote) for all the remotes, and returns (remote, result) of the first
+        remote, in the remotes order, whose lookup doesn't raise NotFoundException and whose
+        result is accepted by accept(result), or (None, None) if none has it. Other errors of
+        the remotes before the found one are raised, as checking the remotes one by one.
+        """
+        remotes = list(remotes)
+        pool = self._get_pool(remotes)
+        if pool is None:
+            for remote in remotes:
+                try:
+                    result = _timed_lookup(lookup, remote)
+                except NotFoundException:
+                    continue
+                if accept is None or accept(result):
+                    return remote, result
+            return None, None
+
+        remote_not_found = self._cache.remote_not_found
+        used = threading.Event()  # The lookups not started yet are not needed anymore
+
+        def background_lookup(remote):
+            if used.is_set():
+                return None, None, []
+            with non_interactive_calls(), remote_not_found.deferred() as not_found:
+                try:
+                    return _timed_lookup(lookup, remote), None, not_found
+                except Exception as e:
+                    return None, e, not_found
+
+        results = [pool.apply_async(background_lookup, (remote, )) for remote in remotes]
+        try:
+            for remote, async_result in zip(remotes, results):
+                result, error, not_found = async_result.get()
+                remote_not_found.add_deferred(not_found)
+                if isinstance(error, AuthenticationException):
+                    try:
+                        result, error = _timed_lookup(lookup, remote), None
+                    except NotFoundException as e:
+                        error = e
+                if isinstance(error, NotFoundException):
+                    continue
+                if error is not None:
+                    raise error
+                if accept is None or accept(result):
+                    return remote, result
+            return None, None
+        finally:
+            used.set()
@@ -9,6 +9,7 @@ from conans.client.output import ScopedOutput
 from conans.client.tools.files import chdir
 from conans.errors import ConanException, NotFoundException
 from conans.util.files import save
+from conans.util.locks import user_code_lock
 
 attribute_checker_hook = """
 def pre_export(output, conanfile, conanfile_path, reference, **kwargs):
@@ -60,7 +61,9 @@ class HookManager(object):
         for name, method in self.hooks[method_name]:
             try:
                 output = ScopedOutput("[HOOK - %s] %s()" % (name, method_name), self.output)
-                method(output=output, **kwargs)
+                # The hooks are user code, not run concurrently with other hooks or recipes
+                with user_code_lock:
+                    method(output=output, **kwargs)
             except Exception as e:
                 raise ConanException("[HOOK - %s] %s(): %s" % (name, method_name, str(e)))
 
@@ -1,9 +1,13 @@
 import os
 import shutil
 import textwrap
+import threading
 import time
+from contextlib import contextmanager
 from multiprocessing.pool import ThreadPool
 
+from six import StringIO
+
 from conans.client import tools
 from conans.client.conanfile.build import run_build_method
 from conans.client.conanfile.package import run_package_method
@@ -12,9 +16,11 @@ from conans.client.generators import TXTGenerator, write_toolchain
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_EDITABLE, \
     BINARY_MISSING, BINARY_SKIP, BINARY_UPDATE, BINARY_UNKNOWN, CONTEXT_HOST, BINARY_INVALID
 from conans.client.importer import remove_imports, run_imports
+from conans.client.output import ConanOutput, ScopedOutput
 from conans.client.packager import update_package_metadata
 from conans.client.recorder.action_recorder import INSTALL_ERROR_BUILDING, INSTALL_ERROR_MISSING, \
     INSTALL_ERROR_MISSING_BUILD_FOLDER
+from conans.client.runner import ConanRunner
 from conans.client.source import retrieve_exports_sources, config_source
 from conans.client.tools.env import pythonpath
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
@@ -33,6 +39,7 @@ from conans.model.user_info import UserInfo
 from conans.paths import BUILD_INFO, CONANINFO, RUN_LOG_NAME
 from conans.util.env_reader import get_env
 from conans.util.files import clean_dirty, is_dirty, make_read_only, mkdir, rmdir, save, set_dirty
+from conans.util.locks import user_code_lock
 from conans.util.log import logger
 from conans.util.tracer import log_package_built, log_package_got_from_local_cache
 
@@ -107,9 +114,10 @@ class _PackageBuilder(object):
         conanfile.folders.set_base_build(None)
         conanfile.folders.set_base_package(None)
 
-        config_source(export_folder, export_source_folder, scm_sources_folder,
-                      conanfile, self._output, conanfile_path, pref.ref,
-                      self._hook_manager, self._cache)
+        with user_code_lock:
+            config_source(export_folder, export_source_folder, scm_sources_folder,
+                          conanfile, self._output, conanfile_path, pref.ref,
+                          self._hook_manager, self._cache)
 
     @staticmethod
     def _copy_sources(conanfile, source_folder, build_folder):
@@ -223,10 +231,12 @@ class _PackageBuilder(object):
                     conanfile.folders.set_base_generators(base_build)
                     # In local cache, install folder always is build_folder
                     conanfile.folders.set_base_install(base_build)
-                    self._build(conanfile, pref)
+                    with user_code_lock:
+                        self._build(conanfile, pref)
                     clean_dirty(base_build)
 
-                prev = self._package(conanfile, pref, package_layout, conanfile_path)
+                with user_code_lock:
+                    prev = self._package(conanfile, pref, package_layout, conanfile_path)
                 assert prev
                 node.prev = prev
                 log_file = os.path.join(base_build, RUN_LOG_NAME)
@@ -287,6 +297,141 @@ def call_system_requirements(conanfile, output):
         raise ConanException("Error in system requirements")
 
 
+class _BufferedRunner(object):
+    """ Wraps the conanfile runner, so the output of the executed commands goes to the
+    node output buffer instead of the process stdout, and other nodes can run their user code
+    while the command runs
+    """
+    def __init__(self, runner, stream):
+        self._runner = runner
+        self._stream = stream
+
+    def __call__(self, command, output=True, *args, **kwargs):
+        if output is True:
+            output = self._stream
+        if isinstance(self._runner, ConanRunner):
+            kwargs["while_running"] = user_code_lock.released
+        return self._runner(command, output, *args, **kwargs)
+
+
+@contextmanager
+def _buffered_output(conanfile, output, output_lock):
+    """ Captures all the output of a node (messages and commands run) and writes it to the
+    real output in one block once the node finishes, so logs of concurrent nodes don't interleave
+    """
+    scoped_output = conanfile.output
+    runner = conanfile._conan_runner
+    buffer = StringIO()
+    conanfile.output = ScopedOutput(scoped_output.scope,
+                                    ConanOutput(buffer, color=scoped_output._color))
+    conanfile._conan_runner = _BufferedRunner(runner, buffer)
+    try:
+        yield
+    finally:
+        conanfile.output = scoped_output
+        conanfile._conan_runner = runner
+        with output_lock:
+            output.write(buffer.getvalue())
+
+
+class _NodeScheduler(object):
+    """ Executes a function over the graph nodes, launching every node as soon as all its
+    dependencies have finished. Nodes can also be blocked until an external event, like the
+    download of their package, happens. With more than one job, the nodes run in a pool of
+    threads, otherwise they run in the calling thread. After the first failure no more nodes
+    are launched, and the error is raised once the running ones finish
+    """
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self._condition = threading.Condition()
+        self._blocked = {}  # {node: number of events still to happen}
+        self._pending = {}
+        self._dependants = {}
+        self._ready = []
+        self._remaining = 0
+        self._running = 0
+        self._errors = []
+
+    def block(self, node):
+        with self._condition:
+            self._blocked[node] = self._blocked.get(node, 0) + 1
+
+    def unblock(self, node):
+        with self._condition:
+            self._blocked[node] -= 1
+            self._check_ready(node)
+            self._condition.notify()
+
+    def fail(self, error):
+        with self._condition:
+            self._errors.append(error)
+            self._condition.notify()
+
+    def _check_ready(self, node):
+        if node in self._pending and not self._pending[node] and not self._blocked.get(node):
+            del self._pending[node]
+            self._ready.append(node)
+
+    def _done(self, node, error):
+        with self._condition:
+            self._running -= 1
+            self._remaining -= 1
+            if error is not None:
+                self._errors.append(error)
+            else:
+                for dependant in self._dependants[node]:
+                    self._pending[dependant].discard(node)
+                    self._check_ready(dependant)
+            self._condition.notify()
+
+    def _task(self, func, node):
+        try:
+            func(node)
+        except BaseException as e:
+            self._done(node, e)
+        else:
+            self._done(node, None)
+
+    def _next(self):
+        with self._condition:
+            while not self._ready or self._errors:
+                if not self._remaining or (self._errors and not self._running):
+                    return None
+                self._condition.wait()
+            self._running += 1
+            return self._ready.pop(0)
+
+    def run(self, nodes, func):
+        node_set = set(nodes)
+        with self._condition:
+            self._remaining = len(nodes)
+            for node in nodes:
+                self._pending[node] = set(d for d in node.neighbors() if d in node_set)
+                self._dependants[node] = []
+            for node in nodes:
+                for dep in self._pending[node]:
+                    self._dependants[dep].append(node)
+            for node in nodes:
+                self._check_ready(node)
+
+        thread_pool = ThreadPool(self.jobs) if self.jobs > 1 else None
+        try:
+            while True:
+                node = self._next()
+                if node is None:
+                    break
+                if thread_pool is not None:
+                    thread_pool.apply_async(self._task, (func, node))
+                else:
+                    self._task(func, node)
+        finally:
+            if thread_pool is not None:
+                thread_pool.close()
+                thread_pool.join()
+        if self._errors:
+            raise self._errors[0]
+
+
 class BinaryInstaller(object):
     """ main responsible of retrieving binary packages or building them from source
     locally in case they are not found in remotes
@@ -374,14 +519,15 @@ class BinaryInstaller(object):
             Or read 'http://docs.conan.io/en/latest/faq/troubleshooting.html#error-missing-prebuilt-package'
             ''' % (missing_pkgs, build_str)))
 
-    def _download(self, downloads, processed_package_refs):
+    def _download(self, nodes, downloads, processed_package_refs, scheduler):
         """ executes the download of packages (both download and update), only once for a given
-        PREF, even if node duplicated
+        PREF, even if node duplicated. With parallel downloads or builds, they are launched in a
+        pool of threads, and the nodes with that PREF are blocked in the scheduler until the
+        download finishes, so the rest of nodes, like the ones to be built, don't need to wait
+        for all the downloads. Otherwise they are downloaded here, before installing the nodes
         :param downloads: all nodes to be downloaded or updated, included repetitions
+        :return: the pool of threads running the downloads, or None
         """
-        if not downloads:
-            return
-
         download_nodes = []
         for node in downloads:
             pref = node.pref
@@ -392,24 +538,43 @@ class BinaryInstaller(object):
             assert node.prev, "PREV for %s is None" % str(node.pref)
             download_nodes.append(node)
 
+        parallel = self._cache.config.parallel_download
+        if parallel is None and scheduler.jobs == 1:
+            for node in download_nodes:
+                layout = self._cache.package_layout(node.ref, node.conanfile.short_paths)
+                with layout.package_lock(node.pref):
+                    self._download_pkg(layout, node)
+            return None
+
+        blocked_nodes = {}  # {bare_pref: [nodes that need it downloaded]}
+        for node in nodes:
+            if node.binary not in (BINARY_SKIP, BINARY_EDITABLE) and node.package_id:
+                bare_pref = PackageReference(node.ref, node.package_id)
+                if bare_pref in processed_package_refs:
+                    blocked_nodes.setdefault(bare_pref, []).append(node)
+                    scheduler.block(node)
+
         def _download(n):
             npref = n.pref
-            layout = self._cache.package_layout(npref.ref, n.conanfile.short_paths)
-            # We cannot embed the package_lock inside the remote.get_package()
-            # because the handle_node_cache has its own lock
-            with layout.package_lock(pref):
-                self._download_pkg(layout, n)
+            try:
+                layout = self._cache.package_layout(npref.ref, n.conanfile.short_paths)
+                # We cannot embed the package_lock inside the remote.get_package()
+                # because the handle_node_cache has its own lock
+                with layout.package_lock(npref):
+                    self._download_pkg(layout, n)
+            except BaseException as e:
+                scheduler.fail(e)
+            else:
+                for blocked_node in blocked_nodes.get(PackageReference(npref.ref, npref.id), []):
+                    scheduler.unblock(blocked_node)
 
-        parallel = self._cache.config.parallel_download
         if parallel is not None:
             self._out.info("Downloading binary packages in %s parallel threads" % parallel)
-            thread_pool = ThreadPool(parallel)
-            thread_pool.map(_download, [n for n in download_nodes])
-            thread_pool.close()
-            thread_pool.join()
-        else:
-            for node in download_nodes:
-                _download(node)
+        thread_pool = ThreadPool(parallel or 1)
+        for node in download_nodes:
+            thread_pool.apply_async(_download, (node, ))
+        thread_pool.close()
+        return thread_pool
 
     def _download_pkg(self, layout, node):
         self._remote_manager.get_package(node.conanfile, node.pref, layout, node.binary_remote,
@@ -426,33 +591,63 @@ class BinaryInstaller(object):
             raise ConanInvalidConfiguration("\n".join(msg))
         self._raise_missing(missing)
         processed_package_refs = {}
-        self._download(downloads, processed_package_refs)
 
-        for level in nodes_by_level:
-            for node in level:
-                ref, conan_file = node.ref, node.conanfile
-                output = conan_file.output
-
-                self._propagate_info(node, using_build_profile)
-                if node.binary == BINARY_EDITABLE:
-                    self._handle_node_editable(node, profile_host, profile_build, graph_lock)
-                    # Need a temporary package revision for package_revision_mode
-                    # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
-                    node.prev = "editable"
-                else:
-                    if node.binary == BINARY_SKIP:  # Privates not necessary
-                        continue
-                    assert ref.revision is not None, "Installer should receive RREV always"
-                    if node.binary == BINARY_UNKNOWN:
-                        self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
-                        if node.binary == BINARY_MISSING:
-                            self._raise_missing([node])
-                    _handle_system_requirements(conan_file, node.pref, self._cache, output)
-                    self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+        def _install_node(n):
+            self._install_node(n, keep_build, profile_host, profile_build, graph_lock, remotes,
+                               build_mode, update, using_build_profile, processed_package_refs)
+
+        nodes = [node for level in nodes_by_level for node in level]
+        parallel = self._cache.config.parallel_build_jobs
+        if parallel is not None and parallel > 1:
+            self._out.info("Installing binary packages in %s parallel threads" % parallel)
+            output_lock = threading.Lock()
+
+            def _install_func(n):
+                with _buffered_output(n.conanfile, self._out, output_lock):
+                    _install_node(n)
+        else:
+            parallel = 1
+            _install_func = _install_node
+
+        scheduler = _NodeScheduler(parallel)
+        download_pool = self._download(nodes, downloads, processed_package_refs, scheduler)
+        try:
+            scheduler.run(nodes, _install_func)
+        except BaseException:
+            if download_pool is not None:
+                download_pool.terminate()
+            raise
+        finally:
+            if download_pool is not None:
+                download_pool.join()
 
         # Finally, propagate information to root node (ref=None)
         self._propagate_info(root_node, using_build_profile)
 
+    def _install_node(self, node, keep_build, profile_host, profile_build, graph_lock, remotes,
+                      build_mode, update, using_build_profile, processed_package_refs):
+        ref, conan_file = node.ref, node.conanfile
+        output = conan_file.output
+
+        self._propagate_info(node, using_build_profile)
+        if node.binary == BINARY_EDITABLE:
+            with user_code_lock:
+                self._handle_node_editable(node, profile_host, profile_build, graph_lock)
+            # Need a temporary package revision for package_revision_mode
+            # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
+            node.prev = "editable"
+        else:
+            if node.binary == BINARY_SKIP:  # Privates not necessary
+                return
+            assert ref.revision is not None, "Installer should receive RREV always"
+            if node.binary == BINARY_UNKNOWN:
+                self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
+                if node.binary == BINARY_MISSING:
+                    self._raise_missing([node])
+            with user_code_lock:
+                _handle_system_requirements(conan_file, node.pref, self._cache, output)
+            self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+
     def _handle_node_editable(self, node, profile_host, profile_build, graph_lock):
         # Get source of information
         conanfile = node.conanfile
@@ -560,7 +755,9 @@ class BinaryInstaller(object):
             assert os.path.isdir(package_folder), ("Package '%s' folder must exist: %s\n"
                                                    % (str(pref), package_folder))
             # Call the info method
-            self._call_package_info(conanfile, package_folder, ref=pref.ref, is_editable=False)
+            with user_code_lock:
+                self._call_package_info(conanfile, package_folder, ref=pref.ref,
+                                        is_editable=False)
             self._recorder.package_cpp_info(pref, conanfile.cpp_info)
 
     def _build_package(self, node, output, keep_build, remotes):
@@ -1,6 +1,8 @@
+import binascii
 import fnmatch
 import imp
 import inspect
+import marshal
 import os
 import sys
 import uuid
@@ -18,14 +20,22 @@ from conans.model.options import OptionsValues
 from conans.model.ref import ConanFileReference
 from conans.model.settings import Settings
 from conans.paths import DATA_YML
-from conans.util.files import load
+from conans.util.files import load, mkdir
+from conans.util.sha import sha1
+
+# Compiled code of the recipes loaded by this process {(path, sha1 of the contents): code}
+_compiled_recipes = {}
+# Max number of compiled recipes persisted in the bytecode folder, the least recently used ones
+# are removed when exceeded
+BYTECODE_CACHE_SIZE = 1000
 
 
 class ConanFileLoader(object):
 
     def __init__(self, runner, output, python_requires, generator_manager=None, pyreq_loader=None,
-                 requester=None):
+                 requester=None, bytecode_folder=None):
         self._runner = runner
+        self._bytecode_folder = bytecode_folder
         self._generator_manager = generator_manager
         self._output = output
         self._pyreq_loader = pyreq_loader
@@ -59,7 +69,7 @@ class ConanFileLoader(object):
         try:
             self._python_requires.valid = True
             module, conanfile = parse_conanfile(conanfile_path, self._python_requires,
-                                                self._generator_manager)
+                                                self._generator_manager, self._bytecode_folder)
             self._python_requires.valid = False
 
             self._python_requires.locked_versions = None
@@ -102,7 +112,7 @@ class ConanFileLoader(object):
             to the provided generator list
             @param conanfile_module: the module to be processed
             """
-        conanfile_module, module_id = _parse_conanfile(conanfile_path)
+        conanfile_module, module_id = _parse_conanfile(conanfile_path, self._bytecode_folder)
         for name, attr in conanfile_module.__dict__.items():
             if (name.startswith("_") or not inspect.isclass(attr) or
                     attr.__dict__.get("__module__") != module_id):
@@ -374,9 +384,9 @@ def _parse_module(conanfile_module, module_id, generator_manager):
     return result
 
 
-def parse_conanfile(conanfile_path, python_requires, generator_manager):
+def parse_conanfile(conanfile_path, python_requires, generator_manager, bytecode_folder=None):
     with python_requires.capture_requires() as py_requires:
-        module, filename = _parse_conanfile(conanfile_path)
+        module, filename = _parse_conanfile(conanfile_path, bytecode_folder)
         try:
             conanfile = _parse_module(module, filename, generator_manager)
 
@@ -398,7 +408,76 @@ def parse_conanfile(conanfile_path, python_requires, generator_manager):
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
 
-def _parse_conanfile(conan_file_path):
+def _compile_conanfile(conan_file_path, bytecode_folder):
+    """ Every recipe is compiled only once per process. If bytecode_folder is defined, the code
+    is also persisted there (instead of the .pyc files next to the recipes), by the path and
+    contents of the conanfile and the magic number of the interpreter, up to
+    BYTECODE_CACHE_SIZE recipes
+    """
+    with open(conan_file_path, "rb") as f:
+        source = f.read()
+    key = conan_file_path, sha1(source)
+    code = _compiled_recipes.get(key)
+    if code is not None:
+        return code
+
+    bytecode_path = None
+    if bytecode_folder:
+        name = sha1(b"\0".join((conan_file_path.encode("utf-8"), source, imp.get_magic())))
+        bytecode_path = os.path.join(bytecode_folder, name)
+        try:
+            with open(bytecode_path, "rb") as f:
+                code = marshal.load(f)
+            os.utime(bytecode_path, None)  # Recently used, see _prune_bytecode()
+        except Exception:  # Not existing or corrupted, compile it
+            code = None
+    if code is None:
+        code = compile(source, conan_file_path, "exec", dont_inherit=True)
+        if bytecode_path:
+            _save_bytecode(bytecode_path, code)
+            _prune_bytecode(bytecode_folder)
+    _compiled_recipes[key] = code
+    return code
+
+
+def _save_bytecode(bytecode_path, code):
+    # Written to a temporary file and renamed, so other processes never read it incomplete
+    tmp_path = "%s.%s" % (bytecode_path, binascii.hexlify(os.urandom(4)).decode())
+    try:
+        mkdir(os.path.dirname(bytecode_path))
+        with open(tmp_path, "wb") as f:
+            marshal.dump(code, f)
+        os.rename(tmp_path, bytecode_path)
+    except (IOError, OSError):  # Read only cache, or in Windows, already saved by other process
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _prune_bytecode(bytecode_folder):
+    """ Removes the least recently used compiled recipes when there are more than
+    BYTECODE_CACHE_SIZE, down to 90% of it, so it is not done for every new recipe
+    """
+    try:
+        names = os.listdir(bytecode_folder)
+        if len(names) <= BYTECODE_CACHE_SIZE:
+            return
+        paths = [os.path.join(bytecode_folder, name) for name in names]
+        used = {}
+        for path in paths:
+            try:
+                used[path] = os.path.getmtime(path)
+            except OSError:  # Removed by other process
+                pass
+    except OSError:
+        return
+    for path in sorted(used, key=used.get)[:len(used) - int(BYTECODE_CACHE_SIZE * 0.9)]:
+        try:
+            os.remove(path)
+        except OSError:  # Removed by other process, or read only cache
+            pass
+
+
+def _parse_conanfile(conan_file_path, bytecode_folder=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -412,8 +491,8 @@ def _parse_conanfile(conan_file_path):
         old_modules = list(sys.modules.keys())
         with chdir(current_dir):
             old_dont_write_bytecode = sys.dont_write_bytecode
-            sys.dont_write_bytecode = True
-            loaded = imp.load_source(module_id, conan_file_path)
+            sys.dont_write_bytecode = True  # For the modules imported by the recipe
+            loaded = _load_module(module_id, conan_file_path, bytecode_folder)
             sys.dont_write_bytecode = old_dont_write_bytecode
 
         required_conan_version = getattr(loaded, "required_conan_version", None)
@@ -422,7 +501,11 @@ def _parse_conanfile(conan_file_path):
 
         # These lines are necessary, otherwise local conanfile imports with same name
         # collide, but no error, and overwrite other packages imports!!
-        added_modules = set(sys.modules).difference(old_modules)
+        # Most recipes only import already imported modules (plus the recipe itself)
+        if len(sys.modules) > len(old_modules) + 1:
+            added_modules = set(sys.modules).difference(old_modules)
+        else:
+            added_modules = (module_id, )
         for added in added_modules:
             module = sys.modules[added]
             if module:
@@ -451,3 +534,18 @@ def _parse_conanfile(conan_file_path):
         sys.path.pop(0)
 
     return loaded, module_id
+
+
+def _load_module(module_id, conan_file_path, bytecode_folder):
+    """ same as imp.load_source(), but with the cached compiled code of the conanfile
+    """
+    code = _compile_conanfile(conan_file_path, bytecode_folder)
+    module = imp.new_module(module_id)
+    module.__file__ = conan_file_path
+    sys.modules[module_id] = module
+    try:
+        exec(code, module.__dict__)
+    except BaseException:
+        del sys.modules[module_id]
+        raise
+    return module
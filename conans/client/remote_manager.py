@@ -9,11 +9,14 @@ from conans import DEFAULT_REVISION_V1
 from conans.client.cache.remote_registry import Remote
 from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
     NoRestV2Available, PackageNotFoundException
-from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, rm_conandir
+from conans.model.manifest import FileTreeManifest
+from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, \
+    PACKAGE_TZST_NAME, rm_conandir
 from conans.search.search import filter_packages
 from conans.util import progress_bar
 from conans.util.env_reader import get_env
-from conans.util.files import make_read_only, mkdir, tar_extract, touch_folder, md5sum, sha1sum
+from conans.util.files import make_read_only, mkdir, tar_extract, touch_folder, md5sum, sha1sum, \
+    zstd_available
 from conans.util.log import logger
 # FIXME: Eventually, when all output is done, tracer functions should be moved to the recorder class
 from conans.util.tracer import (log_package_download,
@@ -194,7 +197,8 @@ class RemoteManager(object):
             duration = time.time() - t1
             log_package_download(pref, duration, remote, zipped_files)
 
-            tgz_file = zipped_files.pop(PACKAGE_TGZ_NAME, None)
+            tzst_file = zipped_files.pop(PACKAGE_TZST_NAME, None)
+            tgz_file = zipped_files.pop(PACKAGE_TGZ_NAME, None) or tzst_file
             check_compressed_files(PACKAGE_TGZ_NAME, zipped_files)
             package_folder = layout.package(pref)
             if tgz_file:  # This must happen always, but just in case
@@ -203,6 +207,9 @@ class RemoteManager(object):
             mkdir(package_folder)  # Just in case it doesn't exist, because uncompress did nothing
             for file_name, file_path in zipped_files.items():  # copy CONANINFO and CONANMANIFEST
                 shutil.move(file_path, os.path.join(package_folder, file_name))
+            object_store = self._cache.object_store
+            if object_store:
+                object_store.add_folder(package_folder, FileTreeManifest.load(package_folder))
 
             # Issue #214 https://github.com/conan-io/conan/issues/214
             touch_folder(package_folder)
@@ -218,6 +225,9 @@ class RemoteManager(object):
             output.error("Exception: %s %s" % (type(e), str(e)))
             raise
 
+    def server_capable(self, remote, capability):
+        return self._call_remote(remote, "server_capable", capability)
+
     def search_recipes(self, remote, pattern=None, ignorecase=True):
         """
         returns (dict str(ref): {packages_info}
@@ -307,11 +317,24 @@ def is_package_snapshot_complete(snapshot):
     return True
 
 
+def discarded_package_tgz(files):
+    """ The server can have the package compressed in both formats, only one is downloaded:
+    the zstd one if this client can extract it
+    """
+    if PACKAGE_TZST_NAME in files and PACKAGE_TGZ_NAME in files:
+        return PACKAGE_TGZ_NAME if zstd_available() else PACKAGE_TZST_NAME
+
+
 def check_compressed_files(tgz_name, files):
     bare_name = os.path.splitext(tgz_name)[0]
     for f in files:
         if f == tgz_name:
             continue
+        if tgz_name == PACKAGE_TGZ_NAME and f == PACKAGE_TZST_NAME:
+            if not zstd_available():
+                raise ConanException("The package is compressed with zstd, install the "
+                                     "'zstandard' python package to extract it.")
+            continue
         if bare_name == os.path.splitext(f)[0]:
             raise ConanException("This Conan version is not prepared to handle '%s' file format. "
                                  "Please upgrade conan client." % f)
@@ -322,7 +345,7 @@ def uncompress_file(src_path, dest_folder, output):
     try:
         with progress_bar.open_binary(src_path, output, "Decompressing %s" % os.path.basename(
             src_path)) as file_handler:
-            tar_extract(file_handler, dest_folder)
+            tar_extract(file_handler, dest_folder, zstd=src_path.endswith(".tzst"))
     except Exception as e:
         error_msg = "Error while downloading/extracting files to %s\n%s\n" % (dest_folder, str(e))
         # try to remove the files
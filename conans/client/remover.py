@@ -225,6 +225,9 @@ class ConanRemover(object):
 
         if not remote_name:
             self._cache.delete_empty_dirs(deleted_refs)
+            object_store = self._cache.object_store
+            if object_store and deleted_refs:
+                object_store.prune()
 
     def _ask_permission(self, ref, src, build_ids, package_ids_filter, force):
         def stringlist(alist):
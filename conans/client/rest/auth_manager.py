@@ -12,6 +12,8 @@ Flow:
 """
 
 import hashlib
+import threading
+from contextlib import contextmanager
 from uuid import getnode as get_mac
 
 from conans.client.cmd.user import update_localdb
@@ -20,6 +22,21 @@ from conans.util.log import logger
 
 LOGIN_RETRIES = 3
 
+_local = threading.local()
+
+
+@contextmanager
+def non_interactive_calls():
+    """ The rest calls of the current thread that require authentication raise the
+    AuthenticationException, instead of requesting the user credentials or refreshing the tokens,
+    i.e. in the threads looking up in the remotes in background
+    """
+    _local.non_interactive = True
+    try:
+        yield
+    finally:
+        _local.non_interactive = False
+
 
 class ConanApiAuthManager(object):
 
@@ -42,6 +59,8 @@ class ConanApiAuthManager(object):
         except ForbiddenException:
             raise ForbiddenException("Permission denied for user: '%s'" % user)
         except AuthenticationException:
+            if getattr(_local, "non_interactive", False):
+                raise
             # User valid but not enough permissions
             if user is None or token is None:
                 # token is None when you change user with user command
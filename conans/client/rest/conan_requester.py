@@ -2,6 +2,7 @@ import fnmatch
 import logging
 import os
 import platform
+import threading
 import time
 import warnings
 
@@ -10,6 +11,8 @@ import requests
 from requests.adapters import HTTPAdapter
 
 from conans import __version__ as client_version
+from conans.client.rest.http2_session import Http2Session, http2_available
+from conans.errors import ConanException
 from conans.util.files import save
 from conans.util.tracer import log_client_rest_api_call
 
@@ -18,6 +21,19 @@ from conans.util.tracer import log_client_rest_api_call
 # TODO: Fix this security warning
 logging.captureWarnings(True)
 
+# The adapters own the urllib3 pools of keep-alive connections, they are shared by all the
+# requesters of the process, so the connections to the remotes are reused by the different
+# ConanAPI instances and commands {(retry, pool_size): HTTPAdapter}
+_adapters = {}
+_adapters_lock = threading.Lock()
+
+
+def _pool_size(config):
+    """ Enough connections per host for all the parallel downloads and uploads threads
+    """
+    return max(requests.adapters.DEFAULT_POOLSIZE, config.parallel_download or 0,
+               config.parallel_upload_files or 0)
+
 
 class ConanRequester(object):
 
@@ -25,11 +41,17 @@ class ConanRequester(object):
         if http_requester:
             self._http_requester = http_requester
         else:
+            pool_size = _pool_size(config)
+            adapter = self._get_adapter(config.retry, pool_size)
             self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=self._get_retries(config.retry))
-
             self._http_requester.mount("http://", adapter)
             self._http_requester.mount("https://", adapter)
+            if config.http_transport == "http2":
+                if not http2_available():
+                    raise ConanException("The 'http2' transport requires the 'httpx[http2]' "
+                                         "package, install it with 'pip install httpx[http2]'")
+                self._http_requester = Http2Session(self._http_requester, pool_size,
+                                                    self._get_retries(config.retry))
 
         self._timeout_seconds = config.request_timeout
         self.proxies = config.proxies or {}
@@ -63,6 +85,16 @@ class ConanRequester(object):
             else:
                 self._client_certificates = self._client_cert_path
 
+    def _get_adapter(self, retry, pool_size):
+        key = retry, pool_size
+        with _adapters_lock:
+            adapter = _adapters.get(key)
+            if adapter is None:
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                      max_retries=self._get_retries(retry))
+                _adapters[key] = adapter
+        return adapter
+
     def _get_retries(self, retry):
         retry = retry if retry is not None else 2
         if retry == 0:
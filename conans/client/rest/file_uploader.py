@@ -49,7 +49,10 @@ class FileUploader(object):
             return response
 
     def upload(self, url, abs_path, auth=None, dedup=False, retry=None, retry_wait=None,
-               headers=None, display_name=None):
+               headers=None, display_name=None, progress=True):
+        """ :param progress: False to not display the progress bar, i.e. when other files are
+        being uploaded concurrently, just a line when the upload is completed
+        """
         retry = retry if retry is not None else self._config.retry
         retry = retry if retry is not None else 1
         retry_wait = retry_wait if retry_wait is not None else self._config.retry_wait
@@ -65,7 +68,7 @@ class FileUploader(object):
 
         for counter in range(retry + 1):
             try:
-                return self._upload_file(url, abs_path, headers, auth, display_name)
+                return self._upload_file(url, abs_path, headers, auth, display_name, progress)
             except (NotFoundException, ForbiddenException, AuthenticationException,
                     RequestErrorException):
                 raise
@@ -78,7 +81,7 @@ class FileUploader(object):
                         self._output.info("Waiting %d seconds to retry..." % retry_wait)
                     time.sleep(retry_wait)
 
-    def _upload_file(self, url, abs_path,  headers, auth, display_name):
+    def _upload_file(self, url, abs_path,  headers, auth, display_name, progress=True):
         file_size = os.stat(abs_path).st_size
         file_name = os.path.basename(abs_path)
         description = "Uploading {}".format(file_name)
@@ -95,14 +98,18 @@ class FileUploader(object):
                 yield chunk
 
         with open(abs_path, mode='rb') as file_handler:
-            progress = progress_bar.Progress(file_size, self._output, description, post_description)
-            data = progress.update(load_in_chunks(file_handler))
+            output = self._output if progress else None
+            pb = progress_bar.Progress(file_size, output, description, post_description)
+            data = pb.update(load_in_chunks(file_handler))
             iterable_to_file = IterableToFileAdapter(data, file_size)
             try:
                 response = self._requester.put(url, data=iterable_to_file, verify=self._verify_ssl,
                                                headers=headers, auth=auth)
                 self._handle_400_response(response, auth)
                 response.raise_for_status()  # Raise HTTPError for bad http response status
+                if not progress and self._output and self._output.is_terminal:
+                    self._output.writeln(progress_bar.left_justify_message(
+                        "{} [{:1.2f}k]".format(post_description, file_size / 1024.0)))
                 return response
             except ConanException:
                 raise
@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+
+import requests
+import six
+from requests.auth import HTTPBasicAuth
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx clients shared by all the Http2Sessions of the process, every client multiplexes the
+# requests to every server over a single HTTP/2 connection {(verify, cert): httpx.Client}
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def http2_available():
+    return httpx is not None
+
+
+class Http2Session(object):
+    """ requests.Session like transport, sending the requests over HTTP/2 with httpx, so the many
+    small requests of a command (revisions, snapshots, conaninfo.txt files...) to a server are
+    multiplexed over the same connection. Servers not supporting HTTP/2 (or plain http) are
+    used with HTTP/1.1 keep-alive connections.
+
+    The uploads, the requests through proxies and the ones with arguments not supported here
+    are sent with the given requests.Session. The redirects are followed, and the retries, the
+    urllib3.Retry (or 0) of the requests.Session adapters, applied as urllib3 does: the
+    connection errors for all the methods, the other errors and the responses with a status in
+    retries.status_forcelist only for the idempotent GET and DELETE.
+    """
+
+    _idempotent = ("GET", "DELETE")
+
+    def __init__(self, session, pool_size, retries=0):
+        self._session = session
+        self._pool_size = pool_size
+        self._retries = retries
+
+    def mount(self, prefix, adapter):
+        self._session.mount(prefix, adapter)
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._request("DELETE", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._session.put(url, **kwargs)
+
+    def _client(self, verify, cert):
+        key = verify, cert
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                limits = httpx.Limits(max_connections=self._pool_size,
+                                      max_keepalive_connections=self._pool_size)
+                client = httpx.Client(http2=True, verify=verify, cert=cert, limits=limits,
+                                      timeout=None, follow_redirects=True)
+                _clients[key] = client
+        return client
+
+    def _request(self, method, url, data=None, json=None, headers=None, auth=None, verify=True,
+                 cert=None, proxies=None, timeout=None, stream=False, allow_redirects=True,
+                 **kwargs):
+        if proxies or kwargs or not (data is None or isinstance(data, (six.string_types, bytes,
+                                                                          dict))):
+            return getattr(self._session, method.lower())(url, data=data, json=json,
+                                                          headers=headers, auth=auth,
+                                                          verify=verify, cert=cert,
+                                                          proxies=proxies, timeout=timeout,
+                                                          stream=stream,
+                                                          allow_redirects=allow_redirects,
+                                                          **kwargs)
+        if isinstance(data, six.text_type):
+            data = data.encode("utf-8")
+        # The requests authentications (JWT, basic...) modify the headers of a requests.Request,
+        # that also encodes the json and form bodies
+        prepared = requests.Request(method, url, headers=headers, data=data, json=json).prepare()
+        if auth is not None:
+            if isinstance(auth, tuple):
+                auth = HTTPBasicAuth(*auth)
+            prepared = auth(prepared)
+        client = self._client(verify, cert)
+        retries = self._retries.total if self._retries else 0
+        backoff = 0
+        while True:
+            request = client.build_request(method, prepared.url, headers=dict(prepared.headers),
+                                           content=prepared.body, timeout=timeout)
+            try:
+                response = client.send(request, stream=stream, follow_redirects=allow_redirects)
+            except httpx.TransportError as e:
+                if retries <= 0 or not (isinstance(e, httpx.ConnectError) or
+                                        method in self._idempotent):
+                    raise requests.ConnectionError(str(e))
+            else:
+                if (retries <= 0 or method not in self._idempotent or
+                        response.status_code not in self._retries.status_forcelist):
+                    return Http2Response(response)
+                response.close()
+            retries -= 1
+            time.sleep(backoff)
+            backoff = max(backoff * 2, self._retries.backoff_factor)
+
+
+class Http2Response(object):
+    """ The requests.Response interface used by the rest clients and downloaders
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.reason = response.reason_phrase
+        self.url = str(response.url)
+        self.charset = None
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def content(self):
+        return self._response.read()
+
+    @property
+    def text(self):
+        encoding = self.charset or self._response.encoding or "utf-8"
+        return self.content.decode(encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def iter_content(self, chunk_size=1):
+        for chunk in self._response.iter_bytes(chunk_size):
+            yield chunk
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError("%s %s for url: %s" % (self.status_code, self.reason,
+                                                            self.url), response=self)
+
+    def close(self):
+        self._response.close()
@@ -149,6 +149,9 @@ class RestApiClient(object):
     def remove_packages(self, ref, package_ids=None):
         return self._get_api().remove_packages(ref, package_ids)
 
+    def server_capable(self, capability):
+        return self._capable(capability)
+
     def server_capabilities(self):
         return self._get_api().server_capabilities()
 
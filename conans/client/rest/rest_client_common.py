@@ -1,4 +1,5 @@
 import json
+from multiprocessing.pool import ThreadPool
 
 from requests.auth import AuthBase, HTTPBasicAuth
 
@@ -76,6 +77,33 @@ class RestCommonMethods(object):
     def auth(self):
         return JWTAuth(self.token)
 
+    def _upload_files_in_order(self, filenames, upload_file):
+        """ conan_package.tgz and conan_export.tgz are uploaded first to avoid uploading
+        conaninfo.txt or conanamanifest.txt with missing files due to a network failure. The files
+        of every group are uploaded concurrently, by up to "general.parallel_upload_files" threads,
+        then upload_file(filename, progress=False) is called, to not mix their progress bars
+        """
+        filenames = sorted(filenames)
+        compressed = [f for f in filenames if f.endswith((".tgz", ".tzst"))]
+        groups = [compressed, [f for f in filenames if f not in compressed]]
+        jobs = self._config.parallel_upload_files or 1
+        if jobs == 1:
+            for group in groups:
+                for filename in group:
+                    upload_file(filename)
+            return
+
+        def upload_file_without_progress(filename):
+            upload_file(filename, progress=False)
+
+        pool = ThreadPool(jobs)
+        try:
+            for group in groups:
+                pool.map(upload_file_without_progress, group)
+        finally:
+            pool.close()
+            pool.join()
+
     @staticmethod
     def _check_error_response(ret):
         if ret.status_code == 401:
@@ -229,12 +257,12 @@ class RestCommonMethods(object):
         return snap
 
     def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait):
+        if deleted:
+            # i.e. the archive of the other compression format. The files of a package can't be
+            # removed, so the package is removed before uploading all its files again
+            self._remove_package(pref)
         if files_to_upload:
             self._upload_package(pref, files_to_upload, retry, retry_wait)
-        if deleted:
-            raise Exception("This shouldn't be happening, deleted files "
-                            "in local package present in remote: %s.\n Please, report it at "
-                            "https://github.com/conan-io/conan/issues " % str(deleted))
 
     def search(self, pattern=None, ignorecase=True):
         """
@@ -7,7 +7,7 @@ from six.moves.urllib.parse import parse_qs, urljoin, urlparse, urlsplit
 
 from conans.client.downloaders.download import run_downloader
 from conans.client.downloaders.file_downloader import FileDownloader
-from conans.client.remote_manager import check_compressed_files
+from conans.client.remote_manager import check_compressed_files, discarded_package_tgz
 from conans.client.rest.client_routes import ClientV1Router
 from conans.client.rest.file_uploader import FileUploader
 from conans.client.rest.rest_client_common import RestCommonMethods, handle_return_deserializer
@@ -158,9 +158,9 @@ class RestV1Methods(RestCommonMethods):
         t1 = time.time()
         failed = []
         uploader = FileUploader(self.requester, output, self.verify_ssl, self._config)
-        # conan_package.tgz and conan_export.tgz are uploaded first to avoid uploading conaninfo.txt
-        # or conanamanifest.txt with missing files due to a network failure
-        for filename, resource_url in sorted(file_urls.items()):
+
+        def upload_file(filename, progress=True):
+            resource_url = file_urls[filename]
             if output and not output.is_terminal:
                 msg = "Uploading: %s" % filename if not display_name else (
                     "Uploading %s -> %s" % (filename, display_name))
@@ -170,11 +170,13 @@ class RestV1Methods(RestCommonMethods):
                 headers = self._artifacts_properties if not self._matrix_params else {}
                 uploader.upload(resource_url, files[filename], auth=auth, dedup=dedup,
                                 retry=retry, retry_wait=retry_wait,
-                                headers=headers, display_name=display_name)
+                                headers=headers, display_name=display_name,
+                                progress=progress)
             except Exception as exc:
                 output.error("\nError uploading file: %s, '%s'" % (filename, exc))
                 failed.append(filename)
 
+        self._upload_files_in_order(file_urls, upload_file)
         if failed:
             raise ConanException("Execute upload again to retry upload the failed files: %s"
                                  % ", ".join(failed))
@@ -234,6 +236,7 @@ class RestV1Methods(RestCommonMethods):
 
     def get_package(self, pref, dest_folder):
         urls = self._get_package_urls(pref)
+        urls.pop(discarded_package_tgz(urls), None)
         check_compressed_files(PACKAGE_TGZ_NAME, urls)
         md5s = self.get_package_snapshot(pref) if self._config.download_cache else None
         zipped_files = self._download_files_to_folder(urls, dest_folder, md5s)
@@ -302,6 +305,9 @@ class RestV1Methods(RestCommonMethods):
         url = self.router.remove_recipe_files(ref)
         return self._post_json(url, payload)
 
+    def _remove_package(self, pref):
+        self.remove_packages(pref.ref, [pref.id])
+
     @handle_return_deserializer()
     def remove_packages(self, ref, package_ids):
         """ Remove any packages specified by package_ids"""
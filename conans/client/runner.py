@@ -5,7 +5,7 @@ from subprocess import PIPE, Popen, STDOUT
 
 import six
 
-from conans.client.tools import environment_append
+from conans.client.tools import environment_append, no_op
 from conans.errors import ConanException
 from conans.util.files import decode_text
 from conans.util.runners import pyinstaller_bundle_env_cleaned
@@ -29,13 +29,17 @@ class ConanRunner(object):
         self._log_run_to_output = log_run_to_output
         self._output = output
 
-    def __call__(self, command, output=True, log_filepath=None, cwd=None, subprocess=False):
+    def __call__(self, command, output=True, log_filepath=None, cwd=None, subprocess=False,
+                 while_running=None):
         """
         @param command: Command to execute
         @param output: Instead of print to sys.stdout print to that stream. Could be None
         @param log_filepath: If specified, also log to a file
         @param cwd: Move to directory to execute
+        @param while_running: Context manager entered once the command has been started, while
+        waiting for it to finish
         """
+        while_running = while_running or no_op
         if output and isinstance(output, io.StringIO) and six.PY2:
             # in py2 writing to a StringIO requires unicode, otherwise it fails
             print("*** WARN: Invalid output parameter of type io.StringIO(), "
@@ -61,18 +65,20 @@ class ConanRunner(object):
                 # No output has to be redirected to logs or buffer or omitted
                 if (output is True and not self._output and not log_filepath and self._log_run_to_output
                         and not subprocess):
-                    return self._simple_os_call(command, cwd)
+                    return self._simple_os_call(command, cwd, while_running)
                 elif log_filepath:
                     if stream_output:
                         stream_output.write("Logging command output to file '%s'\n" % (log_filepath,))
                     with open(log_filepath, "a+") as log_handler:
                         if self._print_commands_to_output:
                             log_handler.write(call_message)
-                        return self._pipe_os_call(command, stream_output, log_handler, cwd, user_output)
+                        return self._pipe_os_call(command, stream_output, log_handler, cwd,
+                                                  user_output, while_running)
                 else:
-                    return self._pipe_os_call(command, stream_output, None, cwd, user_output)
+                    return self._pipe_os_call(command, stream_output, None, cwd, user_output,
+                                              while_running)
 
-    def _pipe_os_call(self, command, stream_output, log_handler, cwd, user_output):
+    def _pipe_os_call(self, command, stream_output, log_handler, cwd, user_output, while_running):
 
         try:
             # piping both stdout, stderr and then later only reading one will hang the process
@@ -108,16 +114,23 @@ class ConanRunner(object):
                     # tried to open the log_handler binary but same result.
                     log_handler.write(line if six.PY2 else decoded_line)
 
-        if capture_output:
-            get_stream_lines(proc.stdout)
+        with while_running():
+            if capture_output:
+                get_stream_lines(proc.stdout)
 
-        proc.communicate()
+            proc.communicate()
         ret = proc.returncode
         return ret
 
     @staticmethod
-    def _simple_os_call(command, cwd):
+    def _simple_os_call(command, cwd, while_running):
         try:
-            return subprocess.call(command, cwd=cwd, shell=isinstance(command, six.string_types))
+            proc = Popen(command, cwd=cwd, shell=isinstance(command, six.string_types))
         except Exception as e:
             raise ConanException("Error while executing '%s'\n\t%s" % (command, str(e)))
+        with while_running():
+            try:
+                return proc.wait()
+            except BaseException:  # i.e. KeyboardInterrupt, like subprocess.call()
+                proc.kill()
+                raise
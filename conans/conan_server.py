@@ -10,10 +10,15 @@ def run():
                         help='Run the pending migrations')
     parser.add_argument('--server_dir', '-d', default=None,
                         help='Specify where to store server config and data.')
+    parser.add_argument('--reindex', default=False, action='store_true',
+                        help='Rebuild the search index from the storage, and exit')
     args = parser.parse_args()
     launcher = ServerLauncher(force_migration=args.migrate,
                               server_dir=args.server_dir or get_env("CONAN_SERVER_HOME"))
-    launcher.launch()
+    if args.reindex:
+        launcher.reindex()
+    else:
+        launcher.launch()
 
 
 if __name__ == '__main__':
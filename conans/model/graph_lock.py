@@ -2,6 +2,13 @@ import json
 import os
 from collections import OrderedDict
 
+import six
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # FIXME: Remove if Python2 support is removed
+    from collections import MutableMapping
+
 from conans import DEFAULT_REVISION_V1
 from conans.client.graph.graph import RECIPE_VIRTUAL, RECIPE_CONSUMER
 from conans.client.graph.python_requires import PyRequires
@@ -11,11 +18,37 @@ from conans.errors import ConanException
 from conans.model.info import PACKAGE_ID_UNKNOWN
 from conans.model.options import OptionsValues
 from conans.model.ref import ConanFileReference
+from conans.util.env_reader import get_env
 from conans.util.files import load, save
 
 LOCKFILE = "conan.lock"
 LOCKFILE_VERSION = "0.4"
 
+# Parsed json of the lockfiles loaded by this process {abs path: (file stamp, json)}, as the
+# lockfiles of a bundle are loaded many times. The cached json is never modified
+_parsed_lockfiles = {}
+
+
+def _load_json(path):
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = getattr(st, "st_mtime_ns", st.st_mtime), st.st_size
+    cached = _parsed_lockfiles.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    graph_json = json.loads(load(path))
+    _parsed_lockfiles[path] = stamp, graph_json
+    return graph_json
+
+
+def lockfile_dumps(data, indent):
+    """ Lockfiles and bundles are pretty printed json, unless the compact encoding (without
+    whitespace) is activated with "general.compact_lockfiles" (CONAN_COMPACT_LOCKFILES)
+    """
+    if get_env("CONAN_COMPACT_LOCKFILES", False):
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=indent)
+
 
 class GraphLockFile(object):
 
@@ -42,9 +75,8 @@ class GraphLockFile(object):
             raise IOError("Invalid path")
         if not os.path.isfile(path):
             raise ConanException("Missing lockfile in: %s" % path)
-        content = load(path)
         try:
-            return GraphLockFile._loads(content, revisions_enabled)
+            return GraphLockFile._deserialize(_load_json(path), revisions_enabled)
         except Exception as e:
             raise ConanException("Error parsing lockfile '{}': {}".format(path, e))
 
@@ -54,7 +86,10 @@ class GraphLockFile(object):
 
     @staticmethod
     def _loads(text, revisions_enabled):
-        graph_json = json.loads(text)
+        return GraphLockFile._deserialize(json.loads(text), revisions_enabled)
+
+    @staticmethod
+    def _deserialize(graph_json, revisions_enabled):
         version = graph_json.get("version")
         if version:
             if version != LOCKFILE_VERSION:
@@ -90,7 +125,7 @@ class GraphLockFile(object):
             result["profile_host"] = self._profile_host.dumps()
         if self._profile_build:
             result["profile_build"] = self._profile_build.dumps()
-        return json.dumps(result, indent=True)
+        return lockfile_dumps(result, indent=True)
 
     def only_recipes(self):
         self._graph_lock.only_recipes()
@@ -218,6 +253,8 @@ class GraphLockNode(object):
 
     @property
     def options(self):
+        if isinstance(self._options, six.string_types):  # Decoded the first time it is used
+            self._options = OptionsValues.loads(self._options)
         return self._options
 
     def only_recipe(self):
@@ -238,12 +275,12 @@ class GraphLockNode(object):
         if python_requires:
             python_requires = [ConanFileReference.loads(py_req, validate=False)
                                for py_req in python_requires]
-        options = data.get("options")
-        options = OptionsValues.loads(options) if options else None
+        options = data.get("options") or None  # Decoded lazily, the first time it is used
         modified = data.get("modified")
         context = data.get("context")
-        requires = data.get("requires", [])
-        build_requires = data.get("build_requires", [])
+        # Copied, the data can be the cached json of the lockfile
+        requires = list(data.get("requires", []))
+        build_requires = list(data.get("build_requires", []))
         path = data.get("path")
         return GraphLockNode(ref, package_id, prev, python_requires, options, requires,
                              build_requires, path, revisions_enabled, context, modified)
@@ -256,7 +293,10 @@ class GraphLockNode(object):
         if self._ref:
             result["ref"] = repr(self._ref)
         if self._options:
-            result["options"] = self._options.dumps()
+            options = self._options  # If it was never decoded, it is saved as it was
+            if not isinstance(options, six.string_types):
+                options = options.dumps()
+            result["options"] = options
         if self._package_id:
             result["package_id"] = self._package_id
         if self._prev:
@@ -276,12 +316,66 @@ class GraphLockNode(object):
         return result
 
 
+class _LazyLockNodes(MutableMapping):
+    """ {id: GraphLockNode} of a lockfile. The nodes of a deserialized lockfile are decoded from
+    their json the first time they are accessed, so commands only pay for the nodes they use.
+    ref() and field() read a node without decoding it
+    """
+
+    def __init__(self, nodes_json, revisions_enabled):
+        self._nodes = dict(nodes_json)  # {id: GraphLockNode or its json}
+        self._revisions_enabled = revisions_enabled
+
+    def __getitem__(self, id_):
+        node = self._nodes[id_]
+        if not isinstance(node, GraphLockNode):
+            node = GraphLockNode.deserialize(node, self._revisions_enabled)
+            self._nodes[id_] = node
+        return node
+
+    def __setitem__(self, id_, node):
+        self._nodes[id_] = node
+
+    def __delitem__(self, id_):
+        del self._nodes[id_]
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, id_):
+        return id_ in self._nodes
+
+    def ref(self, id_):
+        node = self._nodes[id_]
+        if isinstance(node, GraphLockNode):
+            return node.ref
+        json_ref = node.get("ref")
+        return ConanFileReference.loads(json_ref) if json_ref else None
+
+    def field(self, id_, name):
+        """ the json value of the "requires", "build_requires", "python_requires",
+        "package_id", "prev" or "context" of the node
+        """
+        node = self._nodes[id_]
+        if not isinstance(node, GraphLockNode):
+            return node.get(name)
+        value = getattr(node, name)
+        if name == "python_requires" and value:
+            return [repr(r) for r in value]
+        return value
+
+
 class GraphLock(object):
 
     def __init__(self, deps_graph, revisions_enabled):
-        self._nodes = {}  # {id: GraphLockNode}
+        self._nodes = _LazyLockNodes({}, revisions_enabled)  # {id: GraphLockNode}
         self._revisions_enabled = revisions_enabled
         self._relaxed = False  # If True, the lock can be expanded with new Nodes
+        # Lazily computed indexes of the nodes IDs, to find them without scanning all the nodes
+        self._index = None  # {index name: {key: [ids]}}, see _find()
 
         if deps_graph is None:
             return
@@ -359,15 +453,14 @@ class GraphLock(object):
         # First do a topological order by levels, the ids of the nodes are stored
         levels = []
         opened = list(self._nodes.keys())
+        # Read without decoding the nodes, most of them are not built
+        field = self._nodes.field
         while opened:
             current_level = []
             for o in opened:
-                node = self._nodes[o]
-                requires = node.requires
-                if node.python_requires:
-                    requires += node.python_requires
-                if node.build_requires:
-                    requires += node.build_requires
+                requires = list(field(o, "requires") or [])
+                requires += field(o, "python_requires") or []
+                requires += field(o, "build_requires") or []
                 if not any(n in opened for n in requires):
                     current_level.append(o)
 
@@ -383,19 +476,21 @@ class GraphLock(object):
         for level in levels:
             new_level = []
             for id_ in level:
-                locked_node = self._nodes[id_]
-                if locked_node.prev is None and locked_node.package_id is not None:
-                    # Manipulate the ref so it can be used directly in install command
-                    ref = repr(locked_node.ref)
-                    if not self._revisions_enabled:
-                        if "@" not in ref:
-                            ref += "@"
-                    else:
-                        if "@" not in ref:
-                            ref = ref.replace("#", "@#")
-                    if (ref, locked_node.package_id, locked_node.context) not in total_prefs:
-                        new_level.append((ref, locked_node.package_id, locked_node.context, id_))
-                        total_prefs.add((ref, locked_node.package_id, locked_node.context))
+                package_id = field(id_, "package_id")
+                if field(id_, "prev") is not None or package_id is None:
+                    continue
+                # Manipulate the ref so it can be used directly in install command
+                ref = repr(self._nodes.ref(id_))
+                if not self._revisions_enabled:
+                    if "@" not in ref:
+                        ref += "@"
+                else:
+                    if "@" not in ref:
+                        ref = ref.replace("#", "@#")
+                context = field(id_, "context")
+                if (ref, package_id, context) not in total_prefs:
+                    new_level.append((ref, package_id, context, id_))
+                    total_prefs.add((ref, package_id, context))
             if new_level:
                 result.append(new_level)
 
@@ -458,8 +553,7 @@ class GraphLock(object):
             raise ConanException("Lockfile revisions: '%s' != Current revisions '%s'"
                                  % (revs_enabled, revisions_enabled))
         graph_lock = GraphLock(deps_graph=None, revisions_enabled=revisions_enabled)
-        for id_, node in data["nodes"].items():
-            graph_lock._nodes[id_] = GraphLockNode.deserialize(node, revisions_enabled)
+        graph_lock._nodes = _LazyLockNodes(data["nodes"], revisions_enabled)
 
         return graph_lock
 
@@ -596,11 +690,9 @@ class GraphLock(object):
             version_range = version[1:-1]
 
         if version_range:
-            for id_, node in self._nodes.items():
-                root_ref = node.ref
-                if (root_ref is not None and ref.name == root_ref.name and
-                        ref.user == root_ref.user and
-                        ref.channel == root_ref.channel):
+            for id_ in self._find("name", ref.name):
+                root_ref = self._nodes[id_].ref
+                if ref.user == root_ref.user and ref.channel == root_ref.channel:
                     output = []
                     result = satisfying([str(root_ref.version)], version_range, output)
                     if result:
@@ -608,16 +700,35 @@ class GraphLock(object):
         else:
             search_ref = repr(ref)
             if ref.revision:  # Search by exact ref (with RREV)
-                node_id = self._find_first(lambda n: n.ref and repr(n.ref) == search_ref)
+                node_id = self._find_first("repr", search_ref)
             else:  # search by ref without RREV
-                node_id = self._find_first(lambda n: n.ref and str(n.ref) == search_ref)
+                node_id = self._find_first("str", search_ref)
             if node_id:
                 return node_id
 
-    def _find_first(self, predicate):
-        """ find the first node in the graph matching the predicate"""
-        for id_, node in sorted(self._nodes.items()):
-            if predicate(node):
+    @staticmethod
+    def _index_keys(ref):
+        if not ref:
+            return (("consumer", None), )
+        return ("repr", repr(ref)), ("str", str(ref)), ("name", ref.name)
+
+    def _find(self, index, key):
+        """ returns the IDs of the nodes with that key in the given index: "repr" (repr(ref)),
+        "str" (str(ref)), "name" (ref.name) or "consumer" (None, nodes without reference)
+        """
+        if self._index is None:
+            self._index = {"repr": {}, "str": {}, "name": {}, "consumer": {}}
+            for id_ in self._nodes:  # Without decoding the nodes
+                for index_name, index_key in self._index_keys(self._nodes.ref(id_)):
+                    self._index[index_name].setdefault(index_key, []).append(id_)
+        return self._index[index].get(key, [])
+
+    def _find_first(self, index, key, predicate=None):
+        """ find the first node (sorted by ID) with that key in the index, and matching the
+        predicate
+        """
+        for id_ in sorted(self._find(index, key)):
+            if predicate is None or predicate(self._nodes[id_]):
                 return id_
 
     def get_consumer(self, ref):
@@ -631,20 +742,18 @@ class GraphLock(object):
         # None reference
         if ref is None or ref.name is None:
             # Is a conanfile.txt consumer
-            node_id = self._find_first(lambda n: not n.ref and n.path)
+            node_id = self._find_first("consumer", None, lambda n: n.path)
             if node_id:
                 return node_id
         else:
             assert ref.revision is None
 
-            repr_ref = repr(ref)
-            str_ref = str(ref)
             node_id = (  # First search by exact ref with RREV
-                       self._find_first(lambda n: n.ref and repr(n.ref) == repr_ref) or
+                       self._find_first("repr", repr(ref)) or
                        # If not mathing, search by exact ref without RREV
-                       self._find_first(lambda n: n.ref and str(n.ref) == str_ref) or
+                       self._find_first("str", str(ref)) or
                        # Or it could be a local consumer (n.path defined), search only by name
-                       self._find_first(lambda n: n.ref and n.ref.name == ref.name and n.path))
+                       self._find_first("name", ref.name, lambda n: n.path))
             if node_id:
                 return node_id
 
@@ -684,9 +793,9 @@ class GraphLock(object):
         # removing the revision, but it still should match
         search_ref = repr(ref)
         if ref.revision:  # Match should be exact (with RREV)
-            node_id = self._find_first(lambda n: n.ref and repr(n.ref) == search_ref)
+            node_id = self._find_first("repr", search_ref)
         else:
-            node_id = self._find_first(lambda n: n.ref and str(n.ref) == search_ref)
+            node_id = self._find_first("str", search_ref)
         if node_id:
             return node_id
 
@@ -698,4 +807,10 @@ class GraphLock(object):
         match the existing RREV
         """
         lock_node = self._nodes[node_id]
+        previous_keys = self._index_keys(lock_node.ref)
         lock_node.ref = ref
+        if self._index is not None:  # Keep the indexes up to date with the new reference
+            for index_name, index_key in previous_keys:
+                self._index[index_name][index_key].remove(node_id)
+            for index_name, index_key in self._index_keys(lock_node.ref):
+                self._index[index_name].setdefault(index_key, []).append(node_id)
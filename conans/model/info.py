@@ -39,13 +39,9 @@ class RequirementInfo(object):
 
     def copy(self):
         # Useful for build_id()
-        result = RequirementInfo(self.package, "unrelated_mode")
-        for f in ("name", "version", "user", "channel", "recipe_revision", "package_id",
-                  "package_revision"):
-
-            setattr(result, f, getattr(self, f))
-            f = "full_%s" % f
-            setattr(result, f, getattr(self, f))
+        result = RequirementInfo.__new__(RequirementInfo)
+        result.__dict__.update(self.__dict__)
+        result._indirect = False
         return result
 
     def dumps(self):
@@ -167,19 +163,23 @@ class RequirementsInfo(object):
         # {PackageReference: RequirementInfo}
         self._data = {pref: RequirementInfo(pref, default_package_id_mode=default_package_id_mode)
                       for pref in prefs}
+        self._sorted_keys = None  # Cached sorted(self._data), invalidated when adding or removing
 
     def copy(self):
         # For build_id() implementation
         result = RequirementsInfo([], None)
         result._data = {pref: req_info.copy() for pref, req_info in self._data.items()}
+        result._sorted_keys = self._sorted_keys
         return result
 
     def clear(self):
         self._data = {}
+        self._sorted_keys = None
 
     def remove(self, *args):
         for name in args:
             del self._data[self._get_key(name)]
+        self._sorted_keys = None
 
     def add(self, prefs_indirect, default_package_id_mode):
         """ necessary to propagate from upstream the real
@@ -188,6 +188,7 @@ class RequirementsInfo(object):
         for r in prefs_indirect:
             self._data[r] = RequirementInfo(r, indirect=True,
                                             default_package_id_mode=default_package_id_mode)
+        self._sorted_keys = None
 
     def refs(self):
         """ used for updating downstream requirements with this
@@ -212,13 +213,20 @@ class RequirementsInfo(object):
     def pkg_names(self):
         return [r.ref.name for r in self._data.keys()]
 
+    def _sorted(self):
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._data)
+        return self._sorted_keys
+
     @property
     def sha(self):
         result = []
-        # Remove requirements without a name, i.e. indirect transitive requirements
-        data = {k: v for k, v in self._data.items() if v.name}
-        for key in sorted(data):
-            s = data[key].sha
+        for key in self._sorted():
+            req_info = self._data[key]
+            # Remove requirements without a name, i.e. indirect transitive requirements
+            if not req_info.name:
+                continue
+            s = req_info.sha
             if s is None:
                 return None
             if s == PACKAGE_ID_INVALID:
@@ -228,7 +236,7 @@ class RequirementsInfo(object):
 
     def dumps(self):
         result = []
-        for ref in sorted(self._data):
+        for ref in self._sorted():
             dumped = self._data[ref].dumps()
             if dumped:
                 result.append(dumped)
@@ -511,7 +519,7 @@ class ConanInfo(object):
         q = self.copy()
         q.full_settings = self.full_settings.copy()
         q.full_options = self.full_options.copy()
-        q.full_requires = _PackageReferenceList.loads(self.full_requires.dumps())
+        q.full_requires = _PackageReferenceList(self.full_requires)  # Immutable prefs
         return q
 
     def __eq__(self, other):
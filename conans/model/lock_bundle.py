@@ -2,7 +2,7 @@ import json
 import os
 
 from conans.errors import ConanException
-from conans.model.graph_lock import GraphLockFile
+from conans.model.graph_lock import GraphLockFile, lockfile_dumps
 from conans.util.files import load, save
 
 
@@ -87,7 +87,7 @@ class LockBundle(object):
         return result
 
     def dumps(self):
-        return json.dumps({"lock_bundle": self._nodes}, indent=4)
+        return lockfile_dumps({"lock_bundle": self._nodes}, indent=4)
 
     def loads(self, text):
         nodes_json = json.loads(text)
@@ -125,6 +125,15 @@ class LockBundle(object):
         """
         bundle = LockBundle()
         bundle.loads(load(bundle_path))
+        lockfiles = {}  # Every lockfile is loaded and saved only once {path: GraphLockFile}
+
+        def load_lockfile(path):
+            graph_lock_file = lockfiles.get(path)
+            if graph_lock_file is None:
+                graph_lock_file = GraphLockFile.load(path, revisions_enabled)
+                lockfiles[path] = graph_lock_file
+            return graph_lock_file.graph_lock
+
         for node in bundle._nodes.values():
             # Each node in bundle belongs to a "ref", and contains lockinfo for every package_id
             for pkg in node["packages"]:
@@ -133,8 +142,7 @@ class LockBundle(object):
                 # First, compute the modified PREV from all lockfiles
                 prev = modified = prev_lockfile = None
                 for lockfile, nodes_ids in pkg["lockfiles"].items():
-                    graph_lock_conf = GraphLockFile.load(lockfile, revisions_enabled)
-                    graph_lock = graph_lock_conf.graph_lock
+                    graph_lock = load_lockfile(lockfile)
 
                     for node_id in nodes_ids:
                         # Make sure the PREV from lockfiles is consistent, it cannot be different
@@ -153,26 +161,28 @@ class LockBundle(object):
 
                 # Then, update all prev of all config lockfiles
                 for lockfile, nodes_ids in pkg["lockfiles"].items():
-                    graph_lock_conf = GraphLockFile.load(lockfile, revisions_enabled)
-                    graph_lock = graph_lock_conf.graph_lock
+                    graph_lock = load_lockfile(lockfile)
                     for node_id in nodes_ids:
                         if graph_lock.nodes[node_id].prev is None:
                             graph_lock.nodes[node_id].prev = prev
-                    graph_lock_conf.save(lockfile)
 
+        for lockfile, graph_lock_file in lockfiles.items():
+            graph_lock_file.save(lockfile)
         save(bundle_path, bundle.dumps())
 
     @staticmethod
     def clean_modified(bundle_path, revisions_enabled):
         bundle = LockBundle()
         bundle.loads(load(bundle_path))
+        lockfiles = set()
         for node in bundle._nodes.values():
             for pkg in node["packages"]:
                 pkg["modified"] = None
+                lockfiles.update(pkg["lockfiles"])
 
-                for lockfile, nodes_ids in pkg["lockfiles"].items():
-                    graph_lock_conf = GraphLockFile.load(lockfile, revisions_enabled)
-                    graph_lock_conf.graph_lock.clean_modified()
-                    graph_lock_conf.save(lockfile)
+        for lockfile in sorted(lockfiles):
+            graph_lock_conf = GraphLockFile.load(lockfile, revisions_enabled)
+            graph_lock_conf.graph_lock.clean_modified()
+            graph_lock_conf.save(lockfile)
 
         save(bundle_path, bundle.dumps())
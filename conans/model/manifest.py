@@ -1,10 +1,17 @@
+import json
 import os
+import time
+from multiprocessing.pool import ThreadPool
 
 from conans.errors import ConanException
 from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
 from conans.util.dates import timestamp_now, timestamp_to_str
 from conans.util.env_reader import get_env
 from conans.util.files import load, md5, md5sum, save, walk
+from conans.util.log import logger
+
+# Hashing the files in parallel only pays off for folders with many files
+_PARALLEL_HASH_MIN_FILES = 32
 
 
 def discarded_file(filename, keep_python):
@@ -49,6 +56,72 @@ def gather_files(folder):
     return file_dict, symlinks
 
 
+_MTIME_NS = hasattr(os.stat_result, "st_mtime_ns")
+
+
+def _file_stat(path):
+    """ The ctime changes when the inode of a removed file is reused by a new one """
+    st = os.stat(path)
+    if _MTIME_NS:
+        return [st.st_size, st.st_mtime_ns, st.st_ino, st.st_ctime_ns]
+    return [st.st_size, st.st_mtime, st.st_ino, st.st_ctime]
+
+
+def _md5sums(files):
+    """ {name: md5} of the {name: abs_path} files, hashing them in parallel if there are many
+    """
+    if len(files) < _PARALLEL_HASH_MIN_FILES:
+        return {name: md5sum(path) for name, path in files.items()}
+    from conans.client.tools.oss import cpu_count
+    names = list(files)
+    pool = ThreadPool(min(cpu_count(), 16))  # hashlib releases the GIL
+    try:
+        checksums = pool.map(md5sum, [files[name] for name in names], chunksize=8)
+    finally:
+        pool.close()
+        pool.join()
+    return dict(zip(names, checksums))
+
+
+def cached_checksums(files, cache_path, paranoid=False):
+    """ {name: md5} of the {name: abs_path} files. The checksums of the files whose size, mtime,
+    inode and ctime didn't change are read from the cache_path file, unless paranoid. The cache
+    is updated with the computed ones
+    """
+    cached = {}
+    if not paranoid:
+        try:
+            cached = json.loads(load(cache_path))
+        except (IOError, OSError, ValueError):
+            pass
+
+    result = {}
+    stats = {}
+    missing = {}
+    for name, path in files.items():
+        stats[name] = stat = _file_stat(path)
+        entry = cached.get(name)
+        if entry is not None and entry[:4] == stat:
+            result[name] = entry[4]
+        else:
+            missing[name] = path
+    if not missing and len(cached) == len(files):
+        return result
+
+    result.update(_md5sums(missing))
+    # Files modified after being hashed in the same mtime tick would be wrongly cached, like git
+    # with its "racily clean" entries, the recently modified files are hashed again the next time
+    recent = time.time() - 2
+    recent = int(recent * 1e9) if _MTIME_NS else recent
+    cache = {name: stats[name] + [checksum] for name, checksum in result.items()
+             if stats[name][1] < recent}
+    try:
+        save(cache_path, json.dumps(cache))
+    except (IOError, OSError) as e:  # i.e. read-only folders
+        logger.debug("Checksums cache not saved in %s: %s" % (cache_path, str(e)))
+    return result
+
+
 class FileTreeManifest(object):
 
     def __init__(self, the_time, file_sums):
@@ -116,22 +189,27 @@ class FileTreeManifest(object):
         save(path, repr(self))
 
     @classmethod
-    def create(cls, folder, exports_sources_folder=None):
+    def create(cls, folder, exports_sources_folder=None, checksums_cache=None, paranoid=False):
         """ Walks a folder and create a FileTreeManifest for it, reading file contents
         from disk, and capturing current time
+
+        checksums_cache: file, out of the folder, to keep the checksums of the files of the
+        folder, to not read again the files that didn't change. paranoid: read all the files
+        anyway
         """
         files, _ = gather_files(folder)
         for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME):
             files.pop(f, None)
 
-        file_dict = {}
-        for name, filepath in files.items():
-            file_dict[name] = md5sum(filepath)
+        if checksums_cache:
+            file_dict = cached_checksums(files, checksums_cache, paranoid)
+        else:
+            file_dict = _md5sums(files)
 
         if exports_sources_folder:
             export_files, _ = gather_files(exports_sources_folder)
-            for name, filepath in export_files.items():
-                file_dict["export_source/%s" % name] = md5sum(filepath)
+            for name, checksum in _md5sums(export_files).items():
+                file_dict["export_source/%s" % name] = checksum
 
         date = timestamp_now()
 
@@ -1,7 +1,15 @@
+import json
+import os
+
 import yaml
 
 from conans.errors import ConanException
 from conans.model.values import Values
+from conans.util.files import load, save
+from conans.util.sha import sha1
+
+# Parsed settings.yml of this process {sha1 of the settings.yml: Settings}, see Settings.loads()
+_parsed_settings = {}
 
 
 def bad_value_msg(name, value, value_range):
@@ -35,6 +43,7 @@ class SettingsItem(object):
     def __init__(self, definition, name):
         self._name = name  # settings.compiler
         self._value = None  # gcc
+        self._shared = False  # The _definition is shared with copies, see copy()
         if isinstance(definition, dict):
             self._definition = {}
             # recursive
@@ -51,16 +60,28 @@ class SettingsItem(object):
         return value in (self._value or "")
 
     def copy(self):
-        """ deepcopy, recursive
+        """ copy-on-write, the definition is shared until one of the copies has to modify it, see
+        _unshare() and _SharedChild
         """
         result = SettingsItem({}, name=self._name)
         result._value = self._value
-        if self.is_final:
-            result._definition = self._definition[:]
-        else:
-            result._definition = {k: v.copy() for k, v in self._definition.items()}
+        result._definition = self._definition
+        result._shared = self._shared = True
         return result
 
+    def _child(self, value, write=False):
+        if write:
+            self._unshare()
+        return self._definition[value]
+
+    def _unshare(self):
+        if self._shared:
+            if self.is_final:
+                self._definition = self._definition[:]
+            else:
+                self._definition = {k: v.copy() for k, v in self._definition.items()}
+            self._shared = False
+
     def copy_values(self):
         if self._value is None and "None" not in self._definition:
             return None
@@ -107,13 +128,15 @@ class SettingsItem(object):
            del self.settings.compiler.stdlib
         """
         try:
-            self._get_child(self._value).remove(item)
+            self._check_child(item)
+            self._child(self._value, write=True).remove(item)
         except Exception:
             pass
 
     def remove(self, values):
         if not isinstance(values, (list, tuple, set)):
             values = [values]
+        self._unshare()
         for v in values:
             v = str(v)
             if isinstance(self._definition, dict):
@@ -127,32 +150,40 @@ class SettingsItem(object):
         if self._value is not None and self._value not in self._definition and self._not_any():
             raise ConanException(bad_value_msg(self._name, self._value, self.values_range))
 
-    def _get_child(self, item):
+    def _check_child(self, item):
         if not isinstance(self._definition, dict):
             raise undefined_field(self._name, item, None, self._value)
         if self._value is None:
             raise undefined_value(self._name)
-        return self._definition[self._value]
 
-    def __getattr__(self, item):
+    def _getattr(self, item, owner):
         item = str(item)
-        sub_config_dict = self._get_child(item)
+        self._check_child(item)
+        sub_config_dict = _SharedChild(owner, self._value)
         return getattr(sub_config_dict, item)
 
+    def __getattr__(self, item):
+        return self._getattr(item, self)
+
     def __setattr__(self, item, value):
         if item[0] == "_" or item.startswith("value"):
             return super(SettingsItem, self).__setattr__(item, value)
 
         item = str(item)
-        sub_config_dict = self._get_child(item)
+        self._check_child(item)
+        sub_config_dict = self._child(self._value, write=True)
         return setattr(sub_config_dict, item, value)
 
-    def __getitem__(self, value):
+    def _getitem(self, value, owner):
         value = str(value)
         try:
-            return self._definition[value]
+            self._definition[value]
         except Exception:
             raise ConanException(bad_value_msg(self._name, value, self.values_range))
+        return _SharedChild(owner, value)
+
+    def __getitem__(self, value):
+        return self._getitem(value, self)
 
     @property
     def value(self):
@@ -199,6 +230,7 @@ class Settings(object):
         definition = definition or {}
         self._name = name  # settings, settings.compiler
         self._parent_value = parent_value  # gcc, x86
+        self._shared = False  # The _data is shared with copies, see copy()
         self._data = {str(k): SettingsItem(v, "%s.%s" % (name, k))
                       for k, v in definition.items()}
 
@@ -214,13 +246,24 @@ class Settings(object):
         return default
 
     def copy(self):
-        """ deepcopy, recursive
+        """ copy-on-write, the items are shared until one of the copies has to modify them, then
+        only that level is copied, sharing the deeper ones, see _SharedChild
         """
         result = Settings({}, name=self._name, parent_value=self._parent_value)
-        for k, v in self._data.items():
-            result._data[k] = v.copy()
+        result._data = self._data
+        result._shared = self._shared = True
         return result
 
+    def _child(self, field, write=False):
+        if write:
+            self._unshare()
+        return self._data[field]
+
+    def _unshare(self):
+        if self._shared:
+            self._data = {k: v.copy() for k, v in self._data.items()}
+            self._shared = False
+
     def copy_values(self):
         """ deepcopy, recursive
         """
@@ -232,11 +275,27 @@ class Settings(object):
         return result
 
     @staticmethod
-    def loads(text):
-        try:
-            return Settings(yaml.safe_load(text) or {})
-        except (yaml.YAMLError, AttributeError) as ye:
-            raise ConanException("Invalid settings.yml format: {}".format(ye))
+    def loads(text, cache_path=None):
+        """ The Settings of every settings.yml are parsed once per process. If cache_path is
+        defined, the parsed definition is also persisted there as json, much faster to load
+        than the yaml, and used while the sha1 of the settings.yml doesn't change
+        """
+        checksum = sha1(text.encode("utf-8"))
+        settings = _parsed_settings.get(checksum)
+        if settings is None:
+            definition = _load_definition_cache(cache_path, checksum) if cache_path else None
+            if definition is None:
+                try:
+                    definition = yaml.safe_load(text) or {}
+                    settings = Settings(definition)
+                except (yaml.YAMLError, AttributeError) as ye:
+                    raise ConanException("Invalid settings.yml format: {}".format(ye))
+                if cache_path:
+                    _save_definition_cache(cache_path, checksum, definition)
+            else:
+                settings = Settings(definition)
+            _parsed_settings[checksum] = settings
+        return settings.copy()
 
     def validate(self):
         for field in self.fields:
@@ -250,25 +309,31 @@ class Settings(object):
     def remove(self, item):
         if not isinstance(item, (list, tuple, set)):
             item = [item]
+        self._unshare()
         for it in item:
             it = str(it)
             self._data.pop(it, None)
 
     def clear(self):
         self._data = {}
+        self._shared = False
 
     def _check_field(self, field):
         if field not in self._data:
             raise undefined_field(self._name, field, self.fields, self._parent_value)
 
-    def __getattr__(self, field):
+    def _getattr(self, field, owner):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
-        return self._data[field]
+        return _SharedChild(owner, field)
+
+    def __getattr__(self, field):
+        return self._getattr(field, self)
 
     def __delattr__(self, field):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
+        self._unshare()
         del self._data[field]
 
     def __setattr__(self, field, value):
@@ -276,6 +341,7 @@ class Settings(object):
             return super(Settings, self).__setattr__(field, value)
 
         self._check_field(field)
+        self._unshare()
         self._data[field].value = value
 
     @property
@@ -324,6 +390,7 @@ class Settings(object):
         else:
             constraint_def = {str(k): v for k, v in constraint_def.items()}
 
+        self._unshare()
         fields_to_remove = []
         for field, config_item in self._data.items():
             if field not in constraint_def:
@@ -359,3 +426,86 @@ class Settings(object):
 
         # remove settings not defined in the constraint
         self.remove(fields_to_remove)
+
+
+class _SharedChild(object):
+    """ The children of a Settings or SettingsItem are returned as this reference to them from
+    their owner, as the owner can share them with its copies, also with the ones made after
+    returning the child. It is read without copying anything, and every modification through it
+    first copies the shared levels from its owner down to it (see _unshare()), so the other
+    copies don't see it
+    """
+    __slots__ = ("_parent", "_key")
+    _modifiers = ("remove", "clear", "constraint", "update_values")
+
+    def __init__(self, parent, key):
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_key", key)
+
+    def _target(self, write=False):
+        parent = self._parent
+        if isinstance(parent, _SharedChild):
+            parent = parent._target(write)
+        return parent._child(self._key, write)
+
+    def __getattr__(self, name):
+        target = self._target(write=name in self._modifiers)
+        if name[0] == "_" or hasattr(type(target), name):  # methods and properties
+            return getattr(target, name)
+        return target._getattr(name, self)
+
+    def __setattr__(self, name, value):
+        setattr(self._target(write=True), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._target(write=True), name)
+
+    def __getitem__(self, value):
+        return self._target()._getitem(value, self)
+
+    def __contains__(self, value):
+        return value in self._target()
+
+    def __bool__(self):
+        return bool(self._target())
+
+    def __nonzero__(self):
+        return self.__bool__()
+
+    def __str__(self):
+        return str(self._target())
+
+    def __eq__(self, other):
+        return self._target() == other
+
+    def __ne__(self, other):
+        return self._target() != other
+
+
+def _definition_json(definition):
+    # The str keys and values the Settings use, so the json gives exactly the same Settings
+    if isinstance(definition, dict):
+        return {str(k): _definition_json(v) for k, v in definition.items()}
+    if isinstance(definition, (list, tuple)):
+        return [str(v) for v in definition]
+    return definition
+
+
+def _load_definition_cache(cache_path, checksum):
+    if not os.path.isfile(cache_path):
+        return None
+    try:
+        cached = json.loads(load(cache_path))
+    except Exception:  # Corrupted or being written by other process, the yaml is parsed
+        return None
+    if cached.get("sha1") != checksum:
+        return None
+    return cached.get("definition")
+
+
+def _save_definition_cache(cache_path, checksum, definition):
+    try:
+        save(cache_path, json.dumps({"sha1": checksum,
+                                     "definition": _definition_json(definition)}))
+    except (IOError, OSError):  # Read only cache, it is only an optimization
+        pass
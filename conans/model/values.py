@@ -4,9 +4,22 @@ from conans.util.sha import sha1
 
 class Values(object):
     def __init__(self, value="values"):
-        self._value = str(value)
-        self._dict = {}  # {key: Values()}
-        self._modified = {}  # {"compiler.version.arch": (old_value, old_reference)}
+        # Not assigned through __setattr__, they are created and copied for every setting of every
+        # ConanInfo and compatible package
+        self.__dict__.update({"_value": str(value),
+                              "_dict": {},  # {key: Values()}
+                              # {"compiler.version.arch": (old_value, old_reference)}
+                              "_modified": {},
+                              # The Values containing this one, to invalidate its sha
+                              "_parent": None,
+                              # Cached sha, invalidated by any modification of it or its children
+                              "_sha": None})
+
+    def _changed(self):
+        values = self
+        while values is not None:
+            values._sha = None
+            values = values._parent
 
     def __getattr__(self, attr):
         if attr not in self._dict:
@@ -17,23 +30,31 @@ class Values(object):
         if attr not in self._dict:
             return
         del self._dict[attr]
+        self._changed()
 
     def clear(self):
         # TODO: Test. DO not delete, might be used by package_id() to clear settings values
         self._dict.clear()
         self._value = ""
+        self._changed()
 
     def __setattr__(self, attr, value):
         if attr[0] == "_":
             return super(Values, self).__setattr__(attr, value)
-        self._dict[attr] = Values(value)
+        child = Values(value)
+        child._parent = self
+        self._dict[attr] = child
+        self._changed()
 
     def copy(self):
         """ deepcopy, recursive
         """
         result = Values(self._value)
         for k, v in self._dict.items():
-            result._dict[k] = v.copy()
+            child = v.copy()
+            child._parent = result
+            result._dict[k] = child
+        result._sha = self._sha
         return result
 
     @property
@@ -106,11 +127,13 @@ class Values(object):
 
     @property
     def sha(self):
-        result = []
-        for (name, value) in self.as_list(list_all=False):
-            # It is important to discard None values, so migrations in settings can be done
-            # without breaking all existing packages SHAs, by adding a first "None" option
-            # that doesn't change the final sha
-            if value != "None":
-                result.append("%s=%s" % (name, value))
-        return sha1('\n'.join(result).encode())
+        if self._sha is None:
+            result = []
+            for (name, value) in self.as_list(list_all=False):
+                # It is important to discard None values, so migrations in settings can be done
+                # without breaking all existing packages SHAs, by adding a first "None" option
+                # that doesn't change the final sha
+                if value != "None":
+                    result.append("%s=%s" % (name, value))
+            self._sha = sha1('\n'.join(result).encode())
+        return self._sha
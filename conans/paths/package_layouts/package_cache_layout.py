@@ -16,7 +16,8 @@ from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference
 from conans.model.ref import PackageReference
 from conans.paths import CONANFILE, SYSTEM_REQS, EXPORT_FOLDER, EXPORT_SRC_FOLDER, SRC_FOLDER, \
-    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, rm_conandir
+    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, \
+    PACKAGES_SUMMARY, rm_conandir
 from conans.util.env_reader import get_env
 from conans.util.files import load, save, rmdir, set_dirty, clean_dirty, is_dirty
 from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
@@ -124,6 +125,10 @@ class PackageCacheLayout(object):
     def download_export(self):
         return os.path.join(self._base_folder, "dl", "export")
 
+    def package_checksums(self, pref):
+        """ The checksums cache of the package files, out of the package folder """
+        return os.path.join(self._base_folder, "checksums", "%s.json" % pref.id)
+
     def package_is_dirty(self, pref):
         pkg_folder = os.path.join(self._base_folder, PACKAGES_FOLDER, pref.id)
         return is_dirty(pkg_folder)
@@ -140,6 +145,9 @@ class PackageCacheLayout(object):
         # Remove the tgz storage
         tgz_folder = self.download_package(pref)
         rmdir(tgz_folder)
+        checksums = self.package_checksums(pref)
+        if os.path.exists(checksums):
+            os.remove(checksums)
         # This is NOT the short paths, but the standard cache one
         pkg_folder = os.path.join(self._base_folder, PACKAGES_FOLDER, pref.id)
         try:
@@ -183,13 +191,21 @@ class PackageCacheLayout(object):
     def package_metadata(self):
         return os.path.join(self._base_folder, PACKAGE_METADATA)
 
+    def packages_summary(self):
+        """ The search information of the packages, see search._get_local_infos_min() """
+        return os.path.join(self._base_folder, PACKAGES_SUMMARY)
+
     def recipe_manifest(self):
         return FileTreeManifest.load(self.export())
 
-    def package_manifests(self, pref):
+    def package_manifests(self, pref, paranoid=False):
+        """ The checksums of the package files are cached, paranoid reads all the files
+        """
         package_folder = self.package(pref)
         readed_manifest = FileTreeManifest.load(package_folder)
-        expected_manifest = FileTreeManifest.create(package_folder)
+        expected_manifest = FileTreeManifest.create(package_folder,
+                                                    checksums_cache=self.package_checksums(pref),
+                                                    paranoid=paranoid)
         return readed_manifest, expected_manifest
 
     def recipe_exists(self):
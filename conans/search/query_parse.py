@@ -68,6 +68,33 @@ def evaluate_postfix(postfix, evaluator):
         return stack[0]
 
 
+def compile_postfix(postfix, compiler):
+    """
+    Compiles a postfix expression into a predicate, with the same semantics as evaluate_postfix()
+    @param postfix:  Postfix expression as a list
+    @param compiler: Function receiving expressions like "compiler.version=12" and returning
+                     a predicate for them
+    @return: Function receiving the evaluated object and returning a bool
+    """
+    if not postfix:  # If no query return all?
+        return lambda _: True
+
+    stack = []
+    for el in postfix:
+        if not is_operator(el):
+            stack.append(compiler(el))
+        else:
+            o1 = stack.pop()
+            o2 = stack.pop()
+            if el == "|":
+                stack.append(lambda obj, o1=o1, o2=o2: o1(obj) or o2(obj))
+            else:
+                stack.append(lambda obj, o1=o1, o2=o2: o1(obj) and o2(obj))
+    if len(stack) != 1:
+        raise Exception("Bad stack: %s" % str(postfix))
+    return stack[0]
+
+
 def infix_to_postfix(exp):
     """
     Translates an infix expression to postfix using an standard algorithm
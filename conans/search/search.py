@@ -1,3 +1,4 @@
+import json
 import os
 import re
 from collections import OrderedDict
@@ -5,10 +6,11 @@ from fnmatch import translate
 
 from conans.errors import ConanException, RecipeNotFoundException
 from conans.model.info import ConanInfo
+from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import CONANINFO
-from conans.search.query_parse import evaluate_postfix, infix_to_postfix
-from conans.util.files import load
+from conans.search.query_parse import compile_postfix, infix_to_postfix
+from conans.util.files import load, save
 from conans.util.log import logger
 
 
@@ -47,49 +49,37 @@ def filter_packages(query, package_infos):
         if " not " in query or query.startswith("not "):
             raise ConanException("'not' operator is not allowed")
         postfix = infix_to_postfix(query) if query else []
-        result = OrderedDict()
-        for package_id, info in package_infos.items():
-            if _evaluate_postfix_with_info(postfix, info):
-                result[package_id] = info
-        return result
+        # Compiled once, not interpreted again for every package
+        predicate = compile_postfix(postfix, _compile_expression)
+        return OrderedDict((package_id, info) for package_id, info in package_infos.items()
+                           if predicate(info))
     except Exception as exc:
         raise ConanException("Invalid package query: %s. %s" % (query, exc))
 
 
-def _evaluate_postfix_with_info(postfix, conan_vars_info):
-
-    # Evaluate conaninfo with the expression
-
-    def evaluate_info(expression):
-        """Receives an expression like compiler.version="12"
-        Uses conan_vars_info in the closure to evaluate it"""
-        name, value = expression.split("=", 1)
-        value = value.replace("\"", "")
-        return _evaluate(name, value, conan_vars_info)
+_COMMON_SETTINGS = ("os", "os_build", "compiler", "arch", "arch_build", "build_type")
+_COMMON_SUBSETTINGS = tuple(setting + "." for setting in _COMMON_SETTINGS)
 
-    return evaluate_postfix(postfix, evaluate_info)
 
-
-def _evaluate(prop_name, prop_value, conan_vars_info):
-    """
-    Evaluates a single prop_name, prop_value like "os", "Windows" against
-    conan_vars_info.serialize_min()
+def _compile_expression(expression):
+    """ Receives an expression like compiler.version="12" and returns the predicate evaluating
+    it against a conaninfo serialize_min()
     """
+    prop_name, prop_value = expression.split("=", 1)
+    prop_value = prop_value.replace("\"", "")
+    if prop_name in _COMMON_SETTINGS or prop_name.startswith(_COMMON_SUBSETTINGS):
+        section = "settings"
+    else:
+        section = "options"
 
-    def compatible_prop(setting_value, _prop_value):
-        return (_prop_value == setting_value) or (_prop_value == "None" and setting_value is None)
-
-    info_settings = conan_vars_info.get("settings", [])
-    info_options = conan_vars_info.get("options", [])
-    properties = ["os", "os_build", "compiler", "arch", "arch_build", "build_type"]
-
-    def starts_with_common_settings(_prop_name):
-        return any(_prop_name.startswith(setting + '.') for setting in properties)
-
-    if prop_name in properties or starts_with_common_settings(prop_name):
-        return compatible_prop(info_settings.get(prop_name, None), prop_value)
+    if prop_value == "None":
+        def predicate(conan_vars_info):
+            value = conan_vars_info.get(section, {}).get(prop_name)
+            return value is None or value == "None"
     else:
-        return compatible_prop(info_options.get(prop_name, None), prop_value)
+        def predicate(conan_vars_info):
+            return conan_vars_info.get(section, {}).get(prop_name) == prop_value
+    return predicate
 
 
 def search_recipes(cache, pattern=None, ignorecase=True):
@@ -140,25 +130,51 @@ def search_packages(package_layout, query):
 
 
 def _get_local_infos_min(package_layout):
+    """ The serialize_min() of the conaninfo.txt of every package, and the recipe revision of the
+    package, are kept in the packages_summary.json of the recipe, and are only computed again if
+    the conaninfo.txt file changed, i.e. the package was installed or built again
+    """
     result = OrderedDict()
-
     package_ids = package_layout.package_ids()
+    summary_path = package_layout.packages_summary()
+    try:
+        summary = json.loads(load(summary_path))
+    except (IOError, OSError, ValueError):
+        summary = {}
+
+    new_summary = {}
+    metadata = None
     for package_id in package_ids:
-        # Read conaninfo
         pref = PackageReference(package_layout.ref, package_id)
         info_path = os.path.join(package_layout.package(pref), CONANINFO)
-        if not os.path.exists(info_path):
+        try:
+            st = os.stat(info_path)
+        except OSError:
             logger.error("There is no ConanInfo: %s" % str(info_path))
             continue
-        conan_info_content = load(info_path)
-
-        info = ConanInfo.loads(conan_info_content)
-        if package_layout.ref.revision:
-            metadata = package_layout.load_metadata()
-            recipe_revision = metadata.packages[package_id].recipe_revision
-            if recipe_revision and recipe_revision != package_layout.ref.revision:
-                continue
-        conan_vars_info = info.serialize_min()
-        result[package_id] = conan_vars_info
+        info_stat = [st.st_size, st.st_mtime, st.st_ino, st.st_ctime]
+        entry = summary.get(package_id)
+        if entry is None or entry["stat"] != info_stat:
+            if metadata is None:
+                try:
+                    metadata = package_layout.load_metadata()
+                except RecipeNotFoundException:
+                    metadata = PackageMetadata()
+            info = ConanInfo.loads(load(info_path))
+            entry = {"stat": info_stat,
+                     "recipe_revision": metadata.packages[package_id].recipe_revision,
+                     "info": info.serialize_min()}
+        new_summary[package_id] = entry
+
+        recipe_revision = entry["recipe_revision"]
+        if package_layout.ref.revision and recipe_revision and \
+                recipe_revision != package_layout.ref.revision:
+            continue
+        result[package_id] = entry["info"]
 
+    if new_summary != summary:
+        try:
+            save(summary_path, json.dumps(new_summary))
+        except (IOError, OSError):  # Read only cache, it is only an optimization
+            pass
     return result
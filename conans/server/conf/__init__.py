@@ -15,6 +15,7 @@ from conans.errors import ConanException
 from conans.paths import conan_expand_user
 from conans.server.conf.default_server_conf import default_server_conf
 from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.search_index import SearchIndex, SEARCH_INDEX_FILE
 from conans.server.store.server_store import ServerStore
 from conans.util.env_reader import get_env
 from conans.util.files import mkdir, save
@@ -53,6 +54,8 @@ class ConanServerConfigParser(ConfigParser):
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
+                           "server_mode": get_env("CONAN_SERVER_MODE", None, environment),
+                           "server_workers": get_env("CONAN_SERVER_WORKERS", None, environment),
                            # "user:pass,user2:pass2"
                            "users": get_env("CONAN_SERVER_USERS", None, environment)}
 
@@ -114,6 +117,21 @@ class ConanServerConfigParser(ConfigParser):
         except ConanException:
             return None
 
+    @property
+    def server_mode(self):
+        try:
+            return self._get_conf_server_string("server_mode")
+        except ConanException:
+            # server.conf files created by previous versions serve one request at a time
+            return "single"
+
+    @property
+    def server_workers(self):
+        try:
+            return int(self._get_conf_server_string("server_workers"))
+        except ConanException:
+            return None
+
     @property
     def public_url(self):
         host_name = self.host_name
@@ -224,9 +242,13 @@ class ConanServerConfigParser(ConfigParser):
         return timedelta(minutes=float(self._get_conf_server_string("jwt_expire_minutes")))
 
 
-def get_server_store(disk_storage_path, public_url, updown_auth_manager):
+def get_server_store(disk_storage_path, public_url, updown_auth_manager, server_folder=None):
     disk_controller_url = "%s/%s" % (public_url, "files")
     if not updown_auth_manager:
         raise Exception("Updown auth manager needed for disk controller (not s3)")
     adapter = ServerDiskAdapter(disk_controller_url, disk_storage_path, updown_auth_manager)
-    return ServerStore(adapter)
+    search_index = None
+    if server_folder:
+        search_index = SearchIndex.create(os.path.join(server_folder, SEARCH_INDEX_FILE),
+                                          disk_storage_path)
+    return ServerStore(adapter, search_index)
@@ -11,6 +11,12 @@ port: 9300
 public_port:
 host_name: localhost
 
+# How requests are served: "single" (one at a time), "threaded" (a pool of server_workers
+# threads) or "prefork" (server_workers processes, requires gunicorn)
+server_mode: threaded
+# If empty, the number of CPUs
+server_workers: 8
+
 # Authorize timeout are seconds the client has to upload/download files until authorization expires
 authorize_timeout: 1800
 
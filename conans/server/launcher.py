@@ -1,5 +1,6 @@
 #!/usr/bin/python
 import os
+import time
 
 from conans import SERVER_CAPABILITIES, REVISIONS
 from conans.paths import conan_expand_user
@@ -42,7 +43,11 @@ class ServerLauncher(object):
 
         server_store = get_server_store(server_config.disk_storage_path,
                                         server_config.public_url,
-                                        updown_auth_manager=updown_auth_manager)
+                                        updown_auth_manager=updown_auth_manager,
+                                        server_folder=server_config.conan_folder)
+        self.server_store = server_store
+        self.server_mode = server_config.server_mode
+        self.server_workers = server_config.server_workers
 
         server_capabilities = SERVER_CAPABILITIES
         server_capabilities.append(REVISIONS)
@@ -56,8 +61,18 @@ class ServerLauncher(object):
             print("Storage: %s" % server_config.disk_storage_path)
             print("Public URL: %s" % server_config.public_url)
             print("PORT: %s" % server_config.port)
+            print("Mode: %s" % server_config.server_mode)
             print("***********************")
 
+    def reindex(self):
+        t1 = time.time()
+        recipes, packages = self.server_store.reindex()
+        print("Indexed %s recipe revisions and %s packages in %.1fs"
+              % (recipes, packages, time.time() - t1))
+
     def launch(self):
         if not self.force_migration:
-            self.server.run(host="0.0.0.0")
+            if self.server_store.search_index is None:
+                print("The search index is not built, searches will walk the storage. "
+                      "Run 'conan_server --reindex' to build it")
+            self.server.run(host="0.0.0.0", mode=self.server_mode, workers=self.server_workers)
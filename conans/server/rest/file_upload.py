@@ -0,0 +1,23 @@
+import os
+
+from bottle import request
+
+from conans.server.store.disk_adapter import save_stream
+
+
+class StreamedFileUpload(object):
+    """ The body of the current request as an uploaded file. When its length is known it is
+    read straight from the WSGI input and saved in fixed-size chunks, instead of being spooled
+    first to memory or to a temporary file by bottle (request.body)
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def save(self, destination):
+        size = request.content_length
+        if size >= 0 and "bottle.request.body" not in request.environ:
+            stream = request.environ["wsgi.input"]
+        else:  # Chunked transfer encoding or body already read
+            stream, size = request.body, None
+        save_stream(stream, os.path.join(destination, self.filename), size)
@@ -1,8 +1,56 @@
+from multiprocessing.pool import ThreadPool
+
 import bottle
+from six.moves import socketserver
+from wsgiref.simple_server import WSGIServer
 
+from conans.errors import ConanException
 from conans.server.rest.api_v1 import ApiV1
 from conans.server.rest.api_v2 import ApiV2
 
+SINGLE_MODE = "single"
+THREADED_MODE = "threaded"
+PREFORK_MODE = "prefork"
+SERVER_MODES = (SINGLE_MODE, THREADED_MODE, PREFORK_MODE)
+
+
+class ThreadPoolWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    """ wsgiref server handling the requests in a fixed-size pool of threads, instead of
+    one by one (WSGIServer) or in a new thread per request (ThreadingMixIn)
+    """
+    workers = None  # cpu_count()
+
+    def __init__(self, *args, **kwargs):
+        WSGIServer.__init__(self, *args, **kwargs)
+        self._pool = ThreadPool(self.workers)
+
+    def process_request(self, request, client_address):
+        self._pool.apply_async(self.process_request_thread, (request, client_address))
+
+    def server_close(self):
+        WSGIServer.server_close(self)
+        self._pool.terminate()
+
+
+def server_adapter_options(mode, workers):
+    """ The bottle.run() arguments to serve in the given server.conf server_mode
+    """
+    if mode == SINGLE_MODE:
+        return {"server": "wsgiref"}
+    if mode == THREADED_MODE:
+        server_class = type("ThreadPoolWSGIServer", (ThreadPoolWSGIServer, ),
+                            {"workers": workers})
+        return {"server": "wsgiref", "server_class": server_class}
+    if mode == PREFORK_MODE:
+        try:
+            import gunicorn  # noqa
+        except ImportError:
+            raise ConanException("The '%s' server_mode requires gunicorn, install it with "
+                                 "'pip install gunicorn'" % PREFORK_MODE)
+        return {"server": "gunicorn", "workers": workers}
+    raise ConanException("Invalid server_mode '%s', possible values: %s"
+                         % (mode, ", ".join(SERVER_MODES)))
+
 
 class ConanServer(object):
     """
@@ -42,5 +90,9 @@ class ConanServer(object):
         port = kwargs.pop("port", self.run_port)
         debug_set = kwargs.pop("debug", False)
         host = kwargs.pop("host", "localhost")
+        quiet = kwargs.pop("quiet", False)
+        mode = kwargs.pop("mode", SINGLE_MODE)
+        workers = kwargs.pop("workers", None)
+        options = server_adapter_options(mode, workers)
         bottle.Bottle.run(self.root_app, host=host,
-                          port=port, debug=debug_set, reloader=False)
+                          port=port, debug=debug_set, reloader=False, quiet=quiet, **options)
@@ -1,6 +1,8 @@
 import json
+import os
+import threading
 import time
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 from conans.util.dates import from_timestamp_to_iso8601
 
@@ -60,6 +62,11 @@ class RevisionList(object):
             return None
         return self._data[tmp].time
 
+    def copy(self):
+        ret = RevisionList()
+        ret._data = list(self._data)
+        return ret
+
     def as_list(self):
         return list(reversed(self._data))
 
@@ -77,3 +84,57 @@ class RevisionList(object):
 
     def __eq__(self, other):
         return self.dumps() == other.dumps()
+
+
+class RevisionListCache(object):
+    """ LRU cache of the RevisionList of the revisions.txt files, by path. The entries are
+    validated with the mtime and size of the file, so the changes done by other server processes
+    sharing the same storage are not missed.
+    """
+
+    def __init__(self, max_size=4096):
+        self._max_size = max_size
+        self._entries = OrderedDict()  # {path: ((mtime, size), RevisionList)}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, load):
+        """ The RevisionList of the path, calling load() to read its contents if it is not
+        cached or it has changed. Raises IOError/OSError if the file doesn't exist
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.invalidate(path)
+            raise
+        stamp = (st.st_mtime, st.st_size)
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                self._entries[path] = entry  # Most recently used, the last one
+                return entry[1].copy()
+            self.misses += 1
+
+        rev_list = RevisionList.loads(load())
+        with self._lock:
+            self._entries[path] = (stamp, rev_list)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return rev_list.copy()
+
+    def invalidate(self, path):
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def invalidate_folder(self, folder):
+        """ Removes the entries of all the revisions files inside the folder """
+        prefix = os.path.join(folder, "")
+        with self._lock:
+            for path in [p for p in self._entries if p.startswith(prefix)]:
+                del self._entries[path]
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -17,6 +17,17 @@ def _get_local_infos_min(server_store, ref, look_in_all_rrevs):
     result = {}
     rrevs = server_store.get_recipe_revisions(ref) if look_in_all_rrevs else [None]
 
+    search_index = server_store.search_index
+    if search_index is not None:
+        revisions = [rrev.revision for rrev in rrevs] if look_in_all_rrevs else [ref.revision]
+        packages = search_index.packages(ref.copy_clear_rev().dir_repr(), revisions)
+        for package_id, (rrev, prev, info) in packages.items():
+            # The files could have been removed from the storage, not through the server
+            pref = PackageReference(ref.copy_with_rev(rrev), package_id, prev)
+            if os.path.exists(os.path.join(server_store.package(pref), CONANINFO)):
+                result[package_id] = info
+        return result
+
     for rrev in rrevs:
         new_ref = ref.copy_with_rev(rrev.revision) if rrev else ref
         subdirs = list_folder_subdirs(server_store.packages(new_ref), level=1)
@@ -79,7 +90,12 @@ class SearchService(object):
         return info
 
     def _search_recipes(self, pattern=None, ignorecase=True):
-        subdirs = list_folder_subdirs(basedir=self._server_store.store, level=5)
+        search_index = self._server_store.search_index
+        if search_index is not None:
+            subdirs = ["%s/%s" % (reference, revision)
+                       for reference, revision in search_index.recipes()]
+        else:
+            subdirs = list_folder_subdirs(basedir=self._server_store.store, level=5)
         if not pattern:
             return sorted([ConanFileReference(*folder.split("/")).copy_clear_rev()
                            for folder in subdirs])
@@ -1,6 +1,8 @@
 def get_mime_type(filepath):
     if filepath.endswith(".tgz"):
         mimetype = "x-gzip"
+    elif filepath.endswith(".tzst"):
+        mimetype = "x-zstd"
     elif filepath.endswith(".txz"):
         mimetype = "x-xz"
     else:
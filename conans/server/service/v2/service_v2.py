@@ -1,6 +1,6 @@
 import os
 
-from bottle import FileUpload, static_file
+from bottle import static_file
 
 from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
 from conans.server.service.common.common import CommonService
@@ -35,11 +35,11 @@ class ConanServiceV2(CommonService):
         return static_file(os.path.basename(path), root=os.path.dirname(path),
                            mimetype=get_mime_type(path))
 
-    def upload_recipe_file(self, body, headers, reference, filename, auth_user):
+    def upload_recipe_file(self, file_saver, reference, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, reference)
         # FIXME: Check that reference contains revision (MANDATORY TO UPLOAD)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        self._upload_to_path(body, headers, path)
+        self._upload_to_path(file_saver, path)
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_revision(reference)
@@ -89,7 +89,7 @@ class ConanServiceV2(CommonService):
         return static_file(os.path.basename(path), root=os.path.dirname(path),
                            mimetype=get_mime_type(path))
 
-    def upload_package_file(self, body, headers, pref, filename, auth_user):
+    def upload_package_file(self, file_saver, pref, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, pref.ref)
         # FIXME: Check that reference contains revisions (MANDATORY TO UPLOAD)
 
@@ -98,17 +98,14 @@ class ConanServiceV2(CommonService):
         if not os.path.exists(recipe_path):
             raise RecipeNotFoundException(pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        self._upload_to_path(body, headers, path)
+        self._upload_to_path(file_saver, path)
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_package_revision(pref)
 
     # Misc
     @staticmethod
-    def _upload_to_path(body, headers, path):
-        file_saver = FileUpload(body, None,
-                                filename=os.path.basename(path),
-                                headers=headers)
+    def _upload_to_path(file_saver, path):
         if os.path.exists(path):
             os.unlink(path)
         if not os.path.exists(os.path.dirname(path)):
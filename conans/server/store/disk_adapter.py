@@ -1,4 +1,5 @@
 import os
+import threading
 
 import fasteners
 
@@ -6,10 +7,30 @@ from conans.client.tools.env import no_op
 from conans.errors import NotFoundException
 from conans.util.files import decode_text, md5sum, path_exists, relative_dirs, rmdir
 
+# Uploaded files are written in chunks of this size, never read whole in memory
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def save_stream(stream, path, size=None, chunk_size=UPLOAD_CHUNK_SIZE):
+    """ Writes the contents of the stream to path, reading it in fixed-size chunks.
+    :param size: Number of bytes to read from the stream, until EOF if None
+    """
+    with open(path, "wb") as f:
+        while size is None or size > 0:
+            chunk = stream.read(chunk_size if size is None else min(size, chunk_size))
+            if not chunk:
+                break
+            f.write(chunk)
+            if size is not None:
+                size -= len(chunk)
+
 
 class ServerDiskAdapter(object):
     """Manage access to disk files with common methods required
     for conan operations"""
+    # fasteners locks are per process, threads of the same process need their own lock
+    _thread_locks = {}  # Needs to be shared among all instances
+
     def __init__(self, base_url, base_storage_path, updown_auth_manager):
         """
         :param: base_url Base url for generate urls to download and upload operations"""
@@ -89,15 +110,21 @@ class ServerDiskAdapter(object):
     def path_exists(self, path):
         return os.path.exists(path)
 
+    @staticmethod
+    def _thread_lock(lock_file):
+        return ServerDiskAdapter._thread_locks.setdefault(lock_file, threading.Lock())
+
     def read_file(self, path, lock_file):
-        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
-            with open(path) as f:
-                return f.read()
+        with self._thread_lock(lock_file) if lock_file else no_op():
+            with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+                with open(path) as f:
+                    return f.read()
 
     def write_file(self, path, contents, lock_file):
-        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
-            with open(path, "w") as f:
-                f.write(contents)
+        with self._thread_lock(lock_file) if lock_file else no_op():
+            with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+                with open(path, "w") as f:
+                    f.write(contents)
 
     def base_storage_folder(self):
         return self._store_folder
@@ -0,0 +1,165 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+
+SEARCH_INDEX_FILE = "search_index.sqlite3"
+
+RECIPES_TABLE = "recipes"
+PACKAGES_TABLE = "packages"
+METADATA_TABLE = "metadata"
+
+
+class SearchIndex(object):
+    """ SQLite index of the recipe revisions and the binaries of the server storage, with the
+    conaninfo.txt of the latest package revision of every package_id already serialized
+    (serialize_min()), so searches don't have to walk the storage or parse the conaninfo files.
+
+    The recipes are indexed by their ref.dir_repr() (without revision), like the storage folders
+    """
+
+    def __init__(self, dbfile):
+        self.dbfile = dbfile
+        self._complete = False
+
+    @staticmethod
+    def create(dbfile, store_folder):
+        """ The index is complete (and used for searches) if it is created for a new storage or
+        after "conan_server --reindex"
+        """
+        new_storage = not os.path.exists(store_folder) or not os.listdir(store_folder)
+        index = SearchIndex(dbfile)
+        index._create_tables(complete=new_storage)
+        return index
+
+    def _create_tables(self, complete):
+        par = os.path.dirname(self.dbfile)
+        if not os.path.exists(par):
+            os.makedirs(par)
+        connection = sqlite3.connect(self.dbfile, timeout=60)
+        try:
+            with connection:
+                cursor = connection.cursor()
+                cursor.execute("create table if not exists %s (reference TEXT, revision TEXT, "
+                               "PRIMARY KEY (reference, revision))" % RECIPES_TABLE)
+                cursor.execute("create table if not exists %s (reference TEXT, revision TEXT, "
+                               "package_id TEXT, package_revision TEXT, info TEXT, "
+                               "PRIMARY KEY (reference, revision, package_id))" % PACKAGES_TABLE)
+                cursor.execute("create table if not exists %s (key TEXT PRIMARY KEY, value TEXT)"
+                               % METADATA_TABLE)
+                if complete:
+                    cursor.execute("insert or ignore into %s values ('complete', '1')"
+                                   % METADATA_TABLE)
+        except Exception as e:
+            raise ConanException("Could not initialize the search index database", e)
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _connect(self):
+        """ Every operation is a transaction, committed when it finishes without errors
+        """
+        if not os.path.exists(self.dbfile):
+            # Removed while the server is running, it is incomplete until a reindex
+            self._complete = False
+            self._create_tables(complete=False)
+        connection = sqlite3.connect(self.dbfile, timeout=60)
+        connection.text_factory = str
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @property
+    def complete(self):
+        # Once complete, it is kept up to date by the ServerStore, it is not checked again
+        if not self._complete:
+            with self._connect() as connection:
+                cursor = connection.execute("select value from %s where key='complete'"
+                                            % METADATA_TABLE)
+                self._complete = cursor.fetchone() is not None
+        return self._complete
+
+    def add_recipe(self, reference, revision):
+        with self._connect() as connection:
+            connection.execute("insert or ignore into %s values (?, ?)" % RECIPES_TABLE,
+                               (reference, revision))
+
+    def remove_recipe(self, reference, revision=None):
+        """ Removes the given recipe revision, or all of them, and their packages
+        """
+        where, args = _where(reference, revision)
+        with self._connect() as connection:
+            connection.execute("delete from %s where %s" % (RECIPES_TABLE, where), args)
+            connection.execute("delete from %s where %s" % (PACKAGES_TABLE, where), args)
+
+    def update_package(self, reference, revision, package_id, package_revision, info):
+        """ info is the serialize_min() of the conaninfo.txt of the latest package revision,
+        None removes the package from the index
+        """
+        with self._connect() as connection:
+            if info is None:
+                connection.execute("delete from %s where reference=? and revision=? and "
+                                   "package_id=?" % PACKAGES_TABLE,
+                                   (reference, revision, package_id))
+            else:
+                connection.execute("insert or replace into %s values (?, ?, ?, ?, ?)"
+                                   % PACKAGES_TABLE, (reference, revision, package_id,
+                                                      package_revision, json.dumps(info)))
+
+    def remove_packages(self, reference, revision, package_ids=None):
+        with self._connect() as connection:
+            if not package_ids:
+                connection.execute("delete from %s where reference=? and revision=?"
+                                   % PACKAGES_TABLE, (reference, revision))
+            else:
+                connection.executemany("delete from %s where reference=? and revision=? and "
+                                       "package_id=?" % PACKAGES_TABLE,
+                                       [(reference, revision, p) for p in package_ids])
+
+    def recipes(self):
+        """ returns [(reference, revision)] """
+        with self._connect() as connection:
+            cursor = connection.execute("select reference, revision from %s" % RECIPES_TABLE)
+            return cursor.fetchall()
+
+    def packages(self, reference, revisions):
+        """ returns {package_id: (revision, package_revision, serialize_min())} of the first of
+        the given recipe revisions containing every package_id
+        """
+        result = {}
+        with self._connect() as connection:
+            for revision in revisions:
+                cursor = connection.execute("select package_id, package_revision, info from %s "
+                                            "where reference=? and revision=? order by package_id"
+                                            % PACKAGES_TABLE, (reference, revision))
+                for package_id, package_revision, info in cursor:
+                    if package_id not in result:
+                        result[package_id] = revision, package_revision, json.loads(info)
+        return result
+
+    def rebuild(self, recipes, packages):
+        """ Replaces the whole index in a single transaction
+        recipes: iterable of (reference, revision)
+        packages: iterable of (reference, revision, package_id, package_revision, info)
+        """
+        with self._connect() as connection:
+            connection.execute("delete from %s" % RECIPES_TABLE)
+            connection.execute("delete from %s" % PACKAGES_TABLE)
+            connection.executemany("insert or ignore into %s values (?, ?)" % RECIPES_TABLE,
+                                   recipes)
+            connection.executemany("insert or replace into %s values (?, ?, ?, ?, ?)"
+                                   % PACKAGES_TABLE,
+                                   ((r, rev, p, prev, json.dumps(info))
+                                    for r, rev, p, prev, info in packages))
+            connection.execute("insert or replace into %s values ('complete', '1')"
+                               % METADATA_TABLE)
+
+
+def _where(reference, revision):
+    if revision is None:
+        return "reference=?", (reference, )
+    return "reference=? and revision=?", (reference, revision)
@@ -1,25 +1,47 @@
 import os
+import threading
 from os.path import join, normpath, relpath
 
 from conans import DEFAULT_REVISION_V1
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
+from conans.model.info import ConanInfo
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.paths import EXPORT_FOLDER, PACKAGES_FOLDER
-from conans.server.revision_list import RevisionList
+from conans.paths import CONANINFO, EXPORT_FOLDER, PACKAGES_FOLDER
+from conans.server.revision_list import RevisionList, RevisionListCache
+from conans.util.files import list_folder_subdirs, load
+from conans.util.log import logger
 
 REVISIONS_FILE = "revisions.txt"
 
 
 class ServerStore(object):
 
-    def __init__(self, storage_adapter):
+    def __init__(self, storage_adapter, search_index=None):
         self._storage_adapter = storage_adapter
         self._store_folder = storage_adapter._store_folder
+        self._search_index = search_index
+        # Serializes the read-modify-write of the revisions files among the server threads
+        self._revisions_lock = threading.Lock()
+        self._revisions_cache = RevisionListCache()
 
     @property
     def store(self):
         return self._store_folder
 
+    @property
+    def revisions_cache(self):
+        """ The RevisionListCache, its stats() (hits, misses, size) can be used for monitoring
+        """
+        return self._revisions_cache
+
+    @property
+    def search_index(self):
+        """ The SearchIndex, only if it is complete and can be used for the searches
+        """
+        if self._search_index is not None and self._search_index.complete:
+            return self._search_index
+        return None
+
     def base_folder(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV to get recipe reference"
         tmp = normpath(join(self.store, ref.dir_repr()))
@@ -111,6 +133,70 @@ class ServerStore(object):
                     break  # not empty
             ref_path = os.path.dirname(ref_path)
 
+    # ######### SEARCH INDEX
+    def _index_recipe(self, ref):
+        if self._search_index is not None:
+            self._search_index.add_recipe(ref.copy_clear_rev().dir_repr(), ref.revision)
+
+    def _read_package_info(self, ref, package_id):
+        """ returns (prev, serialize_min() of conaninfo.txt) of the latest package revision,
+        or None if it doesn't exist (yet)
+        """
+        pref = PackageReference(ref, package_id)
+        try:
+            revision_entry = self.get_last_package_revision(pref)
+            if not revision_entry:
+                return None
+            pref = PackageReference(ref, package_id, revision_entry.revision)
+            info_path = join(self.package(pref), CONANINFO)
+            if not os.path.exists(info_path):
+                return None
+            return pref.revision, ConanInfo.loads(load(info_path)).serialize_min()
+        except Exception as exc:  # FIXME: Too wide
+            logger.error("Package %s has no ConanInfo file" % str(pref))
+            if str(exc):
+                logger.error(str(exc))
+            return None
+
+    def _index_package(self, ref, package_id):
+        if self._search_index is not None:
+            package_info = self._read_package_info(ref, package_id)
+            prev, info = package_info if package_info else (None, None)
+            self._search_index.update_package(ref.copy_clear_rev().dir_repr(), ref.revision,
+                                              package_id, prev, info)
+
+    def index_uploaded_file(self, path):
+        """ Updates the search index after the upload of a file with a path relative to the store
+        name/version/user/channel/rrev/(export|package/package_id/prev)/filename
+        """
+        if self._search_index is None:
+            return
+        parts = path.replace("\\", "/").split("/")
+        if len(parts) == 9 and parts[5] == PACKAGES_FOLDER and parts[8] == CONANINFO:
+            ref = ConanFileReference(*parts[:5])
+            self._index_recipe(ref)
+            self._index_package(ref, parts[6])
+        elif len(parts) >= 6:
+            self._index_recipe(ConanFileReference(*parts[:5]))
+
+    def reindex(self):
+        """ Rebuilds the search index from the storage, returns the number of
+        (recipe revisions, packages) indexed
+        """
+        recipes = []
+        packages = []
+        for folder in list_folder_subdirs(basedir=self.store, level=5):
+            ref = ConanFileReference(*folder.split("/"))
+            reference = ref.copy_clear_rev().dir_repr()
+            recipes.append((reference, ref.revision))
+            for package_id in list_folder_subdirs(self.packages(ref), level=1):
+                package_info = self._read_package_info(ref, package_id)
+                if package_info:
+                    prev, info = package_info
+                    packages.append((reference, ref.revision, package_id, prev, info))
+        self._search_index.rebuild(recipes, packages)
+        return len(recipes), len(packages)
+
     # ######### DELETE (APIv1 and APIv2)
     def remove_conanfile(self, ref):
         assert isinstance(ref, ConanFileReference)
@@ -120,6 +206,9 @@ class ServerStore(object):
             self._storage_adapter.delete_folder(self.base_folder(ref))
             self._remove_revision_from_index(ref)
         self._delete_empty_dirs(ref)
+        self._revisions_cache.invalidate_folder(self.conan_revisions_root(ref.copy_clear_rev()))
+        if self._search_index is not None:
+            self._search_index.remove_recipe(ref.copy_clear_rev().dir_repr(), ref.revision)
 
     def remove_packages(self, ref, package_ids_filter):
         assert isinstance(ref, ConanFileReference)
@@ -128,13 +217,18 @@ class ServerStore(object):
         if not package_ids_filter:  # Remove all packages
             packages_folder = self.packages(ref)
             self._storage_adapter.delete_folder(packages_folder)
+            self._revisions_cache.invalidate_folder(packages_folder)
         else:
             for package_id in package_ids_filter:
                 pref = PackageReference(ref, package_id)
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
                 self._storage_adapter.delete_folder(package_folder)
+                self._revisions_cache.invalidate_folder(package_folder)
         self._delete_empty_dirs(ref)
+        if self._search_index is not None:
+            self._search_index.remove_packages(ref.copy_clear_rev().dir_repr(), ref.revision,
+                                               package_ids_filter)
 
     def remove_package(self, pref):
         assert isinstance(pref, PackageReference)
@@ -143,12 +237,16 @@ class ServerStore(object):
         package_folder = self.package(pref)
         self._storage_adapter.delete_folder(package_folder)
         self._remove_package_revision_from_index(pref)
+        self._index_package(pref.ref, pref.id)
 
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, ConanFileReference)
         packages_folder = self.packages(ref)
         self._storage_adapter.delete_folder(packages_folder)
+        self._revisions_cache.invalidate_folder(packages_folder)
+        if self._search_index is not None:
+            self._search_index.remove_packages(ref.copy_clear_rev().dir_repr(), ref.revision)
 
     def remove_conanfile_files(self, ref, files):
         subpath = self.export(ref)
@@ -161,6 +259,7 @@ class ServerStore(object):
         for filepath in files:
             path = join(subpath, filepath)
             self._storage_adapter.delete_file(path)
+        self._index_package(pref.ref, pref.id)
 
     # ONLY APIv1 URLS
     # ############ DOWNLOAD URLS
@@ -247,24 +346,24 @@ class ServerStore(object):
         assert(isinstance(ref, ConanFileReference))
         rev_file_path = self._recipe_revisions_file(ref)
         self._update_last_revision(rev_file_path, ref)
+        self._index_recipe(ref)
 
     def update_last_package_revision(self, pref):
         assert(isinstance(pref, PackageReference))
         rev_file_path = self._package_revisions_file(pref)
         self._update_last_revision(rev_file_path, pref)
+        self._index_package(pref.ref, pref.id)
 
     def _update_last_revision(self, rev_file_path, ref):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-        else:
-            rev_list = RevisionList()
         if ref.revision is None:
             raise ConanException("Invalid revision for: %s" % ref.full_str())
-        rev_list.add_revision(ref.revision)
-        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                         lock_file=rev_file_path + ".lock")
+        with self._revisions_lock:
+            if self._storage_adapter.path_exists(rev_file_path):
+                rev_list = self._read_revision_list(rev_file_path)
+            else:
+                rev_list = RevisionList()
+            rev_list.add_revision(ref.revision)
+            self._write_revision_list(rev_file_path, rev_list)
 
     def get_package_revisions(self, pref):
         """Returns a RevisionList"""
@@ -280,12 +379,20 @@ class ServerStore(object):
             raise PackageNotFoundException(pref, print_rev=True)
         return ret
 
+    def _read_revision_list(self, rev_file_path):
+        def load():
+            return self._storage_adapter.read_file(rev_file_path,
+                                                   lock_file=rev_file_path + ".lock")
+        return self._revisions_cache.get(rev_file_path, load)
+
+    def _write_revision_list(self, rev_file_path, rev_list):
+        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
+                                         lock_file=rev_file_path + ".lock")
+        self._revisions_cache.invalidate(rev_file_path)
+
     def _get_revisions_list(self, rev_file_path):
         if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-            return rev_list
+            return self._read_revision_list(rev_file_path)
         else:
             return RevisionList()
 
@@ -297,8 +404,7 @@ class ServerStore(object):
             if self.path_exists(os.path.join(os.path.dirname(rev_file_path), DEFAULT_REVISION_V1)):
                 rev_list = RevisionList()
                 rev_list.add_revision(DEFAULT_REVISION_V1)
-                self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                                 lock_file=rev_file_path + ".lock")
+                self._write_revision_list(rev_file_path, rev_list)
                 return rev_list.latest_revision()
             else:
                 return None
@@ -330,29 +436,25 @@ class ServerStore(object):
         return rev_list.get_time(pref.revision)
 
     def _remove_revision_from_index(self, ref):
-        rev_list = self._load_revision_list(ref)
-        rev_list.remove_revision(ref.revision)
-        self._save_revision_list(rev_list, ref)
+        with self._revisions_lock:
+            rev_list = self._load_revision_list(ref)
+            rev_list.remove_revision(ref.revision)
+            self._save_revision_list(rev_list, ref)
 
     def _remove_package_revision_from_index(self, pref):
-        rev_list = self._load_package_revision_list(pref)
-        rev_list.remove_revision(pref.revision)
-        self._save_package_revision_list(rev_list, pref)
+        with self._revisions_lock:
+            rev_list = self._load_package_revision_list(pref)
+            rev_list.remove_revision(pref.revision)
+            self._save_package_revision_list(rev_list, pref)
 
     def _load_revision_list(self, ref):
-        path = self._recipe_revisions_file(ref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        return self._read_revision_list(self._recipe_revisions_file(ref))
 
     def _save_revision_list(self, rev_list, ref):
-        path = self._recipe_revisions_file(ref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
+        self._write_revision_list(self._recipe_revisions_file(ref), rev_list)
 
     def _save_package_revision_list(self, rev_list, pref):
-        path = self._package_revisions_file(pref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
+        self._write_revision_list(self._package_revisions_file(pref), rev_list)
 
     def _load_package_revision_list(self, pref):
-        path = self._package_revisions_file(pref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        return self._read_revision_list(self._package_revisions_file(pref))
@@ -0,0 +1,78 @@
+import os
+import platform
+import textwrap
+import unittest
+
+import pytest
+
+from conans.client.cache.object_store import ObjectStore
+from conans.errors import ConanException
+from conans.model.manifest import FileTreeManifest
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient
+from conans.util.files import load, save
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="st_nlink of hardlinks")
+class PackageDedupTest(unittest.TestCase):
+
+    def test_install_remove(self):
+        client = TestClient(default_server_user=True)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                options = {"debug": [True, False]}
+                default_options = {"debug": False}
+                exports = "*"
+                def package(self):
+                    self.copy("*.h")
+                    self.copy("*.lib")
+            """)
+        client.save({"conanfile.py": conanfile,
+                     "header.h": "header",
+                     "mylib.lib": "mylib"})
+        client.run("create . pkg/0.1@ -o pkg:debug=False")
+        client.save({"mylib.lib": "mylib debug"})
+        client.run("create . pkg/0.1@ -o pkg:debug=True")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        client.run("config set storage.package_dedup=True")
+        client.run("install pkg/0.1@ -o pkg:debug=False")
+        client.run("install pkg/0.1@ -o pkg:debug=True")
+
+        layout = client.cache.package_layout(ConanFileReference.loads("pkg/0.1"))
+        folders = {}
+        for package_id in layout.package_ids():
+            folder = layout.package(PackageReference(layout.ref, package_id))
+            folders[load(os.path.join(folder, "mylib.lib"))] = folder
+        release, debug = folders["mylib"], folders["mylib debug"]
+        release_header = os.stat(os.path.join(release, "header.h"))
+        self.assertEqual(release_header.st_ino, os.stat(os.path.join(debug, "header.h")).st_ino)
+        self.assertEqual(release_header.st_nlink, 3)  # The 2 packages and the object
+        self.assertNotEqual(os.stat(os.path.join(release, "mylib.lib")).st_ino,
+                            os.stat(os.path.join(debug, "mylib.lib")).st_ino)
+        self.assertEqual(os.stat(os.path.join(release, "conaninfo.txt")).st_nlink, 1)
+        read_manifest, expected_manifest = layout.package_manifests(
+            PackageReference(layout.ref, os.path.basename(release)))
+        self.assertEqual(read_manifest, expected_manifest)
+
+        objects = os.path.join(client.cache.store, ".objects")
+        self.assertEqual(sum(len(files) for _, _, files in os.walk(objects)), 3)
+        client.run("remove pkg/0.1@ -p %s -f" % os.path.basename(debug))
+        self.assertEqual(sum(len(files) for _, _, files in os.walk(objects)), 2)
+        self.assertEqual(os.stat(os.path.join(release, "header.h")).st_nlink, 2)
+        client.run("remove * -f")
+        self.assertEqual(sum(len(files) for _, _, files in os.walk(objects)), 0)
+        client.run("search")
+        self.assertIn("There are no packages", client.out)
+
+    def test_corrupted(self):
+        folder = temp_folder()
+        save(os.path.join(folder, "header.h"), "header")
+        FileTreeManifest.create(folder).save(folder)
+        save(os.path.join(folder, "header.h"), "modified")
+        store = ObjectStore(os.path.join(temp_folder(), "objects"))
+        with self.assertRaisesRegex(ConanException, "Corrupted package file 'header.h'"):
+            store.add_folder(folder, FileTreeManifest.load(folder))
@@ -0,0 +1,122 @@
+import json
+import os
+import time
+import unittest
+
+from mock import Mock
+
+from conans.client.cache.cache import REMOTE_NOT_FOUND
+from conans.client.cache.remote_not_found import RemoteNotFoundCache
+from conans.errors import NotFoundException
+from conans.client.tools.env import environment_append
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient
+from conans.util.files import load
+
+
+class RemoteNotFoundCacheTest(unittest.TestCase):
+
+    @staticmethod
+    def _run(client, command):
+        """ returns the debug log of the command, where the counters of the cache are reported
+        """
+        log_file = os.path.join(temp_folder(), "conan.log")
+        with environment_append({"CONAN_LOGGING_LEVEL": "debug", "CONAN_LOGGING_FILE": log_file}):
+            client.run(command)
+        assert "Remote not found cache" not in client.out
+        return load(log_file)
+
+    def test_missing_binary(self):
+        client = TestClient(default_server_user=True)
+        client.run("config set general.remote_not_found_ttl=3600")
+        client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+        client.run("export . user/testing")
+        client.run("upload pkg/0.1@user/testing")
+        client.run("remove * -f")
+
+        log = self._run(client, "install pkg/0.1@user/testing --build=missing")
+        self.assertIn("Remote not found cache: 0 requests skipped, 1 not found added, "
+                      "0 invalidated", log)
+        entries = json.loads(load(os.path.join(client.cache_folder, REMOTE_NOT_FOUND)))
+        url = client.cache.registry.load_remotes()["default"].url
+        self.assertEqual(list(entries[url]), ["pkg/0.1@user/testing"])
+
+        # The binary is not requested again to the remote
+        client.run("remove pkg/0.1@user/testing -p -f")
+        log = self._run(client, "install pkg/0.1@user/testing --build=missing")
+        self.assertIn("pkg/0.1@user/testing:5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9 - Build",
+                      client.out)
+        self.assertIn("Remote not found cache: 1 requests skipped, 0 not found added, "
+                      "0 invalidated", log)
+
+        # Unless checking for updates
+        client.run("remove pkg/0.1@user/testing -p -f")
+        log = self._run(client, "install pkg/0.1@user/testing --build=missing --update")
+        self.assertIn("Remote not found cache: 0 requests skipped, 1 not found added, "
+                      "1 invalidated", log)
+
+        # Or after uploading it
+        log = self._run(client, "upload pkg/0.1@user/testing --all")
+        self.assertIn("Remote not found cache: 0 requests skipped, 0 not found added, "
+                      "2 invalidated", log)
+        self.assertEqual(json.loads(load(os.path.join(client.cache_folder, REMOTE_NOT_FOUND))),
+                         {})
+        client.run("remove pkg/0.1@user/testing -p -f")
+        client.run("install pkg/0.1@user/testing")
+        self.assertIn("pkg/0.1@user/testing:5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9 - Download",
+                      client.out)
+
+    def test_disabled(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+        client.run("export . user/testing")
+        client.run("upload pkg/0.1@user/testing")
+        client.run("remove * -f")
+        log = self._run(client, "install pkg/0.1@user/testing --build=missing")
+        self.assertNotIn("Remote not found cache", log)
+        self.assertFalse(os.path.exists(os.path.join(client.cache_folder, REMOTE_NOT_FOUND)))
+
+
+class RemoteNotFoundMergeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(temp_folder(), REMOTE_NOT_FOUND)
+        self.remote = Mock(url="http://myremote")
+        self.remote.name = "myremote"
+        self.ref = ConanFileReference.loads("pkg/0.1@user/testing#rrev")
+        self.pref = PackageReference(self.ref, "pkgid")
+
+    def _not_found(self, not_found_cache, ref_or_pref):
+        def lookup():
+            raise NotFoundException("Not found")
+        with self.assertRaises(NotFoundException):
+            not_found_cache.lookup(self.remote, ref_or_pref, lookup)
+
+    def test_concurrent_processes(self):
+        first = RemoteNotFoundCache(self.path, 3600)
+        second = RemoteNotFoundCache(self.path, 3600)
+        self._not_found(first, self.pref)
+        second.invalidate(self.remote, self.ref)  # After the first not found, wins
+        self._not_found(second, self.ref)
+        first.save()
+        second.save()
+        entries = json.loads(load(self.path))
+        self.assertEqual(list(entries[self.remote.url]["pkg/0.1@user/testing"]),
+                         ["pkg/0.1@user/testing#rrev"])
+
+        third = RemoteNotFoundCache(self.path, 3600)
+        self._not_found(third, self.ref)
+        self.assertEqual((third.skipped, third.added), (1, 0))
+        self.assertEqual(third.lookup(self.remote, self.pref, lambda: "info"), "info")
+
+    def test_ttl(self):
+        not_found_cache = RemoteNotFoundCache(self.path, 0.1)
+        self._not_found(not_found_cache, self.pref)
+        self._not_found(not_found_cache, self.pref)
+        self.assertEqual((not_found_cache.skipped, not_found_cache.added), (1, 1))
+        time.sleep(0.2)
+        self.assertEqual(not_found_cache.lookup(self.remote, self.pref, lambda: "info"), "info")
+        not_found_cache.save()
+        self.assertEqual(json.loads(load(self.path)), {})
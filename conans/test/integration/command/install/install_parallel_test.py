@@ -1,6 +1,10 @@
+import os
+import textwrap
 import unittest
 
+from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import save
 
 
 class InstallParallelTest(unittest.TestCase):
@@ -28,3 +32,219 @@ class InstallParallelTest(unittest.TestCase):
         self.assertIn("Downloading binary packages in %s parallel threads" % threads, client.out)
         for i in range(counter):
             self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+    def test_parallel_build_jobs(self):
+        client = TestClient()
+        client.run("config set general.parallel_build_jobs=4")
+        client.save({"conanfile.py": GenConanfile().with_build_msg("building!")})
+        for i in range(3):
+            client.run("export . dep%s/0.1@user/testing" % i)
+        client.save({"conanfile.py": GenConanfile().with_build_msg("building!")
+                                                   .with_require("dep0/0.1@user/testing")
+                                                   .with_require("dep1/0.1@user/testing")
+                                                   .with_require("dep2/0.1@user/testing")})
+        client.run("export . pkg/0.1@user/testing")
+
+        client.run("install pkg/0.1@user/testing --build")
+        self.assertIn("Installing binary packages in 4 parallel threads", client.out)
+        for name in ("dep0", "dep1", "dep2", "pkg"):
+            self.assertIn("%s/0.1@user/testing: WARN: building!" % name, client.out)
+            self.assertIn("%s/0.1@user/testing: Package '" % name, client.out)
+        # The output of every node is written in one block, without interleaving
+        output = str(client.out).split("Installing binary packages in 4 parallel threads")[1]
+        lines = [line.split(":")[0].split(" ")[0] for line in output.splitlines()
+                 if line.startswith(("dep", "pkg/"))]
+        blocks = [name for i, name in enumerate(lines) if i == 0 or lines[i - 1] != name]
+        self.assertEqual(len(blocks), len(set(blocks)))
+        # The consumer is built after all its dependencies
+        self.assertEqual(blocks[-1], "pkg/0.1@user/testing")
+
+    def test_parallel_build_commands(self):
+        # Each build waits for the command of the other build to be running, so it only
+        # succeeds if the commands of both builds run concurrently
+        folder = temp_folder()
+        save(os.path.join(folder, "wait.py"), textwrap.dedent("""
+            import os, sys, time
+            folder, name, other = sys.argv[1:]
+            open(os.path.join(folder, name), "w").close()
+            for _ in range(200):
+                if os.path.exists(os.path.join(folder, other)):
+                    sys.exit(0)
+                time.sleep(0.05)
+            sys.exit(1)
+            """))
+        conanfile = textwrap.dedent("""
+            import os, sys
+            from conans import ConanFile, tools
+
+            class Pkg(ConanFile):
+                other = "{other}"
+
+                def build(self):
+                    with tools.environment_append({{"BUILDING_PKG": self.name}}):
+                        self.run('"%s" "%s" "%s" %s %s' % (sys.executable, r"{wait}", r"{folder}",
+                                                           self.name, self.other))
+                        # The process state of this node, changed by the other meanwhile
+                        assert os.environ["BUILDING_PKG"] == self.name
+                        assert os.getcwd() == self.build_folder
+            """)
+        client = TestClient()
+        client.run("config set general.parallel_build_jobs=2")
+        for name, other in (("dep0", "dep1"), ("dep1", "dep0")):
+            client.save({"conanfile.py": conanfile.format(other=other, folder=folder,
+                                                          wait=os.path.join(folder, "wait.py"))})
+            client.run("export . %s/0.1@" % name)
+        client.save({"conanfile.py": GenConanfile().with_require("dep0/0.1")
+                                                   .with_require("dep1/0.1")}, clean_first=True)
+        client.run("install . --build")
+        self.assertIn("dep0/0.1: Package '", client.out)
+        self.assertIn("dep1/0.1: Package '", client.out)
+
+    def test_parallel_build_env_info(self):
+        # The environment of the dependencies of a node doesn't leak to the other node building
+        # at the same time, neither to the process
+        folder = temp_folder()
+        save(os.path.join(folder, "wait.py"), textwrap.dedent("""
+            import os, sys, time
+            folder, name, other = sys.argv[1:]
+            assert os.environ["{}_VAR".format(name)] == name
+            assert "{}_VAR".format(other) not in os.environ
+            open(os.path.join(folder, name), "w").close()
+            for _ in range(200):
+                if os.path.exists(os.path.join(folder, other)):
+                    sys.exit(0)
+                time.sleep(0.05)
+            sys.exit(1)
+            """))
+        dep = textwrap.dedent("""
+            from conans import ConanFile
+
+            class Dep(ConanFile):
+                def package_info(self):
+                    self.env_info.{name}_VAR = "{name}"
+            """)
+        conanfile = textwrap.dedent("""
+            import os, sys
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                requires = "dep{name}/0.1"
+
+                def build(self):
+                    assert "{other}_VAR" not in os.environ
+                    self.run('"%s" "%s" "%s" {name} {other}' % (sys.executable, r"{wait}",
+                                                                 r"{folder}"))
+                    assert os.environ["{name}_VAR"] == "{name}"
+                    assert "{other}_VAR" not in os.environ
+            """)
+        client = TestClient()
+        client.run("config set general.parallel_build_jobs=2")
+        for name, other in (("A", "B"), ("B", "A")):
+            client.save({"dep.py": dep.format(name=name),
+                         "conanfile.py": conanfile.format(name=name, other=other, folder=folder,
+                                                          wait=os.path.join(folder, "wait.py"))})
+            client.run("create dep.py dep%s/0.1@" % name)
+            client.run("export . pkg%s/0.1@" % name)
+        client.save({"conanfile.py": GenConanfile().with_require("pkgA/0.1")
+                                                   .with_require("pkgB/0.1")}, clean_first=True)
+        client.run("install . --build=missing")
+        self.assertIn("pkgA/0.1: Package '", client.out)
+        self.assertIn("pkgB/0.1: Package '", client.out)
+        self.assertNotIn("A_VAR", os.environ)
+        self.assertNotIn("B_VAR", os.environ)
+
+    def test_parallel_build_jobs_error(self):
+        client = TestClient()
+        client.run("config set general.parallel_build_jobs=2")
+        conanfile = GenConanfile().with_build_msg("building!")
+        client.save({"ok.py": conanfile,
+                     "fail.py": str(conanfile) + "\n        raise Exception('Boom!')",
+                     "pkg.py": GenConanfile().with_require("ok/0.1")
+                                             .with_require("fail/0.1")})
+        client.run("export ok.py ok/0.1@")
+        client.run("export fail.py fail/0.1@")
+        client.run("export pkg.py pkg/0.1@")
+
+        client.run("install pkg/0.1@ --build", assert_error=True)
+        self.assertIn("fail/0.1: Error in build() method, line 7", client.out)
+        self.assertIn("Boom!", client.out)
+        self.assertNotIn("pkg/0.1: Building your package", client.out)
+
+    def test_parallel_download_and_build(self):
+        client = TestClient(default_server_user=True)
+        client.run("config set general.parallel_download=2")
+        client.run("config set general.parallel_build_jobs=2")
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(3):
+            client.run("create . dep%s/0.1@" % i)
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+        client.save({"conanfile.py": GenConanfile().with_require("dep0/0.1")
+                                                   .with_require("dep1/0.1")})
+        client.run("export . pkg/0.1@")
+        client.save({"conanfile.py": GenConanfile().with_require("pkg/0.1")
+                                                   .with_require("dep2/0.1")})
+
+        client.run("install . --build=missing")
+        for i in range(3):
+            self.assertIn("dep%s/0.1: Package installed" % i, client.out)
+        self.assertIn("pkg/0.1: Package '", client.out)
+        self.assertIn("pkg/0.1: Created package revision", client.out)
+
+    def test_parallel_recipes_prefetch(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(4):
+            client.run("create . dep%s/0.1@" % i)
+        client.save({"conanfile.py": GenConanfile().with_require("dep0/0.1")
+                                                   .with_require("dep1/0.1")})
+        client.run("create . pkg/0.1@")
+        client.run("upload * --all --confirm")
+        client.save({"conanfile.py": GenConanfile().with_require("pkg/0.1")
+                                                   .with_require("dep2/0.1")
+                                                   .with_require("dep3/0.1")
+                                                   .with_require("dep1/0.1")})
+
+        def graph_output(parallel):
+            client.run("remove * -f")
+            client.run("config set general.parallel_download=%s" % parallel)
+            client.run("install .")
+            output = str(client.out).split("Installing package")[0]
+            # The files transfers are not buffered, they are shown as they happen
+            return [line for line in output.splitlines()
+                    if not line.startswith(("Downloading ", "Decompressing "))]
+
+        sequential = graph_output(1)
+        self.assertIn("dep3/0.1: Downloaded recipe revision 0", sequential)
+        # The recipes are downloaded concurrently, but the result is identical
+        self.assertEqual(graph_output(4), sequential)
+
+    def test_parallel_recipes_prefetch_error(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . dep/0.1@")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+        client.run("config set general.parallel_download=4")
+        client.save({"conanfile.py": GenConanfile().with_require("dep/0.1")
+                                                   .with_require("missing/0.1")})
+        client.run("install .", assert_error=True)
+        self.assertIn("dep/0.1: Downloaded recipe revision", client.out)
+        self.assertIn("ERROR: Unable to find 'missing/0.1' in remotes", client.out)
+
+    def test_parallel_binaries_check(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile().with_settings("os")})
+        for i in range(3):
+            client.run("create . dep%s/0.1@ -s os=Linux" % i)
+        client.run("export . missing/0.1@")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+        client.run("config set general.parallel_download=4")
+        client.save({"conanfile.py": GenConanfile().with_require("dep0/0.1")
+                                                   .with_require("dep1/0.1")
+                                                   .with_require("dep2/0.1")
+                                                   .with_require("missing/0.1")})
+        client.run("info . -s os=Linux")
+        self.assertEqual(str(client.out).count("Binary: Missing"), 1)
+        self.assertEqual(str(client.out).count("Binary: Download"), 3)
@@ -1,4 +1,5 @@
 import os
+import platform
 import sys
 import unittest
 
@@ -28,7 +29,8 @@ class RemoveLocksTest(unittest.TestCase):
         ref = ConanFileReference.loads("Hello/0.1@lasote/testing")
         conan_folder = client.cache.package_layout(ref).base_folder()
         self.assertIn("locks", os.listdir(conan_folder))
-        self.assertTrue(os.path.exists(conan_folder + ".count"))
+        if platform.system() == "Windows":  # Otherwise, flock() of the .count.lock file
+            self.assertTrue(os.path.exists(conan_folder + ".count"))
         self.assertTrue(os.path.exists(conan_folder + ".count.lock"))
         client.run("remove * --locks", assert_error=True)
         self.assertIn("ERROR: Specifying a pattern is not supported", client.out)
@@ -37,7 +39,11 @@ class RemoveLocksTest(unittest.TestCase):
         client.run("remove --locks")
         self.assertNotIn("locks", os.listdir(conan_folder))
         self.assertFalse(os.path.exists(conan_folder + ".count"))
-        self.assertFalse(os.path.exists(conan_folder + ".count.lock"))
+        # The flock() lock file is never removed, there could be a process waiting on it
+        if platform.system() == "Windows":
+            self.assertFalse(os.path.exists(conan_folder + ".count.lock"))
+        else:
+            self.assertTrue(os.path.exists(conan_folder + ".count.lock"))
 
 
 class RemoveRegistryTest(unittest.TestCase):
@@ -292,11 +298,11 @@ class RemoveTest(unittest.TestCase):
         folders = os.listdir(self.client.storage_folder)
         six.assertCountEqual(self, ["Hello", "Other", "Bye"], folders)
         six.assertCountEqual(self, ["build", "source", "export", "export_source", "metadata.json",
-                                    "dl", "metadata.json.lock"],
+                                    "dl", "metadata.json.lock", "packages_summary.json"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/1.4.10/myuser/testing")))
         six.assertCountEqual(self, ["build", "source", "export", "export_source", "metadata.json",
-                                    "dl", "metadata.json.lock"],
+                                    "dl", "metadata.json.lock", "packages_summary.json"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/2.4.11/myuser/testing")))
 
@@ -346,11 +352,11 @@ class RemoveTest(unittest.TestCase):
         folders = os.listdir(self.client.storage_folder)
         six.assertCountEqual(self, ["Hello", "Other", "Bye"], folders)
         six.assertCountEqual(self, ["package", "dl", "source", "export", "export_source",
-                                    "metadata.json", "metadata.json.lock"],
+                                    "metadata.json", "metadata.json.lock", "packages_summary.json"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/1.4.10/myuser/testing")))
         six.assertCountEqual(self, ["package", "dl", "source", "export", "export_source",
-                                    "metadata.json", "metadata.json.lock"],
+                                    "metadata.json", "metadata.json.lock", "packages_summary.json"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/2.4.11/myuser/testing")))
 
@@ -364,11 +370,11 @@ class RemoveTest(unittest.TestCase):
         folders = os.listdir(self.client.storage_folder)
         six.assertCountEqual(self, ["Hello", "Other", "Bye"], folders)
         six.assertCountEqual(self, ["package", "build", "export", "export_source", "metadata.json",
-                                    "dl", "metadata.json.lock"],
+                                    "dl", "metadata.json.lock", "packages_summary.json"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/1.4.10/myuser/testing")))
         six.assertCountEqual(self, ["package", "build", "export", "export_source", "metadata.json",
-                                    "dl", "metadata.json.lock"],
+                                    "dl", "metadata.json.lock", "packages_summary.json"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/2.4.11/myuser/testing")))
 
@@ -1,3 +1,4 @@
+import os
 import textwrap
 
 from mock import patch
@@ -82,7 +83,64 @@ def test_beat_character_long_upload():
         with patch("conans.util.progress_bar.TIMEOUT_BEAT_CHARACTER", "%&$"):
             client.run("upload pkg/0.1@user/stable --all")
     out = "".join(str(client.out).splitlines())
-    assert "Compressing package...%&$%&$Uploading conan_package.tgz -> pkg/0.1@user/stable:5ab8" \
-           in out
+    # The package is compressed concurrently with the upload of the previous artifacts, its
+    # message can be mixed with the "Uploading package" one
+    assert "Compressing package..." in out
+    assert "Compressing recipe...%&$" in out
+    assert "Uploading conan_package.tgz -> pkg/0.1@user/stable:5ab8" in out
     assert "%&$Uploading conan_export.tgz" in out
     assert "%&$Uploading conaninfo.txt" in out
+
+
+def test_upload_parallel_files():
+    """Upload the files of every package concurrently, always the compressed ones first"""
+
+    class RecordingRequester(TestRequester):
+        uploaded = []
+
+        def put(self, *args, **kwargs):
+            RecordingRequester.uploaded.append(args[0])
+            return super(RecordingRequester, self).put(*args, **kwargs)
+
+    client = TestClient(requester_class=RecordingRequester, default_server_user=True)
+    client.run("config set general.parallel_upload_files=4")
+    client.save({"conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                               .with_default_option("shared", False)})
+    client.run("create . lib/1.0@user/channel")
+    client.run("create . lib/1.0@user/channel -o lib:shared=True")
+    client.run("upload lib* -c --all -r default")
+    assert "Uploaded 8 files" in client.out
+
+    uploaded = RecordingRequester.uploaded
+    package_urls = [url for url in uploaded if "conan_package.tgz" in url]
+    assert len(package_urls) == 2
+    for package_url in package_urls:
+        package_folder = package_url.rsplit("/", 1)[0]
+        package_files = [url for url in uploaded if url.startswith(package_folder + "/")]
+        assert len(package_files) == 3
+        assert package_files[0] == package_url
+
+
+def test_upload_parallel_hooks():
+    """The hooks of the packages uploaded in parallel are not executed concurrently"""
+    client = TestClient(default_server_user=True)
+    hook = textwrap.dedent("""
+        import time
+        running = []
+
+        def pre_upload_package(output, reference, package_id, **kwargs):
+            assert not running, "Concurrent hooks"
+            running.append(package_id)
+            time.sleep(0.1)
+            running.remove(package_id)
+        """)
+    client.save({os.path.join(client.cache.hooks_path, "my_hook.py"): hook,
+                 "conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                               .with_default_option("shared", False)})
+    client.run("config set hooks.my_hook.py")
+    client.run("user -p password -r default user")
+    client.run("config set general.parallel_upload_files=4")
+    client.run("create . lib/1.0@user/channel")
+    client.run("create . lib/1.0@user/channel -o lib:shared=True")
+    client.run("upload lib* --parallel -c --all -r default")
+    assert "Uploaded 8 files" in client.out
@@ -1,9 +1,14 @@
 import os
 
+import pytest
+
+from conans import REVISIONS
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import uncompress_packaged_files
-from conans.test.utils.tools import TestClient
+from conans.paths import PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import zstd_available
 
 
 def test_reuse_uploaded_tgz():
@@ -93,3 +98,92 @@ def test_upload_only_tgz_if_needed():
     folder = uncompress_packaged_files(server_paths, pref)
     libraries = os.listdir(os.path.join(folder, "lib"))
     assert len(libraries) == 1
+
+
+def _server_package_files(client, ref):
+    server_store = client.servers["default"].server_store
+    rev = server_store.get_last_revision(ref).revision
+    ref = ref.copy_with_rev(rev)
+    package_id = client.cache.package_layout(ref).package_ids()[0]
+    pref = PackageReference(ref, package_id)
+    prev = server_store.get_last_package_revision(pref).revision
+    return os.listdir(server_store.package(pref.copy_with_revs(rev, prev)))
+
+
+@pytest.mark.skipif(not zstd_available(), reason="Requires the zstandard package")
+def test_upload_zstd_package():
+    client = TestClient(default_server_user=True)
+    client.run("config set general.package_compression_format=zstd")
+    conanfile = GenConanfile("pkg", "0.1").with_package_file("lib/file.lib", "File contents")
+    client.save({"conanfile.py": conanfile})
+    client.run("create . user/stable")
+    client.run("upload pkg/0.1@user/stable --all")
+    ref = ConanFileReference.loads("pkg/0.1@user/stable")
+    files = _server_package_files(client, ref)
+    assert PACKAGE_TZST_NAME in files
+    assert PACKAGE_TGZ_NAME not in files
+
+    client.run("remove * -f")
+    client.run("install pkg/0.1@user/stable")
+    assert "Downloaded package revision" in client.out
+    pkg_folder = client.cache.package_layout(ref).packages()
+    pkg_folder = os.path.join(pkg_folder, os.listdir(pkg_folder)[0])
+    assert client.load(os.path.join(pkg_folder, "lib", "file.lib")) == "File contents"
+    assert PACKAGE_TZST_NAME not in os.listdir(pkg_folder)
+
+    # Uploading the other format replaces the previous one
+    client.run("config set general.package_compression_format=gzip")
+    client.run("upload pkg/0.1@user/stable --all --force")
+    files = _server_package_files(client, ref)
+    assert PACKAGE_TGZ_NAME in files
+    assert PACKAGE_TZST_NAME not in files
+    client.run("remove * -f")
+    client.run("install pkg/0.1@user/stable")
+    pkg_folder = client.cache.package_layout(ref).packages()
+    pkg_folder = os.path.join(pkg_folder, os.listdir(pkg_folder)[0])
+    assert client.load(os.path.join(pkg_folder, "lib", "file.lib")) == "File contents"
+
+
+@pytest.mark.skipif(not zstd_available(), reason="Requires the zstandard package")
+@pytest.mark.parametrize("first, second", [("gzip", "zstd"), ("zstd", "gzip")])
+def test_reupload_changed_package_other_format(first, second):
+    # Without revisions the package is overwritten, the archive of the previous upload in the
+    # other format is removed, so no client can install the previous contents
+    client = TestClient(default_server_user=True, revisions_enabled=False)
+    ref = ConanFileReference.loads("pkg/0.1@user/stable")
+    for compression_format, contents in ((first, "Old contents"), (second, "New contents")):
+        client.run("config set general.package_compression_format=%s" % compression_format)
+        conanfile = GenConanfile("pkg", "0.1").with_package_file("lib/file.lib", contents)
+        client.save({"conanfile.py": conanfile})
+        client.run("create . user/stable")
+        client.run("upload pkg/0.1@user/stable --all")
+    files = _server_package_files(client, ref)
+    assert (PACKAGE_TZST_NAME in files) == (second == "zstd")
+    assert (PACKAGE_TGZ_NAME in files) == (second == "gzip")
+
+    client.run("remove * -f")
+    client.run("install pkg/0.1@user/stable")
+    pkg_folder = client.cache.package_layout(ref).packages()
+    pkg_folder = os.path.join(pkg_folder, os.listdir(pkg_folder)[0])
+    assert client.load(os.path.join(pkg_folder, "lib", "file.lib")) == "New contents"
+
+
+@pytest.mark.skipif(not zstd_available(), reason="Requires the zstandard package")
+def test_upload_zstd_package_not_capable_server():
+    server = TestServer(users={"user": "password"}, server_capabilities=[REVISIONS])
+    client = TestClient(servers={"default": server}, users={"default": [("user", "password")]})
+    client.run("config set general.package_compression_format=zstd")
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    client.run("create . user/stable")
+    client.run("upload pkg/0.1@user/stable --all")
+    files = _server_package_files(client, ConanFileReference.loads("pkg/0.1@user/stable"))
+    assert PACKAGE_TGZ_NAME in files
+    assert PACKAGE_TZST_NAME not in files
+
+
+def test_package_compression_format_invalid():
+    client = TestClient()
+    client.run("config set general.package_compression_format=bzip2")
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    client.run("create . user/stable")
+    client.run("upload pkg/0.1@user/stable --all -r=default", assert_error=True)
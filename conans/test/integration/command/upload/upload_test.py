@@ -280,6 +280,31 @@ class UploadTest(unittest.TestCase):
         self.assertIn("ERROR: Hello0/1.2.1@frodo/stable:5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9: "
                       "Upload package to 'default' failed: Cannot upload corrupted package",
                       client.out)
+        client.run("upload Hello0/1.2.1@frodo/stable --all --check --paranoid", assert_error=True)
+        self.assertIn("WARN: Mismatched checksum 'added.txt'", client.out)
+        self.assertIn("Cannot upload corrupted package", client.out)
+        client.run("upload Hello0/1.2.1@frodo/stable --all --paranoid", assert_error=True)
+        self.assertIn("'--paranoid' argument can only be used together with '--check'",
+                      client.out)
+
+    def test_upload_check_keeps_package_folder(self):
+        client = TestClient(default_server_user=True)
+        client.run("config set general.read_only_cache=True")
+        client.save({"conanfile.py": conanfile,
+                     "include/hello.h": ""})
+        client.run("create . frodo/stable")
+        ref = ConanFileReference.loads("Hello0/1.2.1@frodo/stable")
+        layout = client.cache.package_layout(ref)
+        pref = PackageReference(ref, layout.package_ids()[0])
+        package_files = sorted(os.listdir(layout.package(pref)))
+
+        client.run("upload Hello0/1.2.1@frodo/stable --all --check")
+        self.assertIn("Package integrity OK!", client.out)
+        # The checksums of the package files are cached out of the package
+        self.assertEqual(sorted(os.listdir(layout.package(pref))), package_files)
+        self.assertTrue(os.path.exists(layout.package_checksums(pref)))
+        client.run("remove Hello0/1.2.1@frodo/stable -p -f")
+        self.assertFalse(os.path.exists(layout.package_checksums(pref)))
 
     def test_upload_modified_recipe(self):
         client = TestClient(default_server_user=True)
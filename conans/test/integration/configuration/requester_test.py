@@ -3,18 +3,21 @@
 import os
 import unittest
 
+import pytest
 import six
+from bottle import redirect, request, response
 from mock import Mock, MagicMock
 
 from conans import __version__
 from conans.client.cache.cache import ClientCache
 from conans.client.conf import get_default_client_conf, ConanClientConfigParser
 from conans.client.rest.conan_requester import ConanRequester
+from conans.client.rest.http2_session import Http2Session, http2_available
 from conans.client.tools import environment_append
 from conans.client.tools.files import replace_in_file, save
 from conans.errors import ConanException
 from conans.paths import CACERT_FILE
-from conans.test.utils.tools import temp_folder
+from conans.test.utils.tools import temp_folder, StoppableThreadBottle
 from conans.test.utils.mocks import TestBufferConanOutput
 from conans.util.files import normalize
 
@@ -99,3 +102,92 @@ class ConanRequesterHeadersTests(unittest.TestCase):
         requester.get(url="aaa", headers={"User-Agent": "MyUserAgent"})
         headers = mock_http_requester.get.call_args[1]["headers"]
         self.assertEqual("MyUserAgent", headers["User-Agent"])
+
+
+class ConanRequesterPoolTests(unittest.TestCase):
+
+    @staticmethod
+    def _config(general=""):
+        conan_conf = os.path.join(temp_folder(), "conan.conf")
+        save(conan_conf, "[general]\n%s" % general)
+        return ConanClientConfigParser(conan_conf)
+
+    def test_shared_adapter(self):
+        session = ConanRequester(self._config())._http_requester
+        adapter = session.get_adapter("https://myremote.com")
+        self.assertIs(adapter, session.get_adapter("http://otherremote.com"))
+        other_session = ConanRequester(self._config())._http_requester
+        self.assertIsNot(session, other_session)
+        self.assertIs(adapter, other_session.get_adapter("https://otherremote.com"))
+        self.assertEqual(adapter._pool_maxsize, 10)
+
+    def test_pool_size_parallel(self):
+        requester = ConanRequester(self._config("parallel_download=32"))
+        adapter = requester._http_requester.get_adapter("https://myremote.com")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        requester = ConanRequester(self._config("parallel_upload_files=16"))
+        adapter = requester._http_requester.get_adapter("https://myremote.com")
+        self.assertEqual(adapter._pool_maxsize, 16)
+
+    def test_http2_transport(self):
+        with six.assertRaisesRegex(self, ConanException, "Invalid 'general.http_transport'"):
+            ConanRequester(self._config("http_transport=http3"))
+        config = self._config("http_transport=http2")
+        if http2_available():
+            requester = ConanRequester(config)
+            self.assertIsInstance(requester._http_requester, Http2Session)
+        else:
+            with six.assertRaisesRegex(self, ConanException, "requires the 'httpx\\[http2\\]'"):
+                ConanRequester(config)
+
+
+@pytest.mark.skipif(not http2_available(), reason="Requires httpx[http2]")
+def test_http2_session_requests():
+    """ The Http2Session supports the requests arguments used by the rest clients, follows the
+    redirects and retries the failed requests
+    """
+    http_server = StoppableThreadBottle()
+    failures = []
+
+    @http_server.server.get("/redirect")
+    def redirect_get():
+        redirect("/target")
+
+    @http_server.server.get("/target")
+    def target_get():
+        return "target"
+
+    @http_server.server.post("/json")
+    def json_post():
+        return {"received": request.json, "type": request.content_type}
+
+    @http_server.server.get("/flaky")
+    def flaky_get():
+        if len(failures) < 2:
+            failures.append(1)
+            response.status = 503
+            return "failure"
+        return "recovered"
+
+    http_server.run_server()
+    url = "http://%s:%s" % (http_server.host, http_server.port)
+
+    config = ConanRequesterPoolTests._config("http_transport=http2\nretry=2")
+    requester = ConanRequester(config)
+    ret = requester.get(url + "/redirect")
+    assert ret.status_code == 200
+    assert ret.content == b"target"
+    ret = requester.get(url + "/redirect", allow_redirects=False)
+    assert ret.status_code in (302, 303)
+
+    ret = requester.post(url + "/json", json={"files": ["conanfile.py"]})
+    assert ret.json() == {"received": {"files": ["conanfile.py"]}, "type": "application/json"}
+
+    ret = requester.get(url + "/flaky")
+    assert ret.status_code == 200
+    assert ret.content == b"recovered"
+    assert len(failures) == 2
+
+    del failures[:]
+    requester = ConanRequester(ConanRequesterPoolTests._config("http_transport=http2\nretry=0"))
+    assert requester.get(url + "/flaky").status_code == 503
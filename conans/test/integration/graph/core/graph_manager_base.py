@@ -14,6 +14,7 @@ from conans.client.graph.graph_manager import GraphManager
 from conans.client.graph.proxy import ConanProxy
 from conans.client.graph.python_requires import ConanPythonRequire, PyRequireLoader
 from conans.client.graph.range_resolver import RangeResolver
+from conans.client.graph.remote_lookup import RemoteLookup
 from conans.client.installer import BinaryInstaller
 from conans.client.loader import ConanFileLoader
 from conans.client.recorder.action_recorder import ActionRecorder
@@ -41,14 +42,15 @@ class GraphManagerTest(unittest.TestCase):
         self.remote_manager = MockRemoteManager()
         cache = self.cache
         self.resolver = RangeResolver(self.cache, self.remote_manager)
-        proxy = ConanProxy(cache, self.output, self.remote_manager)
+        remote_lookup = RemoteLookup(cache)
+        proxy = ConanProxy(cache, self.output, self.remote_manager, remote_lookup)
         pyreq_loader = PyRequireLoader(proxy, self.resolver)
         pyreq_loader.enable_remotes(remotes=Remotes())
         self.loader = ConanFileLoader(None, self.output, ConanPythonRequire(None, None),
                                       pyreq_loader=pyreq_loader)
-        binaries = GraphBinariesAnalyzer(cache, self.output, self.remote_manager)
+        binaries = GraphBinariesAnalyzer(cache, self.output, self.remote_manager, remote_lookup)
         self.manager = GraphManager(self.output, cache, self.remote_manager, self.loader, proxy,
-                                    self.resolver, binaries)
+                                    self.resolver, binaries, remote_lookup)
         generator_manager = GeneratorManager()
         hook_manager = Mock()
         app_type = namedtuple("ConanApp", "cache out remote_manager hook_manager graph_manager"
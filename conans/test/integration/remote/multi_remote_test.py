@@ -259,6 +259,49 @@ class MultiRemoteTest(unittest.TestCase):
         # s2 is not even tried
         self.assertNotIn("MyLib/0.1@conan/testing: Trying with 's2'...", client2.out)
 
+    def test_parallel_remote_lookup(self):
+        ref = "Hello0/0.1@lasote/stable"
+        self.client.run("config set general.revisions_enabled=1")
+        self.client.save({"conanfile.py": GenConanfile("Hello0", "0.1")})
+        self.client.run("create . lasote/stable")
+        self.client.run("upload %s -r=remote0" % ref)
+        self.client.run("upload %s -r=remote1 --all" % ref)
+        self.client.run("upload %s -r=remote2 --all" % ref)
+
+        client2 = TestClient(servers=self.servers, users=self.users)
+        client2.run("config set general.revisions_enabled=1")
+        client2.run("config set general.parallel_remote_lookup=True")
+        client2.run("install %s" % ref)
+        # The recipe from the first remote, the binary from the first one with the binary
+        self.assertIn("Hello0/0.1@lasote/stable: Trying with 'remote0'...", client2.out)
+        self.assertNotIn("Trying with 'remote1'", client2.out)
+        self.assertIn("Hello0/0.1@lasote/stable: Retrieving package "
+                      "5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9 from remote 'remote1'",
+                      client2.out)
+
+        client2.run('remove "*" -f')
+        client2.run("install Hello1/0.1@lasote/stable", assert_error=True)
+        self.assertIn("Unable to find 'Hello1/0.1@lasote/stable' in remotes", client2.out)
+
+    def test_parallel_remote_lookup_fail_when_not_notfound(self):
+        servers = OrderedDict()
+        servers["s0"] = TestServer()
+        servers["s1"] = TestServer()
+        servers["s2"] = TestServer()
+
+        client = TestClient(servers=servers, users=self.users)
+        client.save({"conanfile.py": GenConanfile("MyLib", "0.1")})
+        client.run("create . lasote/testing")
+        client.run("user lasote -p mypass -r s2")
+        client.run("upload MyLib* -r s2 -c --all")
+
+        servers["s1"].fake_url = "http://asdlhaljksdhlajkshdljakhsd.com"  # Do not exist
+        client2 = TestClient(servers=servers, users=self.users)
+        client2.run("config set general.parallel_remote_lookup=True")
+        client2.run("install MyLib/0.1@lasote/testing", assert_error=True)
+        self.assertIn("Unable to connect to s1=http://asdlhaljksdhlajkshdljakhsd.com", client2.out)
+        self.assertNotIn("Trying with 's2'", client2.out)
+
     def test_install_from_remotes(self):
         for i in range(3):
             ref = ConanFileReference.loads("Hello%d/0.1@lasote/stable" % i)
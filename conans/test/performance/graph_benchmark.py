@@ -0,0 +1,68 @@
+""" Benchmark of the dependency graph computation with synthetic graphs of a growing number of
+nodes, measuring "conan info" and "conan lock create" of a consumer of the whole graph.
+
+The graph has --levels levels of packages, every package of a level requires the package in the
+same position of the previous level plus --requires random ones with a lower position, so the
+graph of every size is a subset of the largest one and the recipes are exported only once.
+
+    python -m conans.test.performance.graph_benchmark --nodes 100 500 1000 1500
+"""
+import argparse
+import random
+import time
+
+from conans.test.utils.tools import GenConanfile, TestClient
+
+
+def _ref(level, index):
+    return "pkg%s_%s/1.0" % (level, index)
+
+
+def _export_recipes(client, levels, width, requires):
+    rand = random.Random(42)
+    for level in range(levels):
+        for index in range(width):
+            conanfile = GenConanfile().with_settings("os", "build_type")
+            if level > 0:
+                deps = {index}
+                deps.update(rand.randint(0, index) for _ in range(requires))
+                for dep in sorted(deps):
+                    conanfile.with_require(_ref(level - 1, dep))
+            client.save({"conanfile.py": conanfile}, clean_first=True)
+            client.run("export . %s@" % _ref(level, index))
+
+
+def _timed(client, command):
+    t1 = time.time()
+    client.run(command)
+    return time.time() - t1
+
+
+def run_benchmark(nodes, levels, requires):
+    client = TestClient()
+    width = max(nodes) // levels
+    t1 = time.time()
+    _export_recipes(client, levels, width, requires)
+    print("Exported %d recipes in %.2fs" % (levels * width, time.time() - t1))
+    for count in nodes:
+        count_width = count // levels
+        consumer = "[requires]\n%s" % "\n".join(_ref(levels - 1, i) for i in range(count_width))
+        client.save({"conanfile.txt": consumer}, clean_first=True)
+        info = _timed(client, "info conanfile.txt --only=None")
+        lock = _timed(client, "lock create conanfile.txt --lockfile-out=conan.lock")
+        print("%6d nodes: info %7.2fs, lock create %7.2fs" % (levels * count_width, info, lock))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[100, 250, 500, 1000])
+    parser.add_argument("--levels", type=int, default=10, help="Depth of the graph")
+    parser.add_argument("--requires", type=int, default=3,
+                        help="Random extra requirements of every package")
+    args = parser.parse_args()
+    run_benchmark(sorted(args.nodes), args.levels, args.requires)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+""" Micro-benchmark of the package_id computation of a graph of --nodes packages, every one
+declaring --compatible compatible packages in its package_id() method, as the recipes that are
+compatible with older compiler versions do:
+
+    def package_id(self):
+        for version in ("5", "6", "7", "8", "9"):
+            compatible_pkg = self.info.clone()
+            compatible_pkg.settings.compiler.version = version
+            self.compatible_packages.append(compatible_pkg)
+
+The settings are the default settings.yml ones, and every package has some options and requires
+the previous --requires packages of the graph.
+
+    python -m conans.test.performance.package_id_benchmark --nodes 500 --compatible 50
+"""
+import argparse
+import time
+
+from conans.client.conf import get_default_settings_yml
+from conans.model.info import ConanInfo
+from conans.model.options import OptionsValues
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.model.settings import Settings
+
+
+def _settings():
+    settings = Settings.loads(get_default_settings_yml())
+    settings.update_values([("os", "Linux"), ("arch", "x86_64"), ("compiler", "gcc"),
+                            ("compiler.version", "9"), ("compiler.libcxx", "libstdc++11"),
+                            ("compiler.cppstd", "17"), ("build_type", "Release")])
+    return settings.values
+
+
+def _infos(nodes, requires):
+    settings = _settings()
+    prefs = [PackageReference(ConanFileReference.loads("pkg%d/1.%d@user/channel#rev%d"
+                                                       % (i, i, i)), "id%d" % i)
+             for i in range(nodes)]
+    infos = []
+    for i in range(nodes):
+        deps = prefs[max(0, i - requires):i]
+        options = [("shared", "False"), ("fPIC", "True"), ("with_ssl", "True")]
+        options.extend(("%s:shared" % pref.ref.name, "False") for pref in deps)
+        info = ConanInfo.create(settings.copy(), OptionsValues(options), deps[-3:], deps[:-3],
+                                "semver_direct_mode", None, "minor_mode")
+        infos.append(info)
+    return infos
+
+
+def _compute_package_ids(infos, compatible):
+    versions = [str(v) for v in range(compatible)]
+    for info in infos:
+        info.package_id()
+        for version in versions:
+            compatible_pkg = info.clone()
+            compatible_pkg.settings.compiler.version = version
+            compatible_pkg.package_id()
+            compatible_pkg.package_id()  # The binaries analyzer can compute it again
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=500)
+    parser.add_argument("--compatible", type=int, default=50,
+                        help="Compatible packages of every package")
+    parser.add_argument("--requires", type=int, default=10,
+                        help="Requirements of every package")
+    args = parser.parse_args()
+    infos = _infos(args.nodes, args.requires)
+    t1 = time.time()
+    _compute_package_ids(infos, args.compatible)
+    print("%d nodes, %d compatible packages: %.2fs"
+          % (args.nodes, args.compatible, time.time() - t1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+""" Micro-benchmark of the package queries ("conan search <ref> -q", "conan remove -q", the
+conan_server searches) evaluated over --packages generated conaninfo serialize_min() infos.
+
+    python -m conans.test.performance.package_query_benchmark --packages 100000
+"""
+import argparse
+import random
+import time
+
+from conans.search.search import filter_packages
+
+QUERIES = ['os=Linux',
+           'os=Windows AND compiler="Visual Studio" AND compiler.version=16',
+           '(arch=x86_64 OR arch=armv8) AND build_type=Release AND shared=True',
+           'compiler=gcc AND (compiler.version=9 OR compiler.version=10) AND '
+           'compiler.libcxx=libstdc++11 AND with_ssl=None']
+
+
+def _infos(packages):
+    rand = random.Random(42)
+    compilers = {"gcc": ["7", "8", "9", "10"], "clang": ["10", "11", "12"],
+                 "Visual Studio": ["15", "16"]}
+    infos = {}
+    for i in range(packages):
+        compiler = rand.choice(sorted(compilers))
+        settings = {"os": "Windows" if compiler == "Visual Studio" else rand.choice(["Linux",
+                                                                                     "Macos"]),
+                    "arch": rand.choice(["x86", "x86_64", "armv8"]),
+                    "build_type": rand.choice(["Debug", "Release"]),
+                    "compiler": compiler,
+                    "compiler.version": rand.choice(compilers[compiler])}
+        if compiler != "Visual Studio":
+            settings["compiler.libcxx"] = rand.choice(["libstdc++", "libstdc++11", "libc++"])
+        options = {"shared": rand.choice(["True", "False"]),
+                   "fPIC": rand.choice(["True", "False"])}
+        if rand.random() < 0.5:
+            options["with_ssl"] = "True"
+        infos["%040x" % i] = {"settings": settings, "options": options, "full_requires": [],
+                              "recipe_hash": "hash"}
+    return infos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, default=100000)
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args()
+    infos = _infos(args.packages)
+    total = 0
+    for query in QUERIES:
+        t1 = time.time()
+        for _ in range(args.repetitions):
+            result = filter_packages(query, infos)
+        elapsed = (time.time() - t1) / args.repetitions
+        total += elapsed
+        print("%7d matches %7.3fs: %s" % (len(result), elapsed, query))
+    print("%d packages, %d queries: %.3fs" % (args.packages, len(QUERIES), total))
+
+
+if __name__ == "__main__":
+    main()
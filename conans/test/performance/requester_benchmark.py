@@ -0,0 +1,98 @@
+""" Latency of the small requests (ping, recipes search) done concurrently by --threads threads
+through the same ConanRequester, like the parallel downloads do, against a local conan_server.
+
+Compares a requester with the requests default pool of 10 connections per host (the connections
+exceeding it are closed after every request) with the ones sized after the parallelism, and
+with the "http2" transport if the httpx[http2] package is installed (conan_server only supports
+HTTP/1.1, so it measures the httpx pool).
+
+    python -m conans.test.performance.requester_benchmark --threads 32 --requests 50
+"""
+import argparse
+import os
+import time
+from multiprocessing import Process
+from multiprocessing.pool import ThreadPool
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from conans.client.conf import ConanClientConfigParser
+from conans.client.rest.conan_requester import ConanRequester
+from conans.client.rest.http2_session import http2_available
+from conans.server.rest.server import THREADED_MODE
+from conans.test.performance.server_load_benchmark import _wait_server
+from conans.test.utils.server_launcher import TestServerLauncher
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import get_free_port
+from conans.util.files import save
+
+
+def _requester(threads, transport):
+    conan_conf = os.path.join(temp_folder(), "conan.conf")
+    save(conan_conf, "[general]\nparallel_download=%s\nhttp_transport=%s" % (threads, transport))
+    config = ConanClientConfigParser(conan_conf)
+    if transport == "default":
+        # The requester before sizing and sharing the pools
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter())
+        return ConanRequester(config, session)
+    return ConanRequester(config)
+
+
+def _latencies(requester, urls):
+    result = []
+    for url in urls:
+        t1 = time.time()
+        r = requester.get(url)
+        r.raise_for_status()
+        result.append(time.time() - t1)
+    return result
+
+
+def run_benchmark(url, transport, threads, count):
+    requester = _requester(threads, transport)
+    urls = ["%s/v1/ping" % url, "%s/v2/conans/search?q=pkg*" % url]
+    urls = [urls[i % 2] for i in range(count)]
+    _latencies(requester, urls[:2])  # warm up
+    pool = ThreadPool(threads)
+    t1 = time.time()
+    latencies = sorted(sum(pool.map(lambda _: _latencies(requester, urls), range(threads)), []))
+    elapsed = time.time() - t1
+    pool.close()
+    print("%-8s %6d requests in %6.2fs: %8.1f req/s, avg %6.2fms, p95 %6.2fms"
+          % (transport, len(latencies), elapsed, len(latencies) / elapsed,
+             sum(latencies) / len(latencies) * 1000, latencies[int(len(latencies) * 0.95)] * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50,
+                        help="Requests done by every thread")
+    parser.add_argument("--workers", type=int, default=32, help="conan_server threads")
+    args = parser.parse_args()
+
+    launcher = TestServerLauncher(write_permissions=[("*/*@*/*", "*")])
+    port = get_free_port()
+    server = Process(target=launcher.ra.run, kwargs={"host": "localhost", "port": port,
+                                                     "mode": THREADED_MODE,
+                                                     "workers": args.workers, "quiet": True})
+    server.start()
+    url = "http://localhost:%s" % port
+    try:
+        _wait_server(url)
+        transports = ["default", "http1"]
+        if http2_available():
+            transports.append("http2")
+        for transport in transports:
+            run_benchmark(url, transport, args.threads, args.requests)
+    finally:
+        server.terminate()
+        server.join()
+        launcher.clean()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+""" Load benchmark of conan_server: concurrent clients uploading and downloading files, and
+listing revisions, against a local server running in each of the given server modes.
+
+    python -m conans.test.performance.server_load_benchmark --clients 16 --size 5
+"""
+import argparse
+import os
+import time
+from multiprocessing import Process
+from multiprocessing.pool import ThreadPool
+
+import requests
+
+from conans.server.rest.server import SINGLE_MODE, THREADED_MODE, SERVER_MODES
+from conans.test.utils.server_launcher import TestServerLauncher
+from conans.test.utils.tools import get_free_port
+
+USER = "demo"
+PASSWORD = "demo"
+
+
+def _wait_server(url, timeout=10):
+    t1 = time.time()
+    while True:
+        try:
+            return requests.get("%s/v1/ping" % url)
+        except requests.ConnectionError:
+            if time.time() - t1 > timeout:
+                raise
+            time.sleep(0.1)
+
+
+def _client(url, token, index, contents, iterations):
+    """ Every client uploads its own recipe revision and downloads it back """
+    session = requests.Session()
+    session.headers["Authorization"] = "Bearer %s" % token
+    recipe = "%s/v2/conans/pkg%s/1.0/_/_/revisions/rev%s" % (url, index, index)
+    transferred = 0
+    for _ in range(iterations):
+        r = session.put("%s/files/conan_sources.tgz" % recipe, data=contents)
+        r.raise_for_status()
+        r = session.get("%s/files/conan_sources.tgz" % recipe, stream=True)
+        r.raise_for_status()
+        for chunk in r.iter_content(65536):
+            transferred += len(chunk)
+        transferred += len(contents)
+        r = session.get("%s/v2/conans/pkg%s/1.0/_/_/revisions" % (url, index))
+        r.raise_for_status()
+    return transferred
+
+
+def run_benchmark(mode, workers, clients, size, iterations):
+    launcher = TestServerLauncher(users={USER: PASSWORD},
+                                  write_permissions=[("*/*@*/*", "*")])
+    port = get_free_port()
+    server = Process(target=launcher.ra.run, kwargs={"host": "localhost", "port": port,
+                                                     "mode": mode, "workers": workers,
+                                                     "quiet": True})
+    server.start()
+    url = "http://localhost:%s" % port
+    try:
+        _wait_server(url)
+        token = requests.get("%s/v1/users/authenticate" % url, auth=(USER, PASSWORD)).text
+        contents = os.urandom(size)
+        pool = ThreadPool(clients)
+        t1 = time.time()
+        transferred = sum(pool.map(lambda i: _client(url, token, i, contents, iterations),
+                                   range(clients)))
+        elapsed = time.time() - t1
+        pool.close()
+    finally:
+        server.terminate()
+        server.join()
+        launcher.clean()
+    requests_count = clients * iterations * 3
+    print("%-9s workers=%-4s %6d requests in %6.2fs: %8.1f req/s, %8.1f MB/s"
+          % (mode, workers or "", requests_count, elapsed, requests_count / elapsed,
+             transferred / elapsed / 1024.0 / 1024.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", default=[SINGLE_MODE, THREADED_MODE],
+                        choices=SERVER_MODES)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--clients", type=int, default=16,
+                        help="Number of concurrent clients")
+    parser.add_argument("--iterations", type=int, default=10,
+                        help="Uploads and downloads done by every client")
+    parser.add_argument("--size", type=float, default=1,
+                        help="Size of the transferred files in MB")
+    args = parser.parse_args()
+    size = int(args.size * 1024 * 1024)
+    for mode in args.modes:
+        run_benchmark(mode, args.workers, args.clients, size, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,11 @@ import unittest
 from collections import OrderedDict
 
 import six
-from mock import Mock, call
+from mock import Mock, call, patch
 from parameterized import parameterized
 import pytest
 
+from conans.client import loader
 from conans.client.graph.python_requires import ConanPythonRequire
 from conans.client.loader import ConanFileLoader, ConanFileTextLoader, _parse_conanfile
 from conans.client.tools.files import chdir
@@ -351,3 +352,51 @@ def append(data):
             self.assertIs(loaded1.myconanlogger.value, loaded2.myconanlogger.value)
         finally:
             sys.path.remove(temp)
+
+    def test_bytecode_cache(self):
+        tmp = temp_folder()
+        bytecode_folder = os.path.join(temp_folder(), ".bytecode")
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        save(conanfile_path, "import mymodule\nvalue = mymodule.value\n")
+        save(os.path.join(tmp, "mymodule.py"), "value = 42\n")
+
+        loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertEqual(loaded.value, 42)
+        self.assertEqual(len(os.listdir(bytecode_folder)), 1)
+        self.assertNotIn("__pycache__", os.listdir(tmp))  # No .pyc next to the recipes
+
+        loader._compiled_recipes.clear()  # Other process, loading the persisted bytecode
+        loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertEqual(loaded.value, 42)
+
+        save(conanfile_path, "value = 23\n")  # Modified, compiled again
+        loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertEqual(loaded.value, 23)
+        self.assertEqual(len(os.listdir(bytecode_folder)), 2)
+
+    def test_bytecode_cache_size(self):
+        tmp = temp_folder()
+        bytecode_folder = os.path.join(temp_folder(), ".bytecode")
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        with patch.object(loader, "BYTECODE_CACHE_SIZE", 10):
+            for value in range(10):
+                save(conanfile_path, "value = %d\n" % value)
+                _parse_conanfile(conanfile_path, bytecode_folder)
+            names = os.listdir(bytecode_folder)
+            self.assertEqual(len(names), 10)
+            for index, name in enumerate(names):
+                os.utime(os.path.join(bytecode_folder, name), (index + 1, index + 1))
+            save(conanfile_path, "value = 10\n")
+            _parse_conanfile(conanfile_path, bytecode_folder)
+        # The least recently used ones are removed
+        self.assertEqual(len(os.listdir(bytecode_folder)), 9)
+        self.assertNotIn(names[0], os.listdir(bytecode_folder))
+        self.assertNotIn(names[1], os.listdir(bytecode_folder))
+
+    def test_recipe_module_renamed(self):
+        tmp = temp_folder()
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        save(conanfile_path, "import os\nvalue = 42\n")
+        loaded, module_id = _parse_conanfile(conanfile_path)
+        self.assertNotIn(module_id, sys.modules)
+        self.assertIs(sys.modules["%s.%s" % (module_id, module_id)], loaded)
@@ -112,3 +112,22 @@ class DepsGraphTest(unittest.TestCase):
         deps.add_edge(n2, n32, None)
         deps.add_edge(n32, n5, None)
         self.assertEqual([[n5, n31], [n32], [n2], [n1]], deps.by_levels())
+
+    def test_connect_closures(self):
+        names = ["liba", "libb", "libc", "libd", "libe"]
+        nodes = [Node(ConanFileReference.loads("%s/1.0" % n), Mock(), context=CONTEXT_HOST)
+                 for n in names]
+        bulk_nodes = [Node(n.ref, Mock(), context=CONTEXT_HOST) for n in nodes]
+        for n in nodes[:2]:
+            for other in nodes[2:]:
+                n.connect_closure(other)
+        Node.connect_closures(bulk_nodes[:2], bulk_nodes[2:])
+        for n, bulk in zip(nodes, bulk_nodes):
+            self.assertEqual([o.ref for o in n.public_closure],
+                             [o.ref for o in bulk.public_closure])
+            self.assertEqual([o.ref for o in n.public_deps], [o.ref for o in bulk.public_deps])
+            self.assertEqual(sorted(o.ref for o in n.inverse_closure),
+                             sorted(o.ref for o in bulk.inverse_closure))
+
+        Node.add_ancestors(bulk_nodes[2:], bulk_nodes[:2])
+        self.assertEqual([o.ref for o in bulk_nodes[4].ancestors], [nodes[0].ref, nodes[1].ref])
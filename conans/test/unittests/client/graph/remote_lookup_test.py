@@ -0,0 +1,109 @@
+import os
+import threading
+import unittest
+
+from mock import Mock
+
+from conans.client.cache.remote_not_found import RemoteNotFoundCache
+from conans.client.graph.remote_lookup import RemoteLookup
+from conans.client.rest.auth_manager import ConanApiAuthManager, non_interactive_calls
+from conans.errors import AuthenticationException, NotFoundException
+from conans.model.ref import ConanFileReference
+from conans.test.utils.test_files import temp_folder
+
+
+class RemoteLookupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = Mock()
+        self.cache.config.parallel_remote_lookup = True
+        self.cache.config.parallel_download = None
+        self.cache.remote_not_found = RemoteNotFoundCache(os.path.join(temp_folder(), "cache"),
+                                                          3600)
+        self.remote_lookup = RemoteLookup(self.cache)
+        self.remotes = []
+        for name in ("r0", "r1", "r2"):
+            remote = Mock(url="http://%s" % name)
+            remote.name = name
+            self.remotes.append(remote)
+        self.ref = ConanFileReference.loads("pkg/0.1@user/testing#rrev")
+
+    def test_first_accepted(self):
+        results = {"r0": None, "r1": "info", "r2": "other"}
+
+        def lookup(remote):
+            return self.cache.remote_not_found.lookup(remote, self.ref, results.get, remote.name)
+
+        with self.remote_lookup.session():
+            remote, result = self.remote_lookup.first_found(lookup, self.remotes,
+                                                            accept=lambda r: bool(r))
+        self.assertEqual((remote.name, result), ("r1", "info"))
+
+    def test_ignored_not_found(self):
+        r2_started = threading.Event()
+        r2_finish = threading.Event()
+
+        def lookup(remote):
+            def request():
+                if remote.name == "r2":
+                    r2_started.set()
+                    r2_finish.wait()
+                if remote.name != "r1":
+                    raise NotFoundException("Not found")
+                return "info"
+            return self.cache.remote_not_found.lookup(remote, self.ref, request)
+
+        with self.remote_lookup.session():
+            remote, result = self.remote_lookup.first_found(lookup, self.remotes)
+            self.assertEqual((remote.name, result), ("r1", "info"))
+            self.assertTrue(r2_started.wait(5))
+            r2_finish.set()
+        # The session waits for the r2 lookup, its not found is not added
+        self.assertEqual(self.cache.remote_not_found.added, 1)
+        with self.assertRaises(NotFoundException):
+            self.cache.remote_not_found.lookup(self.remotes[0], self.ref, lambda: "info")
+        self.assertEqual(self.cache.remote_not_found.lookup(self.remotes[2], self.ref,
+                                                            lambda: "info"), "info")
+
+    def test_authentication_in_calling_thread(self):
+        main_thread = threading.current_thread()
+        non_interactive = []
+
+        def lookup(remote):
+            if threading.current_thread() is not main_thread:
+                non_interactive.append(remote.name)
+                raise AuthenticationException("Please log in")
+            return "info"
+
+        with self.remote_lookup.session():
+            remote, result = self.remote_lookup.first_found(lookup, self.remotes)
+        self.assertEqual((remote.name, result), ("r0", "info"))
+        self.assertIn("r0", non_interactive)
+
+    def test_sequential_outside_session(self):
+        threads = set()
+
+        def lookup(remote):
+            threads.add(threading.current_thread())
+            raise NotFoundException("Not found")
+
+        remote, result = self.remote_lookup.first_found(lookup, self.remotes)
+        self.assertEqual((remote, result), (None, None))
+        self.assertEqual(threads, {threading.current_thread()})
+
+    def test_non_interactive_calls(self):
+        rest_client = Mock()
+        rest_client.get_recipe_manifest.side_effect = AuthenticationException("Please log in")
+        rest_client_factory = Mock()
+        rest_client_factory.new.return_value = rest_client
+        user_io = Mock()
+        localdb = Mock()
+        localdb.get_login.return_value = "user", "token", "refresh_token"
+        auth_manager = ConanApiAuthManager(rest_client_factory, user_io, localdb)
+        with non_interactive_calls():
+            with self.assertRaises(AuthenticationException):
+                auth_manager.call_rest_api_method(self.remotes[0], "get_recipe_manifest",
+                                                  self.ref)
+        self.assertFalse(rest_client.authenticate.called)
+        self.assertFalse(localdb.store.called)
+        self.assertFalse(user_io.request_login.called)
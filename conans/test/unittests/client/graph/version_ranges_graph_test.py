@@ -83,6 +83,22 @@ class VersionRangesTest(GraphTest):
             say_ref = ConanFileReference.loads("Say/%s@myuser/testing" % solution)
             self.assertEqual(_clear_revs(conanfile.requires), Requirements(str(say_ref)))
 
+    def test_local_new_versions(self):
+        # Versions and names added to the cache by the same command are found
+        content = GenConanfile().with_name("Hello").with_version("1.2")\
+                                .with_require("Say/[>0.0]@myuser/testing")\
+                                .with_require("Bye/[>0.0]@myuser/testing")
+        for v in ["3.0", "3.1"]:
+            self.retriever.save_recipe(ConanFileReference.loads("Say/%s@myuser/testing" % v),
+                                       GenConanfile().with_name("Say").with_version(v))
+            self.retriever.save_recipe(ConanFileReference.loads("Bye/%s@myuser/testing" % v),
+                                       GenConanfile().with_name("Bye").with_version(v))
+            deps_graph = self.build_graph(content)
+            say = _get_nodes(deps_graph, "Say")[0]
+            bye = _get_nodes(deps_graph, "Bye")[0]
+            self.assertEqual(say.ref.version, v)
+            self.assertEqual(bye.ref.version, v)
+
     def test_remote_basic(self):
         self.resolver._local_search = None
         remote_packages = []
@@ -0,0 +1,105 @@
+import json
+import os
+import unittest
+
+from conans.client.tools.env import environment_append
+from conans.model.graph_lock import GraphLock, GraphLockFile, GraphLockNode
+from conans.model.ref import ConanFileReference
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+class GraphLockFindTest(unittest.TestCase):
+
+    def setUp(self):
+        nodes = {"0": {"path": "conanfile.txt", "requires": ["1", "2", "10"]},
+                 "1": {"ref": "zlib/1.2.11#rev1", "package_id": "id1"},
+                 "2": {"ref": "zlib/1.2.11#rev1", "package_id": "id2"},
+                 "10": {"ref": "pkg/0.1@user/channel"}}
+        self.lock = GraphLock.deserialize({"nodes": nodes, "revisions_enabled": True}, True)
+
+    def test_find(self):
+        lock = self.lock
+        self.assertEqual(lock.get_consumer(None), "0")
+        zlib = ConanFileReference.loads("zlib/1.2.11")
+        self.assertEqual(lock.get_consumer(zlib), "1")
+        self.assertEqual(lock._find_node_by_requirement(zlib.copy_with_rev("rev1")), "1")
+        # The first one sorted by ID (as string)
+        self.assertEqual(lock._find_node_by_requirement(zlib), "1")
+
+        lock.relax()
+        zlib_range = ConanFileReference.loads("zlib/[>1.0]")
+        self.assertIn(lock._match_relaxed_require(zlib_range), ("1", "2"))
+        self.assertIsNone(lock._match_relaxed_require(ConanFileReference.loads("zlib/[>2.0]")))
+        zlib_channel = ConanFileReference.loads("zlib/[>1.0]@user/channel")
+        self.assertIsNone(lock._match_relaxed_require(zlib_channel))
+
+    def test_update_exported_ref(self):
+        lock = self.lock
+        pkg = ConanFileReference.loads("pkg/0.1@user/channel")
+        self.assertEqual(lock.get_consumer(pkg), "10")  # Indexes are computed
+        lock.update_exported_ref("10", pkg.copy_with_rev("rev2"))
+        self.assertEqual(lock._find_node_by_requirement(pkg.copy_with_rev("rev2")), "10")
+        self.assertEqual(lock._find_node_by_requirement(pkg), "10")
+        lock.relax()
+        self.assertIsNone(lock._find_node_by_requirement(pkg.copy_with_rev("rev1")))
+
+
+class GraphLockFileLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        nodes = {"0": {"path": "conanfile.txt", "requires": ["1"]},
+                 "1": {"ref": "zlib/1.2.11#rev1", "package_id": "id1", "prev": "prev1",
+                       "options": "shared=True"}}
+        self.path = os.path.join(temp_folder(), "conan.lock")
+        save(self.path, json.dumps({"graph_lock": {"nodes": nodes, "revisions_enabled": True},
+                                    "version": "0.4"}))
+
+    def _decoded(self, graph_lock):
+        return sorted(id_ for id_, n in graph_lock.nodes._nodes.items()
+                      if isinstance(n, GraphLockNode))
+
+    def test_lazy_nodes(self):
+        graph_lock = GraphLockFile.load(self.path, True).graph_lock
+        self.assertEqual(self._decoded(graph_lock), [])
+        self.assertEqual(graph_lock.build_order(), [])
+        self.assertEqual(graph_lock._find_first("name", "zlib"), "1")
+        self.assertEqual(sorted(graph_lock.nodes.keys()), ["0", "1"])
+        self.assertEqual(self._decoded(graph_lock), [])  # Not decoded to find or order them
+
+        node = graph_lock.nodes["1"]
+        self.assertIs(node, graph_lock.nodes["1"])
+        self.assertEqual(self._decoded(graph_lock), ["1"])
+        self.assertEqual(node._options, "shared=True")
+        self.assertEqual(node.options.dumps(), "shared=True")
+        # Every way of reading the nodes returns them decoded
+        self.assertTrue(all(isinstance(n, GraphLockNode) for n in graph_lock.nodes.values()))
+        self.assertIsInstance(graph_lock.nodes.pop("0"), GraphLockNode)
+        self.assertEqual(list(graph_lock.nodes), ["1"])
+        with self.assertRaises(TypeError):
+            json.dumps(graph_lock.nodes)
+
+    def test_parsed_cache(self):
+        lockfile = GraphLockFile.load(self.path, True)
+        lockfile.graph_lock.nodes["0"].requires.append("2")  # Doesn't modify the cached json
+        self.assertEqual(GraphLockFile.load(self.path, True).graph_lock.nodes["0"].requires,
+                         ["1"])
+        # Saving the modified lockfile invalidates the cache
+        lockfile = GraphLockFile.load(self.path, True)
+        lockfile.graph_lock.nodes["0"].requires.append("2")
+        lockfile.save(self.path)
+        self.assertEqual(GraphLockFile.load(self.path, True).graph_lock.nodes["0"].requires,
+                         ["1", "2"])
+
+    def test_compact(self):
+        lockfile = GraphLockFile.load(self.path, True)
+        lockfile.save(self.path)
+        pretty = load(self.path)
+        with environment_append({"CONAN_COMPACT_LOCKFILES": "1"}):
+            lockfile.save(self.path)
+        compact = load(self.path)
+        self.assertLess(len(compact), len(pretty))
+        self.assertNotIn(" ", compact)
+        self.assertEqual(json.loads(compact), json.loads(pretty))
+        node = GraphLockFile.load(self.path, True).graph_lock.nodes["1"]
+        self.assertEqual(node.options.dumps(), "shared=True")
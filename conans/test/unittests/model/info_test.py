@@ -52,6 +52,26 @@ info_text = '''[settings]
 
 class ConanInfoTest(unittest.TestCase):
 
+    def test_package_id_cache(self):
+        loaded = ConanInfo.loads(info_text)
+        info = ConanInfo.create(loaded.full_settings, loaded.full_options, loaded.full_requires,
+                                [], "semver_direct_mode", None, "minor_mode")
+        package_id = info.package_id()
+        compatible = info.clone()
+        self.assertEqual(compatible.package_id(), package_id)
+        compatible.settings.compiler.version = "4.9"
+        compatible.options.shared = True
+        other_package_id = compatible.package_id()
+        self.assertNotEqual(other_package_id, package_id)
+        compatible.settings.compiler.version = "5.2"
+        self.assertNotEqual(compatible.package_id(), package_id)  # Still shared=True
+        del compatible.options.shared
+        compatible.options.shared = False
+        self.assertEqual(compatible.package_id(), package_id)
+        compatible.requires["zlib"].version = "1.3"
+        self.assertNotEqual(compatible.package_id(), package_id)
+        self.assertEqual(info.package_id(), package_id)
+
     def test_serialize(self):
         info = ConanInfo.loads(info_text)
         min_serial = info.serialize_min()
@@ -1,6 +1,11 @@
+import json
 import os
+import time
 import unittest
 
+from mock import patch
+
+from conans.model import manifest as manifest_module
 from conans.model.manifest import FileTreeManifest
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import load, md5, save
@@ -45,3 +50,47 @@ class ManifestTest(unittest.TestCase):
         # Not included the pycs or pyo
         self.assertEqual(set(read_manifest.file_sums.keys()),
                           set(["conanfile.py"]))
+
+    def test_cached_checksums(self):
+        tmp_dir = temp_folder()
+        files = {"file%d.txt" % i: "contents %d" % i for i in range(40)}
+        for filename, content in files.items():
+            save(os.path.join(tmp_dir, filename), content)
+        old = time.time() - 10
+        for filename in files:
+            os.utime(os.path.join(tmp_dir, filename), (old, old))
+
+        cache_path = os.path.join(temp_folder(), "checksums.json")
+        # Parallel hashing
+        manifest = FileTreeManifest.create(tmp_dir, checksums_cache=cache_path)
+        self.assertEqual(manifest.file_sums, {f: md5(c) for f, c in files.items()})
+        cache = json.loads(load(cache_path))
+        self.assertEqual(sorted(cache), sorted(files))
+
+        # Modified files are hashed again, also if they keep the size, mtime and inode
+        save(os.path.join(tmp_dir, "file1.txt"), "modified")
+        os.remove(os.path.join(tmp_dir, "file2.txt"))
+        save(os.path.join(tmp_dir, "file2.txt"), "CONTENTS 2")
+        os.utime(os.path.join(tmp_dir, "file2.txt"), (old, old))
+        hashed = []
+        md5sum = manifest_module.md5sum
+
+        def tracked_md5sum(path):
+            hashed.append(os.path.basename(path))
+            return md5sum(path)
+
+        with patch.object(manifest_module, "md5sum", new=tracked_md5sum):
+            manifest = FileTreeManifest.create(tmp_dir, checksums_cache=cache_path)
+            self.assertEqual(sorted(hashed), ["file1.txt", "file2.txt"])
+            self.assertEqual(manifest.file_sums["file1.txt"], md5("modified"))
+            self.assertEqual(manifest.file_sums["file2.txt"], md5("CONTENTS 2"))
+            # file1.txt was just modified, it is not cached yet
+            cache = json.loads(load(cache_path))
+            self.assertNotIn("file1.txt", cache)
+            self.assertIn("file2.txt", cache)
+
+            hashed[:] = []
+            FileTreeManifest.create(tmp_dir, checksums_cache=cache_path, paranoid=True)
+            self.assertEqual(len(hashed), 40)
+        # The folder is not modified
+        self.assertEqual(sorted(os.listdir(tmp_dir)), sorted(files))
@@ -1,9 +1,14 @@
+import json
+import os
 import unittest
 
 import six
 
 from conans.errors import ConanException
+from conans.model import settings
 from conans.model.settings import Settings, bad_value_msg, undefined_field, undefined_value
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load
 
 
 class SettingsLoadsTest(unittest.TestCase):
@@ -138,6 +143,95 @@ class SettingsLoadsTest(unittest.TestCase):
             Settings.loads(yml)
 
 
+class SettingsLoadsCacheTest(unittest.TestCase):
+
+    def test_cache(self):
+        yml = "os:\n    Windows:\n        version: [7, 10]\n    Linux:\narch: ANY"
+        cache_path = os.path.join(temp_folder(), "settings.json")
+        s = Settings.loads(yml, cache_path)
+        self.assertEqual(json.loads(load(cache_path))["definition"],
+                         {"os": {"Windows": {"version": ["7", "10"]}, "Linux": None},
+                          "arch": "ANY"})
+        s.os = "Windows"
+        s.os.version = "10"
+        # The parsed settings of the process are not modified
+        self.assertIsNone(Settings.loads(yml, cache_path).os.value)
+
+        settings._parsed_settings.clear()
+        loaded = Settings.loads(yml, cache_path)  # From the json
+        loaded.os = "Windows"
+        loaded.os.version = "7"
+        self.assertEqual(loaded.values_list, [("os", "Windows"), ("os.version", "7")])
+
+        # Changing the settings.yml invalidates it
+        Settings.loads("os: [Windows]", cache_path)
+        self.assertEqual(json.loads(load(cache_path))["definition"], {"os": ["Windows"]})
+
+
+class SettingsCopyTest(unittest.TestCase):
+
+    def test_copy_on_write(self):
+        yml = "os:\n    Windows:\n        version: [7, 10]\n    Linux:\ncompiler: [gcc, clang]"
+        s = Settings.loads(yml)
+        s.os = "Windows"
+        copy = s.copy()
+        copy.os.version = "10"
+        copy.compiler.remove("clang")
+        copy.constraint(["os"])
+        self.assertEqual(copy.values_list, [("os", "Windows"), ("os.version", "10")])
+        self.assertEqual(s.values_list, [("os", "Windows")])
+        self.assertEqual(s.compiler.values_range, ["gcc", "clang"])
+
+        s.os.version = "7"
+        del s.os.version
+        self.assertEqual(copy.os.version, "10")
+        copy2 = copy.copy()
+        copy2.os = "Linux"
+        self.assertEqual(copy.values_list, [("os", "Windows"), ("os.version", "10")])
+        self.assertEqual(copy2.values_list, [("os", "Linux")])
+
+    def test_read_without_copy(self):
+        yml = "os:\n    Windows:\n        version: [7, 10]\n    Linux:\ncompiler: [gcc, clang]"
+        s = Settings.loads(yml)
+        s.os = "Windows"
+        s.os.version = "7"
+        copy = s.copy()
+        shared_data = copy._data
+        os_setting = copy.os
+        version = copy.os.version
+        self.assertEqual(version, "7")
+        self.assertEqual(copy.get_safe("os.version"), "7")
+        self.assertEqual(copy.os["Windows"].version.values_range, ["7", "10"])
+        self.assertEqual(copy.values_list, [("os", "Windows"), ("os.version", "7")])
+        self.assertIs(copy._data, shared_data)
+        self.assertIs(s._data, shared_data)
+
+        # Modifying the returned children only modifies the copy
+        version.value = "10"
+        os_setting["Windows"].remove("version")
+        os_setting.remove("Linux")
+        self.assertIsNot(copy._data, shared_data)
+        self.assertEqual(copy.values_list, [("os", "Windows")])
+        self.assertEqual(copy.os.values_range, ["Windows"])
+        self.assertEqual(s.values_list, [("os", "Windows"), ("os.version", "7")])
+        self.assertEqual(s.os.values_range, ["Linux", "Windows"])
+        with six.assertRaisesRegex(self, ConanException, "'settings.os.version' doesn't exist"):
+            copy.os.version = "7"
+
+    def test_child_taken_before_copy(self):
+        s = Settings.loads("compiler:\n    gcc:\n        version: [9, 10]\n    clang:")
+        s.compiler = "gcc"
+        s.compiler.version = "9"
+        compiler = s.compiler
+        version = s.compiler.version
+        copy = s.copy()
+        version.value = "10"
+        compiler.value = "clang"
+        self.assertEqual(s.values_list, [("compiler", "clang")])
+        self.assertEqual(copy.values_list, [("compiler", "gcc"), ("compiler.version", "9")])
+        self.assertEqual(s.compiler["gcc"].version, "10")
+
+
 class SettingsTest(unittest.TestCase):
 
     def setUp(self):
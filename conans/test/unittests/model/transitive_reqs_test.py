@@ -13,6 +13,7 @@ from conans.client.graph.graph_binaries import GraphBinariesAnalyzer
 from conans.client.graph.graph_builder import DepsGraphBuilder
 from conans.client.graph.python_requires import ConanPythonRequire
 from conans.client.graph.range_resolver import RangeResolver
+from conans.client.graph.remote_lookup import RemoteLookup
 from conans.client.loader import ConanFileLoader
 from conans.errors import ConanException
 from conans.model.options import OptionsValues, option_not_exist_msg, option_wrong_value_msg
@@ -87,8 +88,10 @@ class GraphTest(unittest.TestCase):
                                         self.resolver, None)
         cache = Mock()
         cache.config.default_package_id_mode = "semver_direct_mode"
+        cache.config.parallel_download = None
         cache.new_config = defaultdict(Mock)
-        self.binaries_analyzer = GraphBinariesAnalyzer(cache, self.output, self.remote_manager)
+        self.binaries_analyzer = GraphBinariesAnalyzer(cache, self.output, self.remote_manager,
+                                                       RemoteLookup(cache))
 
     def build_graph(self, content, options="", settings=""):
         self.loader._cached_conanfile_classes = {}
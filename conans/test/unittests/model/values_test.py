@@ -25,3 +25,19 @@ class ValuesTest(unittest.TestCase):
         v.compiler = None
         self.assertEqual(v.as_list(), [('compiler', 'None')])
         self.assertEqual(v.dumps(), "compiler=None")
+
+    def test_sha_cache(self):
+        v = Values.from_list([("compiler", "gcc"), ("compiler.version", "9"), ("os", "Linux")])
+        sha = v.sha
+        compiler = v.compiler
+        compiler.version = "8"  # Modifying a child invalidates the sha of the parent
+        self.assertNotEqual(v.sha, sha)
+        copy = v.copy()
+        copy.compiler.version = "9"
+        self.assertEqual(copy.sha, sha)
+        self.assertNotEqual(v.sha, sha)
+        del copy.os
+        self.assertEqual(copy.sha, Values.from_list([("compiler", "gcc"),
+                                                     ("compiler.version", "9")]).sha)
+        copy.clear()
+        self.assertEqual(copy.sha, Values().sha)
@@ -1,15 +1,18 @@
+import json
 import os
 import unittest
 
+from mock import patch
+
 from conans.client.cache.cache import ClientCache
 from conans.client.tools import chdir
 from conans.model.info import ConanInfo
-from conans.model.ref import ConanFileReference
+from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import (BUILD_FOLDER, CONANINFO, EXPORT_FOLDER, PACKAGES_FOLDER)
 from conans.search.search import search_packages, search_recipes
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.mocks import TestBufferConanOutput
-from conans.util.files import save, mkdir
+from conans.util.files import load, save, mkdir
 
 
 class SearchTest(unittest.TestCase):
@@ -37,6 +40,40 @@ class SearchTest(unittest.TestCase):
             all_artif = [_artif for _artif in sorted(packages)]
             self.assertEqual(all_artif, artifacts)
 
+    def test_packages_summary(self):
+        ref = ConanFileReference.loads("opencv/2.4.10@lasote/testing#rrev1")
+        layout = self.cache.package_layout(ref)
+        mkdir(layout.export())
+        with layout.update_metadata() as metadata:
+            metadata.recipe.revision = "rrev1"
+            for package_id in ("a", "b", "c"):
+                metadata.packages[package_id].recipe_revision = "rrev1"
+                info = ConanInfo.loads("[settings]\nos=Linux\n[options]\nshared=%s"
+                                       % (package_id == "a"))
+                save(os.path.join(layout.package(PackageReference(ref, package_id)), CONANINFO),
+                     info.dumps())
+            metadata.packages["c"].recipe_revision = "rrev0"
+
+        packages = search_packages(layout, "shared=False")
+        self.assertEqual(list(packages), ["b"])
+        self.assertEqual(packages["b"]["settings"], {"os": "Linux"})
+        summary = json.loads(load(layout.packages_summary()))
+        self.assertEqual(sorted(summary), ["a", "b", "c"])
+        self.assertEqual(summary["c"]["recipe_revision"], "rrev0")
+
+        # The conaninfo.txt files are not parsed again, unless modified
+        info_path = os.path.join(layout.package(PackageReference(ref, "b")), CONANINFO)
+        save(info_path, load(info_path).replace("os=Linux", "os=Windows"))
+        with patch("conans.search.search.ConanInfo.loads", wraps=ConanInfo.loads) as loads:
+            packages = search_packages(layout, None)
+            self.assertEqual(loads.call_count, 1)
+        self.assertEqual(sorted(packages), ["a", "b"])
+        self.assertEqual(packages["b"]["settings"], {"os": "Windows"})
+
+        layout.package_remove(PackageReference(ref, "a"))
+        self.assertEqual(list(search_packages(layout, None)), ["b"])
+        self.assertEqual(sorted(json.loads(load(layout.packages_summary()))), ["b", "c"])
+
     def test_pattern(self):
         with chdir(self.cache.store):
             references = ["opencv/2.4.%s@lasote/testing" % ref for ref in ("1", "2", "3")]
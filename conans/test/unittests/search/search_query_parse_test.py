@@ -2,7 +2,7 @@ import unittest
 
 import six
 
-from conans.search.query_parse import evaluate_postfix, infix_to_postfix
+from conans.search.query_parse import compile_postfix, evaluate_postfix, infix_to_postfix
 
 
 class QueryParseTest(unittest.TestCase):
@@ -46,3 +46,19 @@ class QueryParseTest(unittest.TestCase):
         self.assertTrue(evaluate("a=2 AND j=45 OR (h=23 AND a=2)"))
         self.assertTrue(evaluate("((((a=2 AND ((((f=23 OR j=45))))))))"))
         self.assertFalse(evaluate("((((a=2 AND ((((f=23 OR j=42))))))))"))
+
+    def test_compile_postfix(self):
+        queries = ["", "a=2", "a=4", "a=2 OR a=3", "a=4 AND j=45", "a=2 AND (f=23 OR j=45)",
+                   "a=2 AND j=45 OR h=23", "a=4 OR j=45 AND a=2", "(a=4 OR j=45) AND a=2",
+                   "((((a=2 AND ((((f=23 OR j=42))))))))"]
+        for values in ((), ("a=2", ), ("j=45", ), ("a=2", "j=45")):
+            def evaluator(expr):
+                return expr in values
+
+            def compiler(expr):
+                return lambda obj: expr in obj
+
+            for query in queries:
+                postfix = infix_to_postfix(query)
+                self.assertEqual(compile_postfix(postfix, compiler)(values),
+                                 evaluate_postfix(postfix, evaluator), query)
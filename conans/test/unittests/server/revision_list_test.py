@@ -1,10 +1,13 @@
+import os
 from math import floor
 
 import time
 import unittest
 
-from conans.server.revision_list import RevisionList
+from conans.server.revision_list import RevisionList, RevisionListCache
+from conans.test.utils.test_files import temp_folder
 from conans.util.dates import from_timestamp_to_iso8601
+from conans.util.files import load, save
 
 
 class RevisionListTest(unittest.TestCase):
@@ -40,3 +43,39 @@ class RevisionListTest(unittest.TestCase):
         r_list = RevisionList.loads(old_contents)
         when = r_list.get_time("rev1")
         self.assertEqual(when, iso)
+
+
+class RevisionListCacheTest(unittest.TestCase):
+
+    def test_cache(self):
+        folder = temp_folder()
+        path = os.path.join(folder, "pkg", "revisions.txt")
+        path2 = os.path.join(folder, "other", "revisions.txt")
+        rev = RevisionList()
+        rev.add_revision("rev1")
+        save(path, rev.dumps())
+        save(path2, rev.dumps())
+        cache = RevisionListCache(max_size=1)
+
+        self.assertEqual(cache.get(path, lambda: load(path)).latest_revision().revision, "rev1")
+        # The returned lists can be modified without changing the cached one
+        cached = cache.get(path, lambda: load(path))
+        cached.add_revision("rev2")
+        self.assertEqual(cache.get(path, lambda: load(path)).latest_revision().revision, "rev1")
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 1, "size": 1})
+
+        # Changed by another process, the mtime or the size changes
+        save(path, cached.dumps())
+        self.assertEqual(cache.get(path, lambda: load(path)).latest_revision().revision, "rev2")
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 2, "size": 1})
+
+        # The least recently used entry is discarded
+        cache.get(path2, lambda: load(path2))
+        cache.get(path, lambda: load(path))
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 4, "size": 1})
+
+        cache.invalidate_folder(os.path.join(folder, "pkg"))
+        self.assertEqual(cache.stats()["size"], 0)
+        os.unlink(path)
+        with self.assertRaises(OSError):
+            cache.get(path, lambda: load(path))
@@ -0,0 +1,113 @@
+import os
+import unittest
+from datetime import timedelta
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO
+from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.service.authorize import BasicAuthorizer
+from conans.server.service.common.search import SearchService
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.search_index import SearchIndex, SEARCH_INDEX_FILE
+from conans.server.store.server_store import ServerStore
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = temp_folder()
+        self.server_folder = temp_folder()
+        self.server_store = self._server_store()
+        authorizer = BasicAuthorizer([("*/*@*/*", "*")], [])
+        self.search_service = SearchService(authorizer, self.server_store, "lasote")
+
+    def _server_store(self):
+        updown_auth_manager = JWTUpDownAuthManager("secret", timedelta(seconds=200))
+        adapter = ServerDiskAdapter("http://url", self.tmp_dir, updown_auth_manager)
+        index = SearchIndex.create(os.path.join(self.server_folder, SEARCH_INDEX_FILE),
+                                   self.tmp_dir)
+        return ServerStore(adapter, index)
+
+    def _upload_recipe(self, ref):
+        save(os.path.join(self.server_store.export(ref), "conanfile.py"), "")
+        self.server_store.update_last_revision(ref)
+
+    def _upload_package(self, pref, os_setting):
+        save(os.path.join(self.server_store.package(pref), CONANINFO),
+             "[settings]\n    os=%s\n" % os_setting)
+        self.server_store.update_last_package_revision(pref)
+
+    def test_search(self):
+        self.assertIsNotNone(self.server_store.search_index)
+        ref = ConanFileReference.loads("openssl/2.0@lasote/testing#rev1")
+        ref2 = ConanFileReference.loads("zlib/1.2@#rev1")
+        self._upload_recipe(ref)
+        self._upload_recipe(ref2)
+        self._upload_package(PackageReference(ref, "id1", "prev1"), "Linux")
+        self._upload_package(PackageReference(ref, "id2", "prev1"), "Windows")
+
+        self.assertEqual(self.search_service.search(),
+                         [ref.copy_clear_rev(), ref2.copy_clear_rev()])
+        self.assertEqual(self.search_service.search("zlib*"), [ref2.copy_clear_rev()])
+        info = self.search_service.search_packages(ref.copy_clear_rev(), "os=Linux")
+        self.assertEqual(list(info), ["id1"])
+        self.assertEqual(info["id1"]["settings"], {"os": "Linux"})
+
+        # A new package revision replaces the previous one
+        self._upload_package(PackageReference(ref, "id1", "prev2"), "Macos")
+        info = self.search_service.search_packages(ref, None)
+        self.assertEqual(info["id1"]["settings"], {"os": "Macos"})
+
+        # A new recipe revision doesn't have binaries yet, but they can be found in all rrevs
+        ref_rev2 = ref.copy_with_rev("rev2")
+        self._upload_recipe(ref_rev2)
+        self.assertEqual(self.search_service.search_packages(ref.copy_clear_rev(), None), {})
+        info = self.search_service.search_packages(ref.copy_clear_rev(), None,
+                                                   look_in_all_rrevs=True)
+        self.assertEqual(sorted(info), ["id1", "id2"])
+
+        # Removals
+        self.server_store.remove_package(PackageReference(ref, "id1", "prev2"))
+        info = self.search_service.search_packages(ref, None)
+        self.assertEqual(info["id1"]["settings"], {"os": "Linux"})
+        self.server_store.remove_packages(ref, ["id2"])
+        self.assertEqual(list(self.search_service.search_packages(ref, None)), ["id1"])
+        self.server_store.remove_conanfile(ref.copy_clear_rev())
+        self.assertEqual(self.search_service.search(), [ref2.copy_clear_rev()])
+
+    def test_uploaded_file_v1(self):
+        ref = ConanFileReference.loads("openssl/2.0@lasote/testing#0")
+        pref = PackageReference(ref, "id1", "0")
+        save(os.path.join(self.server_store.export(ref), "conanfile.py"), "")
+        self.server_store.index_uploaded_file("openssl/2.0/lasote/testing/0/export/conanfile.py")
+        self.server_store.update_last_package_revision(pref)
+        self.assertEqual(self.search_service.search_packages(ref, None), {})
+
+        save(os.path.join(self.server_store.package(pref), CONANINFO), "[settings]\n    os=Linux")
+        self.server_store.index_uploaded_file("openssl/2.0/lasote/testing/0/package/id1/0/"
+                                              "conaninfo.txt")
+        self.assertEqual(self.search_service.search(), [ref.copy_clear_rev()])
+        info = self.search_service.search_packages(ref, None)
+        self.assertEqual(info["id1"]["settings"], {"os": "Linux"})
+
+    def test_reindex(self):
+        ref = ConanFileReference.loads("openssl/2.0@lasote/testing#rev1")
+        pref = PackageReference(ref, "id1", "prev1")
+        self._upload_recipe(ref)
+        self._upload_package(pref, "Linux")
+        # Files in the storage of a server without index
+        ref2 = ConanFileReference.loads("zlib/1.2@lasote/testing#rev1")
+        save(os.path.join(self.server_store.export(ref2), "conanfile.py"), "")
+        os.remove(os.path.join(self.server_folder, SEARCH_INDEX_FILE))
+
+        server_store = self._server_store()
+        self.assertIsNone(server_store.search_index)
+        self.assertEqual(server_store.reindex(), (2, 1))
+        search_index = server_store.search_index
+        self.assertEqual(sorted(search_index.recipes()), [("openssl/2.0/lasote/testing", "rev1"),
+                                                          ("zlib/1.2/lasote/testing", "rev1")])
+        packages = search_index.packages("openssl/2.0/lasote/testing", ["rev1"])
+        self.assertEqual(packages["id1"][:2], ("rev1", "prev1"))
+        self.assertEqual(packages["id1"][2]["settings"], {"os": "Linux"})
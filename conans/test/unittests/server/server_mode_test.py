@@ -0,0 +1,53 @@
+import threading
+import unittest
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import requests
+import six
+
+from conans.errors import ConanException
+from conans.server.rest.server import server_adapter_options, ThreadPoolWSGIServer
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class ServerModeTest(unittest.TestCase):
+
+    def test_threaded_server(self):
+        # The first request can only finish when the second one is being served concurrently
+        second_request = threading.Event()
+
+        def app(environ, start_response):
+            if environ["PATH_INFO"] == "/first":
+                result = b"ok" if second_request.wait(10) else b"timeout"
+            else:
+                second_request.set()
+                result = b"ok"
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return [result]
+
+        server_class = server_adapter_options("threaded", 2)["server_class"]
+        self.assertTrue(issubclass(server_class, ThreadPoolWSGIServer))
+        server = make_server("localhost", 0, app, server_class, QuietHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            url = "http://localhost:%s" % server.server_port
+            first = []
+            t = threading.Thread(target=lambda: first.append(requests.get(url + "/first").text))
+            t.start()
+            self.assertEqual(requests.get(url + "/second").text, "ok")
+            t.join()
+            self.assertEqual(first, ["ok"])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_options(self):
+        self.assertEqual(server_adapter_options("single", None), {"server": "wsgiref"})
+        with six.assertRaisesRegex(self, ConanException, "Invalid server_mode 'forking'"):
+            server_adapter_options("forking", 2)
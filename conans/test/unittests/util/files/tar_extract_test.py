@@ -4,13 +4,14 @@ import os
 import platform
 import tarfile
 import unittest
+from io import BytesIO
 
 import pytest
 
 from conans.client.tools.files import chdir
 from conans.model.manifest import gather_files
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import tar_extract, gzopen_without_timestamps, save
+from conans.util.files import tar_extract, gzopen_without_timestamps, load, save
 
 
 class TarExtractTest(unittest.TestCase):
@@ -63,3 +64,42 @@ class TarExtractTest(unittest.TestCase):
             with open(self.tgz_file, 'rb') as file_handler:
                 tar_extract(file_handler, destination_dir)
             check_files(destination_dir)
+
+    def test_many_and_big_files(self):
+        ori_files_dir = os.path.join(self.tmp_folder, "many")
+        contents = {}
+        for i in range(50):
+            contents["folder%s/file%s.txt" % (i % 5, i)] = "content %s" % i
+        contents["big/file.bin"] = "x" * (3 * 1024 * 1024)
+        for name, content in contents.items():
+            save(os.path.join(ori_files_dir, name), content)
+        tgz_file = os.path.join(self.tmp_folder, "many.tgz")
+        with tarfile.open(tgz_file, "w:gz") as tgz:
+            tgz.add(ori_files_dir, arcname=".")
+
+        destination_dir = os.path.join(self.tmp_folder, "dest_many")
+        with open(tgz_file, 'rb') as file_handler:
+            tar_extract(file_handler, destination_dir, threads=4)
+        for name, content in contents.items():
+            self.assertEqual(load(os.path.join(destination_dir, name)), content)
+
+    @pytest.mark.skipif(platform.system() != "Linux", reason="Requires Linux")
+    def test_unsafe_members_skipped(self):
+        outside = temp_folder()
+        tgz_file = os.path.join(self.tmp_folder, "unsafe.tgz")
+        with tarfile.open(tgz_file, "w:gz") as tgz:
+            link = tarfile.TarInfo(name="link")
+            link.type = tarfile.SYMTYPE
+            link.linkname = outside
+            tgz.addfile(link)
+            for name in ("../escaped.txt", "link/through_link.txt", "good.txt"):
+                info = tarfile.TarInfo(name=name)
+                info.size = 4
+                tgz.addfile(info, BytesIO(b"data"))
+
+        destination_dir = os.path.join(self.tmp_folder, "dest_unsafe")
+        with open(tgz_file, 'rb') as file_handler:
+            tar_extract(file_handler, destination_dir)
+        self.assertEqual(load(os.path.join(destination_dir, "good.txt")), "data")
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_folder, "escaped.txt")))
+        self.assertEqual(os.listdir(outside), [])
@@ -0,0 +1,80 @@
+import json
+import os
+import platform
+import threading
+import time
+import unittest
+
+from conans.client.tools.env import environment_append
+from conans.test.utils.mocks import TestBufferConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load
+from conans.util.locks import ReadLock, WriteLock
+
+
+class ReadWriteLockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = os.path.join(temp_folder(), "pkg", "1.0", "_", "_")
+        self.output = TestBufferConanOutput()
+
+    def _lock(self, lock_class):
+        return lock_class(self.folder, "pkg/1.0", self.output)
+
+    def test_readers_writer(self):
+        events = []
+
+        def writer():
+            with self._lock(WriteLock):
+                events.append("write")
+
+        with self._lock(ReadLock):
+            with self._lock(ReadLock):  # Several readers at the same time
+                t = threading.Thread(target=writer)
+                t.start()
+                time.sleep(0.2)
+                events.append("read")
+        t.join()
+        self.assertEqual(events, ["read", "write"])
+        self.assertIn("pkg/1.0 is locked by another concurrent conan process, wait...",
+                      self.output)
+
+    @unittest.skipIf(platform.system() == "Windows", "flock() not available")
+    def test_exception_removes_lock_file(self):
+        events = []
+
+        def writer():
+            with self._lock(WriteLock):
+                events.append(os.path.exists(self.folder + ".count.lock"))
+
+        with self.assertRaises(ZeroDivisionError):
+            with self._lock(WriteLock):
+                t = threading.Thread(target=writer)
+                t.start()
+                time.sleep(0.2)
+                1 / 0
+        t.join()
+        # The waiting writer locks a new file, the one the new ones lock
+        self.assertEqual(events, [True])
+        self.assertTrue(os.path.exists(self.folder + ".count.lock"))
+
+    def test_lock_wait_trace(self):
+        trace_file = os.path.join(temp_folder(), "trace.log")
+        with environment_append({"CONAN_TRACE_FILE": trace_file}):
+            with self._lock(ReadLock):
+                pass
+            self.assertFalse(os.path.exists(trace_file))  # Not traced if there was no wait
+
+            lock = self._lock(WriteLock)
+            lock.__enter__()
+            t = threading.Timer(0.2, lock.__exit__, (None, None, None))
+            t.start()
+            with self._lock(ReadLock):
+                pass
+            t.join()
+
+        trace = json.loads(load(trace_file))
+        self.assertEqual(trace["_action"], "LOCK_WAIT")
+        self.assertEqual(trace["_id"], "pkg/1.0")
+        self.assertEqual(trace["mode"], "read")
+        self.assertGreater(trace["duration"], 0.1)
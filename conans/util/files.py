@@ -1,6 +1,7 @@
 import errno
 import gzip
 import hashlib
+import multiprocessing
 import os
 import platform
 import re
@@ -9,15 +10,22 @@ import stat
 import sys
 import tarfile
 import tempfile
+import threading
 
 
 from os.path import abspath, join as joinpath, realpath
 from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 
 import six
 
 from conans.util.log import logger
 
+try:
+    import zstandard
+except ImportError:  # Optional, only needed to compress and extract zstd packages
+    zstandard = None
+
 
 def walk(top, **kwargs):
     if six.PY2:
@@ -342,18 +350,82 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, **kwargs):
     return t
 
 
-def tar_extract(fileobj, destination_dir):
+def zstd_available():
+    return zstandard is not None
+
+
+def zstdopen_without_timestamps(name, fileobj, **kwargs):
+    """ Same as gzopen_without_timestamps (write mode only), but compressing with zstd using all
+    the cores. The multi-threaded zstd output doesn't depend on the number of threads and it has
+    no timestamps, so the checksums are stable too
+    """
+    compresslevel = int(os.getenv("CONAN_COMPRESSION_LEVEL", 9))
+    compressor = zstandard.ZstdCompressor(level=compresslevel, threads=-1)
+    fileobj = compressor.stream_writer(fileobj)
+    try:
+        t = tarfile.TarFile.taropen(name, "w", fileobj, format=tarfile.GNU_FORMAT, **kwargs)
+    except Exception:
+        fileobj.close()
+        raise
+    t._extfileobj = False  # closing the tar flushes and closes the zstd frame
+    return t
+
+
+# Files up to this size are read in memory and written to disk by the pool of threads, bigger
+# ones are streamed to disk directly, to keep the memory usage bounded
+_TAR_THREADED_MAX_SIZE = 1024 * 1024
+
+
+def _tar_set_attrs(member, path):
+    # Same as tarfile does, failing to set the attributes is not an error (e.g. Win10 with time=0)
+    try:
+        os.chmod(path, member.mode)
+    except (OSError, AttributeError):
+        pass
+    try:
+        os.utime(path, (member.mtime, member.mtime))
+    except (OSError, OverflowError):
+        pass
+
+
+def _tar_write_file(path, data, member):
+    with open(path, "wb") as f:
+        if isinstance(data, bytes):
+            f.write(data)
+        else:
+            shutil.copyfileobj(data, f, 1024 * 1024)
+    _tar_set_attrs(member, path)
+
+
+def tar_extract(fileobj, destination_dir, threads=None, zstd=False):
     """Extract tar file controlling not absolute paths and fixing the routes
-    if the tar was zipped in windows"""
-    def badpath(path, base):
-        # joinpath will ignore base if path is absolute
-        return not realpath(abspath(joinpath(base, path))).startswith(base)
+    if the tar was zipped in windows. Members are checked and extracted in a single pass
+    over the tar, and the files contents are written by a pool of threads.
+    zstd compressed tars are decompressed and extracted as a stream"""
+    base = realpath(abspath(destination_dir))
+    # {folder: (realpath(folder), created by this extraction)}, to not resolve it for every file
+    resolved_dirs = {}
+    links = set()  # symlinks extracted, paths through them have to be fully resolved again
+
+    def badpath(path):
+        target = os.path.normpath(joinpath(base, path))
+        if os.path.isabs(path) or any(p in links for p in _parent_paths(target)):
+            # joinpath will ignore base if path is absolute
+            return not realpath(abspath(joinpath(base, path))).startswith(base)
+        folder, name = os.path.split(target)
+        resolved = resolved_dirs.get(folder)
+        if resolved is None:
+            resolved = resolved_dirs[folder] = realpath(folder), not os.path.exists(folder)
+        resolved, new_folder = resolved
+        resolved = joinpath(resolved, name)
+        # Only previously existing folders can contain symlinks not coming from this tar
+        if not new_folder and os.path.islink(resolved):
+            resolved = realpath(resolved)
+        return not resolved.startswith(base)
 
     def safemembers(members):
-        base = realpath(abspath(destination_dir))
-
         for finfo in members:
-            if badpath(finfo.name, base) or finfo.islnk():
+            if badpath(finfo.name) or finfo.islnk():
                 logger.warning("file:%s is skipped since it's not safe." % str(finfo.name))
                 continue
             else:
@@ -361,12 +433,71 @@ def tar_extract(fileobj, destination_dir):
                 finfo.name = finfo.name.replace("\\", "/")
                 yield finfo
 
-    the_tar = tarfile.open(fileobj=fileobj)
-    # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
-    # "could not change modification time", with time=0
-    # the_tar.errorlevel = 2  # raise exception if any error
-    the_tar.extractall(path=destination_dir, members=safemembers(the_tar))
-    the_tar.close()
+    threads = threads or min(8, multiprocessing.cpu_count())
+    thread_pool = ThreadPool(threads) if threads > 1 else None
+    slots = threading.BoundedSemaphore(threads * 4)  # Bounds the file contents held in memory
+    pending = {}  # {path: async result of its writing}
+    directories = []
+    created_dirs = set()
+
+    def _write(path, data, member):
+        try:
+            _tar_write_file(path, data, member)
+        finally:
+            slots.release()
+
+    try:
+        if zstd:
+            reader = zstandard.ZstdDecompressor().stream_reader(fileobj)
+            the_tar = tarfile.open(fileobj=reader, mode="r|")
+        else:
+            the_tar = tarfile.open(fileobj=fileobj)
+        for member in safemembers(the_tar):
+            path = os.path.normpath(joinpath(base, member.name))
+            previous = pending.pop(path, None)
+            if previous is not None:  # Repeated member, the last one wins, as in tarfile
+                previous.get()
+            if member.isdir():
+                mkdir(path)
+                created_dirs.add(path)
+                directories.append((member, path))
+                continue
+            folder = os.path.dirname(path)
+            if folder not in created_dirs:
+                mkdir(folder)
+                created_dirs.add(folder)
+            if member.isreg():
+                if thread_pool is not None and member.size <= _TAR_THREADED_MAX_SIZE:
+                    data = the_tar.extractfile(member).read()
+                    slots.acquire()
+                    pending[path] = thread_pool.apply_async(_write, (path, data, member))
+                else:
+                    _tar_write_file(path, the_tar.extractfile(member), member)
+            else:
+                # symlinks and other special files
+                the_tar.extract(member, base)
+                if member.issym():
+                    links.add(path)
+        the_tar.close()
+        for result in pending.values():
+            result.get()
+    finally:
+        if thread_pool is not None:
+            thread_pool.close()
+            thread_pool.join()
+
+    # Like tarfile, directories attributes are set at the end, deepest first
+    for member, path in sorted(directories, key=lambda d: d[1], reverse=True):
+        _tar_set_attrs(member, path)
+
+
+def _parent_paths(path):
+    while True:
+        yield path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return
+        path = parent
 
 
 def list_folder_subdirs(basedir, level):
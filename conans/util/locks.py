@@ -1,10 +1,20 @@
+import errno
 import os
+import sys
+import threading
 import time
+from contextlib import contextmanager
 
 import fasteners
 
-from conans.util.files import load, save
+from conans.util.files import load, mkdir, save
 from conans.util.log import logger
+from conans.util.tracer import log_lock_wait
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 
 class NoLock(object):
@@ -17,15 +27,100 @@ class NoLock(object):
 
 
 class SimpleLock(object):
+    # fasteners locks are per process, threads of the same process need their own lock
+    _thread_locks = {}  # Needs to be shared among all instances
 
     def __init__(self, filename):
         self._lock = fasteners.InterProcessLock(filename, logger=logger)
+        self._thread_lock = SimpleLock._thread_locks.setdefault(filename, threading.Lock())
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        try:
+            self._lock.acquire()
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        try:
+            self._lock.release()
+        finally:
+            self._thread_lock.release()
+
+
+class UserCodeLock(object):
+    """ The recipes and hooks change the current directory, the environment variables and
+    sys.path, that are global to the process, so only one thread at a time can run user code.
+
+    The lock is reentrant, and released() lets other threads run user code while the owner
+    runs an external command (i.e. the compiler). The command has been started with the
+    process state of the owner, so the commands of several threads run concurrently. The
+    process state the owner had when it acquired the lock is restored before releasing it, so
+    other threads don't run with its changes, and the state of the owner is restored before it
+    continues running user code
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._owner = None
+        self._count = 0
+        self._initial_state = None  # The process state when the owner acquired the lock
+
+    @staticmethod
+    def _process_state():
+        return os.getcwd(), dict(os.environ), list(sys.path)
+
+    @staticmethod
+    def _restore_process_state(state):
+        cwd, environ, path = state
+        os.chdir(cwd)
+        if os.environ != environ:
+            os.environ.clear()
+            os.environ.update(environ)
+        sys.path[:] = path
+
+    def _acquire(self, count):
+        me = threading.current_thread()
+        with self._condition:
+            while self._owner is not None and self._owner is not me:
+                self._condition.wait()
+            if self._owner is None:
+                self._initial_state = self._process_state()
+            self._owner = me
+            self._count += count
+
+    def _release(self, count):
+        with self._condition:
+            self._count -= count
+            if not self._count:
+                self._owner = None
+                self._condition.notify()
 
     def __enter__(self):
-        self._lock.acquire()
+        self._acquire(1)
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
-        self._lock.release()
+        self._release(1)
+
+    @contextmanager
+    def released(self):
+        with self._condition:
+            count = self._count if self._owner is threading.current_thread() else 0
+        if not count:
+            yield
+            return
+        state = self._process_state()
+        self._restore_process_state(self._initial_state)
+        self._release(count)
+        try:
+            yield
+        finally:
+            self._acquire(count)
+            self._restore_process_state(state)
+
+
+user_code_lock = UserCodeLock()
 
 
 READ_BUSY_DELAY = 0.5
@@ -33,12 +128,24 @@ WRITE_BUSY_DELAY = 0.25
 
 
 class Lock(object):
+    """ Base of the ReadLock (shared) and WriteLock (exclusive) of the folders of the cache.
+
+    Where available (not Windows) they are flock() locks of the lock file, that block without
+    polling and are released by the OS when the owning process dies, so they never become
+    stale. Otherwise, the number of readers (or -1 for a writer) is stored in the count file,
+    and the waiters poll it.
+
+    The lock file of the flock() locks is only removed by the writer holding it, when it fails,
+    and the processes that were waiting on it lock the new file instead, see _flock(). The
+    count file is not written then, so a cache shared by processes of previous Conan versions,
+    that only check the count file, is not protected against concurrent modifications.
+    """
 
     @staticmethod
     def clean(folder):
         if os.path.exists(folder + ".count"):
             os.remove(folder + ".count")
-        if os.path.exists(folder + ".count.lock"):
+        if fcntl is None and os.path.exists(folder + ".count.lock"):
             os.remove(folder + ".count.lock")
 
     def __init__(self, folder, locked_item, output):
@@ -47,6 +154,7 @@ class Lock(object):
         self._locked_item = locked_item
         self._output = output
         self._first_lock = True
+        self._fd = None
 
     @property
     def files(self):
@@ -57,7 +165,8 @@ class Lock(object):
             self._first_lock = False
             self._output.info("%s is locked by another concurrent conan process, wait..."
                               % str(self._locked_item))
-            self._output.info("If not the case, quit, and do 'conan remove --locks'")
+            if fcntl is None:
+                self._output.info("If not the case, quit, and do 'conan remove --locks'")
 
     def _readers(self):
         try:
@@ -68,21 +177,87 @@ class Lock(object):
             self._output.warn("%s does not contain a number!" % self._count_file)
             return 0
 
+    def _flock(self, operation, mode):
+        while True:
+            mkdir(os.path.dirname(self._count_lock_file))
+            try:
+                fd = os.open(self._count_lock_file, os.O_RDWR | os.O_CREAT)
+            except OSError as e:
+                if e.errno != errno.ENOENT:  # The folder removed by a failed writer
+                    raise
+                continue
+            try:
+                try:
+                    fcntl.flock(fd, operation | fcntl.LOCK_NB)
+                except (IOError, OSError) as e:
+                    if e.errno not in (errno.EAGAIN, errno.EACCES):
+                        raise
+                    self._info_locked()
+                    t1 = time.time()
+                    fcntl.flock(fd, operation)
+                    log_lock_wait(self._locked_item, mode, time.time() - t1)
+                # A failed writer could have removed the file meanwhile, see WriteLock.__exit__
+                try:
+                    locked = os.path.samestat(os.fstat(fd), os.stat(self._count_lock_file))
+                except OSError:
+                    locked = False
+            except BaseException:
+                os.close(fd)
+                raise
+            if locked:
+                self._fd = fd
+                return
+            os.close(fd)
+
+    def _remove_files(self):
+        # If there was an exception while locking this, might be empty
+        # Try to clean up the trailing filelocks
+        try:
+            if os.path.exists(self._count_file):
+                os.remove(self._count_file)
+            os.remove(self._count_lock_file)
+            path = os.path.dirname(self._count_file)
+            for _ in range(3):
+                try:  # Take advantage that os.rmdir does not delete non-empty dirs
+                    os.rmdir(path)
+                except Exception:
+                    break  # not empty
+                path = os.path.dirname(path)
+        except Exception:
+            pass
+
+    def _funlock(self):
+        fd, self._fd = self._fd, None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
 
 class ReadLock(Lock):
 
     def __enter__(self):
+        if fcntl is not None:
+            self._flock(fcntl.LOCK_SH, "read")
+            return
+        t1 = None
         while True:
-            with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
+            with SimpleLock(self._count_lock_file):
                 readers = self._readers()
                 if readers >= 0:
                     save(self._count_file, str(readers + 1))
                     break
             self._info_locked()
+            t1 = t1 or time.time()
             time.sleep(READ_BUSY_DELAY)
+        if t1 is not None:
+            log_lock_wait(self._locked_item, "read", time.time() - t1)
 
     def __exit__(self, exc_type, exc_val, exc_tb):   # @UnusedVariable
-        with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
+        if fcntl is not None:
+            self._funlock()
+            return
+        with SimpleLock(self._count_lock_file):
             readers = self._readers()
             save(self._count_file, str(readers - 1))
 
@@ -90,31 +265,33 @@ class ReadLock(Lock):
 class WriteLock(Lock):
 
     def __enter__(self):
+        if fcntl is not None:
+            self._flock(fcntl.LOCK_EX, "write")
+            return
+        t1 = None
         while True:
-            with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
+            with SimpleLock(self._count_lock_file):
                 readers = self._readers()
                 if readers == 0:
                     save(self._count_file, "-1")
                     break
             self._info_locked()
+            t1 = t1 or time.time()
             time.sleep(WRITE_BUSY_DELAY)
+        if t1 is not None:
+            log_lock_wait(self._locked_item, "write", time.time() - t1)
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
-        with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
+        if fcntl is not None:
+            try:
+                if exc_type is not None:
+                    self._remove_files()  # Still locked, the waiters will lock a new file
+            finally:
+                self._funlock()
+            return
+
+        with SimpleLock(self._count_lock_file):
             save(self._count_file, "0")
 
         if exc_type is not None:
-            # If there was an exception while locking this, might be empty
-            # Try to clean up the trailing filelocks
-            try:
-                os.remove(self._count_file)
-                os.remove(self._count_lock_file)
-                path = os.path.dirname(self._count_file)
-                for _ in range(3):
-                    try:  # Take advantage that os.rmdir does not delete non-empty dirs
-                        os.rmdir(path)
-                    except Exception:
-                        break  # not empty
-                    path = os.path.dirname(path)
-            except Exception:
-                pass
+            self._remove_files()
@@ -21,7 +21,8 @@ TRACER_ACTIONS = ["UPLOADED_RECIPE", "UPLOADED_PACKAGE",
                   "REST_API_CALL", "COMMAND",
                   "EXCEPTION",
                   "DOWNLOAD",
-                  "UNZIP", "ZIP"]
+                  "UNZIP", "ZIP",
+                  "LOCK_WAIT"]
 
 MASKED_FIELD = "**********"
 
@@ -173,3 +174,7 @@ def log_compressed_files(files, duration, tgz_path):
     files = files or {}
     files_compressed = [_file_document(name, path) for name, path in files.items()]
     _append_action("ZIP", {"src": files_compressed, "dst": tgz_path, "duration": duration})
+
+
+def log_lock_wait(locked_item, mode, duration):
+    _append_action("LOCK_WAIT", {"_id": str(locked_item), "mode": mode, "duration": duration})